@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest - ヘッドレス作成エンジンパッケージ
+
+GUI（advanced_folder_creator.py）から切り離したフォルダ・ファイル作成
+ロジックを提供します。tkinter に依存しないため、CI ジョブやプロビジョニング
+スクリプトからディスプレイなしで利用できます。
+
+使用例:
+    python -m autonest 対象フォルダ --config config.json
+"""
+
+__version__ = "2.0.0"
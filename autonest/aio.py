@@ -0,0 +1,340 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest asyncio モジュール
+
+asyncio ベースのサービスから作成エンジンを利用するための非同期 API を
+提供する。フォルダ作成・ファイルコピーは数件ずつ共有のワーカープールへ
+投入し、同時に実行する処理の数をインスタンス全体で制限する。そのため、
+1つのイベントループから多数の対象フォルダを同時に作成しても、スレッド数は
+対象フォルダ数ではなく concurrency で決まる。
+
+標準ライブラリにはファイル操作の非同期 API がないため、個々のシステム
+コールはワーカースレッドで実行する。
+
+使用例:
+    creator = AsyncFolderCreator.from_config(config, concurrency=16)
+    plan = await creator.plan(target, select_folders(config), select_files(config))
+    stream = creator.stream(plan)
+    async for event in stream:
+        print(event.done, event.total, event.path)
+    result = await stream
+    await creator.close()
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .engine import FolderCreator
+
+# 1回の投入でまとめて処理する項目数の上限（イベントループとの往復を減らす）
+_MAX_CHUNK = 32
+
+
+class ApplyStream:
+    """
+    作成処理の進捗を非同期イテレータとして受け取るためのオブジェクト
+
+    async for で ProgressEvent を順に受け取り、作成処理の終了時に
+    反復が終わる。await すると CreationResult を返す。
+
+    Attributes:
+        task (asyncio.Task): 作成処理のタスク
+    """
+
+    def __init__(self, creator, plan, cancel_event=None):
+        self._queue = asyncio.Queue()
+        self.task = asyncio.ensure_future(
+            creator.apply(plan, self._queue.put_nowait, cancel_event)
+        )
+        # 終了の目印（None）を積み、待機中の反復を終わらせる
+        self.task.add_done_callback(lambda _: self._queue.put_nowait(None))
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    def __await__(self):
+        return self.task.__await__()
+
+    def cancel(self):
+        """作成処理を中断する（作成した項目は transactional に従って取り消す）"""
+        self.task.cancel()
+
+
+class AsyncFolderCreator:
+    """
+    作成エンジンの非同期ラッパー
+
+    計画・取り消しなどの処理は FolderCreator と共通で、結果も同じ
+    CreationResult（作成数・既存スキップ・エラー）を返す。
+
+    Attributes:
+        engine (FolderCreator): 作成エンジン
+        concurrency (int): 同時に実行するフォルダ作成・ファイルコピーの最大数
+    """
+
+    def __init__(self, engine, concurrency=None):
+        """
+        非同期ラッパーの初期化
+
+        Args:
+            engine (FolderCreator): 作成エンジン
+            concurrency (int): 同時実行数（None の場合は engine.max_workers）
+        """
+        self.engine = engine
+        self.concurrency = max(1, int(concurrency or engine.max_workers))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="autonest-aio"
+        )
+        self._semaphore = None
+
+    @classmethod
+    def from_config(cls, config, log=None, concurrency=None):
+        """
+        設定から作成エンジンと非同期ラッパーを生成
+
+        Args:
+            config (dict): 設定情報辞書
+            log (callable): ログメッセージを受け取るコールバック
+                （ワーカースレッドから呼び出される場合がある）
+            concurrency (int): 同時実行数（None の場合は performance.max_workers）
+
+        Returns:
+            AsyncFolderCreator: 非同期ラッパー
+        """
+        return cls(FolderCreator.from_config(config, log=log), concurrency)
+
+    async def close(self):
+        """ワーカープールを終了し、作成エンジンを閉じる"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._executor.shutdown)
+        await loop.run_in_executor(None, self.engine.close)
+
+    def _limit(self):
+        """同時実行数を制限するセマフォを取得（イベントループ上で初回に生成）"""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._semaphore
+
+    async def _call(self, func, *args):
+        """ブロッキングする処理をワーカープールで実行して結果を待つ"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def plan(self, folder_path, selected_folders, selected_files):
+        """
+        作成計画を構築（ファイルシステムへの書き込みは行わない）
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+
+        Returns:
+            ScaffoldPlan: 作成計画
+        """
+        return await self._call(
+            self.engine.plan, folder_path, selected_folders, selected_files
+        )
+
+    async def execute(
+        self,
+        folder_path,
+        selected_folders,
+        selected_files,
+        progress=None,
+        cancel_event=None,
+    ):
+        """
+        計画の構築から作成までを実行し、計画と結果をログに出力
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+            progress (callable): ProgressEvent を受け取るコールバック
+            cancel_event (threading.Event): セットされると処理を中断する
+
+        Returns:
+            CreationResult: 作成処理結果
+        """
+        plan = await self.plan(folder_path, selected_folders, selected_files)
+        self.engine.log_plan(plan)
+        result = await self.apply(plan, progress, cancel_event)
+        self.engine.log_summary(result)
+        return result
+
+    def stream(self, plan, cancel_event=None):
+        """
+        作成処理を開始し、進捗を非同期イテレータで受け取る
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            cancel_event (threading.Event): セットされると処理を中断する
+
+        Returns:
+            ApplyStream: 進捗イベントの非同期イテレータ（await で結果を返す）
+        """
+        return ApplyStream(self, plan, cancel_event)
+
+    async def apply(self, plan, progress=None, cancel_event=None):
+        """
+        作成計画を実行
+
+        処理内容・取り消しの条件は FolderCreator.apply と同じ。このコルーチンを
+        キャンセルした場合は中断として扱い、実行中の項目の完了を待って
+        作成した項目を取り消してから CancelledError を送出する。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            progress (callable): ProgressEvent を受け取るコールバック
+                （イベントループのスレッドで呼び出される）
+            cancel_event (threading.Event): セットされると処理を中断する
+                （キャンセル時にはこのイベントをセットする）
+
+        Returns:
+            CreationResult: 作成処理結果
+        """
+        engine = self.engine
+        loop = asyncio.get_running_loop()
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        notify = None
+        if progress is not None:
+            notify = lambda event: loop.call_soon_threadsafe(progress, event)
+        # ジャーナルを開いた後にキャンセルされても取り消せるよう完了を待つ
+        begin = loop.run_in_executor(
+            self._executor, engine.start_apply, plan, notify, cancel_event
+        )
+        cancelled = False
+        try:
+            await asyncio.shield(begin)
+        except asyncio.CancelledError:
+            cancelled = True
+            cancel_event.set()
+            await _wait_uncancelled(begin)
+        run = begin.result()
+
+        if run.ready:
+            try:
+                if not cancelled:
+                    await self._apply_items(run, cancel_event)
+            except asyncio.CancelledError:
+                cancelled = True
+                cancel_event.set()
+            except Exception as e:
+                run.fail(e)
+        # 取り消し・記録の保存は呼び出し元のキャンセルで途中終了させない
+        finish = loop.run_in_executor(self._executor, run.finish)
+        if cancelled:
+            await _wait_uncancelled(finish)
+            raise asyncio.CancelledError()
+        return await asyncio.shield(finish)
+
+    async def _apply_items(self, run, cancel_event):
+        """
+        計画されたディレクトリ・ファイルを作成（FolderCreator.apply と同じ手順）
+
+        Args:
+            run (ApplyRun): 作成処理
+            cancel_event (threading.Event): キャンセル時にセットする中断イベント
+        """
+        with run.phase("mkdir"):
+            for level in run.dir_levels():
+                if run.stopped:
+                    break
+                outcomes = await self._run_tasks(
+                    run.create_dir, level, run, cancel_event
+                )
+                run.add_dir_outcomes(outcomes)
+            run.flush_journal()
+
+        if not run.stopped:
+            files = run.file_order()
+            with run.phase("copy"):
+                outcomes = await self._run_tasks(
+                    run.create_file, files, run, cancel_event
+                )
+            run.add_file_outcomes(files, outcomes)
+
+    async def _run_tasks(self, func, items, run, cancel_event):
+        """
+        項目ごとの処理をワーカープールで同時実行数を制限して実行
+
+        項目はワーカーごとに数件ずつまとめて投入し、同時実行数に達する
+        たびに待つため、項目数が多くても待機中のタスクは増えない。例外は
+        実行中の全項目の終了を待ってから送出する（ロールバック中に他の
+        ワーカーが項目を作成しないようにするため）。
+
+        Args:
+            func (callable): func(item) 形式の処理関数
+            items (list): 処理対象項目リスト
+            run (ApplyRun): 作成処理（中断状態の確認に使う）
+            cancel_event (threading.Event): キャンセル時にセットする中断イベント
+
+        Returns:
+            list: 各項目の処理結果（投入順）
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._limit()
+        size = min(_MAX_CHUNK, max(1, len(items) // (self.concurrency * 4)))
+        outcomes = [None] * len(items)
+        futures = []
+        try:
+            for start in range(0, len(items), size):
+                await semaphore.acquire()
+                if run.stopped:
+                    semaphore.release()
+                    break
+                future = loop.run_in_executor(
+                    self._executor, _run_chunk, func, items[start : start + size]
+                )
+                future.add_done_callback(lambda _: semaphore.release())
+                futures.append((start, future))
+            if futures:
+                await asyncio.wait([future for _, future in futures])
+        except asyncio.CancelledError:
+            cancel_event.set()
+            await _wait_uncancelled(
+                asyncio.gather(
+                    *(future for _, future in futures), return_exceptions=True
+                )
+            )
+            raise
+
+        error = None
+        for start, future in futures:
+            if future.exception() is not None:
+                error = error or future.exception()
+            else:
+                chunk_outcomes = future.result()
+                outcomes[start : start + len(chunk_outcomes)] = chunk_outcomes
+        if error is not None:
+            raise error
+        return outcomes
+
+
+def _run_chunk(func, items):
+    """ワーカースレッドで複数の項目を順に処理し、結果のリストを返す"""
+    return [func(item) for item in items]
+
+
+async def _wait_uncancelled(awaitable):
+    """
+    キャンセルを再度要求されても awaitable の完了まで待つ
+
+    Args:
+        awaitable: 完了を待つ Future・コルーチン
+    """
+    future = asyncio.ensure_future(awaitable)
+    while not future.done():
+        try:
+            await asyncio.shield(future)
+        except asyncio.CancelledError:
+            continue
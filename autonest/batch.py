@@ -0,0 +1,543 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 一括作成（バッチ）モジュール
+
+複数の対象フォルダに同じフォルダ・ファイル構成を一度に作成する。
+設定の読み込み・テンプレートキャッシュ・ワーカープールは1つの
+作成エンジンを共有するため、対象フォルダあたりのコストは実際の
+ファイル I/O だけになる。対象フォルダが非常に多い場合は、対象フォルダを
+シャードに分けて複数のワーカープロセスで処理することもできる。
+"""
+
+import glob
+import json
+import os
+
+from .engine import CreationResult, FolderCreator, ProgressEvent
+from .report import RunReport
+
+_GLOB_CHARS = ("*", "?", "[")
+
+
+def _null_log(message):
+    """ログ出力を行わないデフォルトのログコールバック"""
+
+
+def read_target_manifest(manifest_path):
+    """
+    対象フォルダ一覧ファイルを読み込む
+
+    JSON 配列、または1行1パスのテキスト（空行と # で始まる行は無視）に対応する。
+    相対パスは一覧ファイルのあるフォルダを基準に解決する。
+
+    Args:
+        manifest_path (str): 一覧ファイルパス
+
+    Returns:
+        list: 対象フォルダパス・パターンのリスト
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    if content.lstrip().startswith("["):
+        entries = [str(entry) for entry in json.loads(content)]
+    else:
+        entries = []
+        for line in content.splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entries.append(line)
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    return [
+        entry if os.path.isabs(entry) else os.path.join(base_dir, entry)
+        for entry in entries
+    ]
+
+
+def expand_targets(targets=None, manifest_path=None):
+    """
+    対象フォルダ指定を展開して重複のないリストにする
+
+    ワイルドカード（* ? [ ]）を含む指定は glob で展開し、
+    ディレクトリのみを対象とする。
+
+    Args:
+        targets (list): 対象フォルダパスまたは glob パターンのリスト
+        manifest_path (str): 対象フォルダ一覧ファイルパス（省略可）
+
+    Returns:
+        list: 対象フォルダパスのリスト（指定順、重複なし）
+    """
+    patterns = list(targets or [])
+    if manifest_path:
+        patterns.extend(read_target_manifest(manifest_path))
+
+    expanded = []
+    seen = set()
+    for pattern in patterns:
+        if any(char in pattern for char in _GLOB_CHARS):
+            matches = sorted(
+                path
+                for path in glob.glob(pattern, recursive=True)
+                if os.path.isdir(path)
+            )
+        else:
+            matches = [pattern]
+        for path in matches:
+            key = os.path.normcase(os.path.abspath(path))
+            if key not in seen:
+                seen.add(key)
+                expanded.append(path)
+    return expanded
+
+
+def planned_result(plan):
+    """
+    作成計画から「作成予定」の結果を生成（ドライラン用）
+
+    Args:
+        plan (ScaffoldPlan): 作成計画
+
+    Returns:
+        CreationResult: 作成予定数を作成数として持つ結果
+    """
+    result = CreationResult()
+    result.folder_created_count = len(plan.explicit_dirs)
+    result.file_created_count = len(plan.files_to_create)
+    result.file_updated_count = len(plan.files_to_update)
+    result.existing_folders = list(plan.existing_folders)
+    result.existing_files = list(plan.existing_files)
+    result.file_errors = list(plan.errors)
+    return result
+
+
+class BatchResult:
+    """
+    一括作成の集計結果
+
+    Attributes:
+        results (list): (対象フォルダ, CreationResult) のリスト
+        target_errors (list): (対象フォルダ, エラーメッセージ) のリスト
+        cancelled (bool): 処理が途中で中断されたかどうか
+    """
+
+    def __init__(self):
+        self.results = []
+        self.target_errors = []
+        self.cancelled = False
+
+    def add(self, target, result):
+        """
+        対象フォルダの結果を追加
+
+        Args:
+            target (str): 対象フォルダパス
+            result (CreationResult): 作成処理結果
+        """
+        self.results.append((target, result))
+        if result.cancelled:
+            self.cancelled = True
+
+    def merge(self, other):
+        """
+        別の集計結果を取り込む
+
+        Args:
+            other (BatchResult): 取り込む集計結果
+        """
+        self.results.extend(other.results)
+        self.target_errors.extend(other.target_errors)
+        self.cancelled = self.cancelled or other.cancelled
+
+    def to_creation_result(self):
+        """
+        全対象フォルダの結果を1つの CreationResult にまとめる
+
+        既存項目・エラーには対象フォルダパスを付加する。
+
+        Returns:
+            CreationResult: 集計した作成処理結果
+        """
+        combined = CreationResult()
+        for target, result in self.results:
+            combined.folder_created_count += result.folder_created_count
+            combined.file_created_count += result.file_created_count
+            combined.file_updated_count += result.file_updated_count
+            combined.bytes_copied += result.bytes_copied
+            combined.rolled_back_count += result.rolled_back_count
+            combined.rolled_back = combined.rolled_back or result.rolled_back
+            combined.existing_folders.extend(
+                f"{target}: {folder}" for folder in result.existing_folders
+            )
+            combined.existing_files.extend(
+                f"{target}: {name}" for name in result.existing_files
+            )
+            combined.file_errors.extend(
+                f"{target}: {error}" for error in result.file_errors
+            )
+        combined.file_errors.extend(
+            f"{target}: {message}" for target, message in self.target_errors
+        )
+        combined.cancelled = self.cancelled
+        return combined
+
+    def _total(self, attribute):
+        """全対象フォルダの数値属性を合計"""
+        return sum(getattr(result, attribute) for _, result in self.results)
+
+    @property
+    def folder_created_count(self):
+        """作成されたフォルダ数の合計"""
+        return self._total("folder_created_count")
+
+    @property
+    def file_created_count(self):
+        """作成されたファイル数の合計"""
+        return self._total("file_created_count")
+
+    @property
+    def file_updated_count(self):
+        """テンプレートの変更により置き換えたファイル数の合計"""
+        return self._total("file_updated_count")
+
+    @property
+    def bytes_copied(self):
+        """コピーしたバイト数の合計"""
+        return self._total("bytes_copied")
+
+    @property
+    def existing_count(self):
+        """既存スキップ項目数の合計"""
+        return sum(
+            len(result.existing_folders) + len(result.existing_files)
+            for _, result in self.results
+        )
+
+    @property
+    def error_count(self):
+        """ファイルエラー数と対象フォルダエラー数の合計"""
+        return len(self.target_errors) + sum(
+            len(result.file_errors) for _, result in self.results
+        )
+
+    def summary_lines(self, max_errors=10):
+        """
+        集計結果の表示行を生成
+
+        Args:
+            max_errors (int): 個別に表示するエラーの最大数
+
+        Returns:
+            list: 表示行リスト
+        """
+        lines = [
+            f"🎉 【一括作成完了】対象フォルダ: {len(self.results)}個"
+            f"（失敗 {len(self.target_errors)}個）",
+            f"✅ フォルダ新規作成: {self.folder_created_count}個, "
+            f"ファイル新規作成: {self.file_created_count}個",
+        ]
+        if self.file_updated_count:
+            lines.append(f"🔄 テンプレート更新の反映: ファイル{self.file_updated_count}個")
+        if self.existing_count:
+            lines.append(f"⚠️ 既存スキップ: {self.existing_count}個")
+        if self.cancelled:
+            lines.append("⏹️ 処理は途中で中断されました")
+        rolled_back = [target for target, result in self.results if result.rolled_back]
+        if rolled_back:
+            lines.append(
+                f"↩️ 作成した項目を取り消した対象フォルダ: {len(rolled_back)}個"
+            )
+
+        errors = self.to_creation_result().file_errors
+        if errors:
+            lines.append(f"❌ エラー: {len(errors)}個")
+            for error in errors[:max_errors]:
+                lines.append(f"   ❌ {error}")
+            if len(errors) > max_errors:
+                lines.append(f"   ...ほか {len(errors) - max_errors}個")
+        return lines
+
+    def to_dict(self):
+        """
+        集計結果を辞書形式に変換
+
+        Returns:
+            dict: 集計結果辞書
+        """
+        return {
+            "targets": [
+                dict(result.to_dict(), target=target)
+                for target, result in self.results
+            ],
+            "target_errors": [
+                {"target": target, "error": message}
+                for target, message in self.target_errors
+            ],
+            "folder_created_count": self.folder_created_count,
+            "file_created_count": self.file_created_count,
+            "file_updated_count": self.file_updated_count,
+            "existing_count": self.existing_count,
+            "error_count": self.error_count,
+            "bytes_copied": self.bytes_copied,
+            "cancelled": self.cancelled,
+        }
+
+
+def _target_summary(number, total, target, result, dry_run=False):
+    """
+    対象フォルダ1つ分の要約行を生成
+
+    Args:
+        number (int): 対象フォルダの番号（1始まり）
+        total (int): 対象フォルダ数
+        target (str): 対象フォルダパス
+        result (CreationResult or str): 作成処理結果、または対象フォルダのエラー
+        dry_run (bool): ドライランかどうか
+
+    Returns:
+        str: 要約行
+    """
+    if isinstance(result, str):
+        return f"[{number}/{total}] ❌ {target}: {result}"
+    return (
+        f"[{number}/{total}] {target}: "
+        f"フォルダ{result.folder_created_count}個, "
+        f"ファイル{result.file_created_count}個"
+        f"{'作成予定' if dry_run else '作成'}, "
+        f"更新{result.file_updated_count}個, "
+        f"既存{len(result.existing_folders) + len(result.existing_files)}個, "
+        f"エラー{len(result.file_errors)}個"
+        f"{'（取り消し済み）' if result.rolled_back else ''}"
+    )
+
+
+def run_batch(
+    engine,
+    targets,
+    selected_folders,
+    selected_files,
+    log=None,
+    progress=None,
+    cancel_event=None,
+    dry_run=False,
+):
+    """
+    複数の対象フォルダに対して作成処理を実行
+
+    Args:
+        engine (FolderCreator): 共有する作成エンジン
+        targets (list): 対象フォルダパスのリスト
+        selected_folders (list): 作成対象フォルダリスト
+        selected_files (list): 作成対象ファイルリスト
+        log (callable): 対象フォルダごとの要約行を受け取るコールバック
+        progress (callable): 対象フォルダ単位の ProgressEvent を受け取るコールバック
+        cancel_event (threading.Event): セットされると処理を中断する
+        dry_run (bool): True の場合は計画のみ行い何も作成しない
+
+    Returns:
+        BatchResult: 集計結果
+    """
+    log = log or _null_log
+    batch = BatchResult()
+    total = len(targets)
+    bytes_copied = 0
+
+    for number, target in enumerate(targets, 1):
+        if cancel_event is not None and cancel_event.is_set():
+            batch.cancelled = True
+            break
+
+        if not os.path.isdir(target):
+            batch.target_errors.append((target, "対象フォルダが存在しません"))
+            log(_target_summary(number, total, target, "対象フォルダが存在しません"))
+        else:
+            try:
+                plan = engine.plan(target, selected_folders, selected_files)
+                if dry_run:
+                    result = planned_result(plan)
+                else:
+                    result = engine.apply(plan, cancel_event=cancel_event)
+            except Exception as e:
+                batch.target_errors.append((target, str(e)))
+                log(_target_summary(number, total, target, str(e)))
+            else:
+                batch.add(target, result)
+                bytes_copied += result.bytes_copied
+                log(_target_summary(number, total, target, result, dry_run))
+
+        if progress is not None:
+            progress(ProgressEvent(number, total, target, bytes_copied))
+        if batch.cancelled:
+            break
+
+    return batch
+
+
+def shard_targets(targets, shard_count):
+    """
+    対象フォルダを連続した塊（シャード）に分割
+
+    Args:
+        targets (list): 対象フォルダパスのリスト
+        shard_count (int): 分割数の目安
+
+    Returns:
+        list: 対象フォルダパスのリストのリスト（空のシャードは含まない）
+    """
+    shard_size = max(1, -(-len(targets) // max(1, shard_count)))
+    return [
+        targets[start:start + shard_size]
+        for start in range(0, len(targets), shard_size)
+    ]
+
+
+def _run_shard(
+    config,
+    targets,
+    selected_folders,
+    selected_files,
+    variables,
+    max_workers,
+    dry_run,
+    collect_report,
+):
+    """
+    ワーカープロセスでシャード内の対象フォルダを処理
+
+    プロセスごとに作成エンジン（テンプレートキャッシュ・ワーカープール）を
+    生成する。結果は pickle 可能な (BatchResult, 実行レポートの辞書または None)
+    として親プロセスへ返す。
+    """
+    engine = FolderCreator.from_config(config)
+    engine.variables.update(variables)
+    if max_workers is not None:
+        engine.max_workers = max(1, max_workers)
+    if collect_report:
+        engine.report = RunReport()
+    try:
+        batch = run_batch(
+            engine, targets, selected_folders, selected_files, dry_run=dry_run
+        )
+    finally:
+        engine.close()
+    return batch, engine.report.to_dict() if collect_report else None
+
+
+def run_batch_processes(
+    config,
+    targets,
+    selected_folders,
+    selected_files,
+    processes,
+    variables=None,
+    max_workers=None,
+    log=None,
+    progress=None,
+    cancel_event=None,
+    dry_run=False,
+    report=None,
+    mp_context=None,
+):
+    """
+    対象フォルダをシャードに分け、複数のワーカープロセスで作成処理を実行
+
+    GIL とプロセス単位のシステムコール待ちを避けるため、各プロセスが
+    独立した作成エンジンで対象フォルダを処理する。シャードは
+    プロセス数より細かく分けるため、処理の重い対象フォルダがあっても
+    負荷は均等になる。結果は対象フォルダの指定順に集計される。
+
+    中断要求時は未着手のシャードを取り消す。処理中のシャードは
+    最後まで実行される。
+
+    Args:
+        config (dict): 設定情報辞書（各プロセスで作成エンジンを生成する）
+        targets (list): 対象フォルダパスのリスト
+        selected_folders (list): 作成対象フォルダリスト
+        selected_files (list): 作成対象ファイルリスト
+        processes (int): ワーカープロセス数
+        variables (dict): 設定の variables に上書きするテンプレート変数
+        max_workers (int): プロセスごとのファイル作成並列数（省略時は設定値）
+        log (callable): 対象フォルダごとの要約行を受け取るコールバック
+        progress (callable): シャード完了ごとの ProgressEvent を受け取るコールバック
+        cancel_event (threading.Event): セットされると未着手のシャードを取り消す
+        dry_run (bool): True の場合は計画のみ行い何も作成しない
+        report (RunReport): 各プロセスの計測結果を合算する実行レポート（省略可）
+        mp_context: ワーカープロセスの開始方式のコンテキスト
+            （省略時は multiprocessing の既定値）
+
+    Returns:
+        BatchResult: 集計結果
+    """
+    # multiprocessing の読み込みは重いため、プロセスプールを使う場合のみ行う
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    log = log or _null_log
+    total = len(targets)
+    shards = shard_targets(targets, processes * 4)
+    shard_results = [None] * len(shards)
+    offsets = []
+    offset = 0
+    for shard in shards:
+        offsets.append(offset)
+        offset += len(shard)
+
+    batch = BatchResult()
+    done = 0
+    bytes_copied = 0
+    with ProcessPoolExecutor(
+        max_workers=max(1, min(processes, len(shards))), mp_context=mp_context
+    ) as pool:
+        futures = {
+            pool.submit(
+                _run_shard,
+                config,
+                shard,
+                selected_folders,
+                selected_files,
+                dict(variables or {}),
+                max_workers,
+                dry_run,
+                report is not None,
+            ): position
+            for position, shard in enumerate(shards)
+        }
+        pending = set(futures)
+        while pending:
+            cancel_requested = cancel_event is not None and cancel_event.is_set()
+            if cancel_requested and not batch.cancelled:
+                batch.cancelled = True
+                for future in pending:
+                    future.cancel()
+            finished, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+            for future in finished:
+                position = futures[future]
+                shard = shards[position]
+                if future.cancelled():
+                    continue
+                try:
+                    result, shard_report = future.result()
+                    if report is not None:
+                        report.merge(shard_report)
+                except Exception as e:
+                    # ワーカープロセスの異常終了など
+                    result = BatchResult()
+                    result.target_errors.extend((target, str(e)) for target in shard)
+                shard_results[position] = result
+
+                outcomes = dict(result.results)
+                outcomes.update(result.target_errors)
+                for number, target in enumerate(shard, offsets[position] + 1):
+                    if target in outcomes:
+                        outcome = outcomes[target]
+                        log(_target_summary(number, total, target, outcome, dry_run))
+
+                done += len(shard)
+                bytes_copied += result.bytes_copied
+                if progress is not None:
+                    progress(ProgressEvent(done, total, shard[-1], bytes_copied))
+
+    for result in shard_results:
+        if result is not None:
+            batch.merge(result)
+    return batch
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest テンプレートキャッシュモジュール
+
+テンプレートファイルの内容をプロセス内に保持し、同じテンプレートから
+多数のファイルを作成する際にソースディスクを再読み込みしないようにする。
+キャッシュはバイト数で上限が設定された LRU 方式で、テンプレートの
+更新時刻（mtime）またはサイズが変わった場合は自動的に無効化される。
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class TemplateCache:
+    """
+    テンプレート内容の LRU キャッシュ
+
+    Attributes:
+        max_bytes (int): キャッシュ全体の上限バイト数
+        max_entry_bytes (int): 1テンプレートあたりの上限バイト数
+            （これを超えるテンプレートはキャッシュしない）
+        hits (int): キャッシュヒット回数
+        misses (int): キャッシュミス回数
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, max_entry_bytes=None):
+        """
+        キャッシュの初期化
+
+        Args:
+            max_bytes (int): キャッシュ全体の上限バイト数（0 で無効）
+            max_entry_bytes (int): 1テンプレートあたりの上限バイト数
+                （省略時は max_bytes の 1/4）
+        """
+        self.max_bytes = max(0, int(max_bytes))
+        if max_entry_bytes is None:
+            max_entry_bytes = self.max_bytes // 4
+        self.max_entry_bytes = min(int(max_entry_bytes), self.max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # パス -> (mtime_ns, サイズ, 内容)
+        self._current_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def current_bytes(self):
+        """現在キャッシュしている合計バイト数"""
+        return self._current_bytes
+
+    def accepts(self, size):
+        """
+        指定サイズのテンプレートをキャッシュ可能かどうか
+
+        Args:
+            size (int): テンプレートのサイズ
+
+        Returns:
+            bool: キャッシュ可能な場合は True
+        """
+        return 0 < self.max_bytes and size <= self.max_entry_bytes
+
+    def get(self, path, stat_result, loader=None):
+        """
+        テンプレート内容を取得（未キャッシュ・更新済みの場合は読み込み）
+
+        Args:
+            path (str): テンプレートファイルパス（キャッシュのキー）
+            stat_result (os.stat_result): 計画時に取得したテンプレートの stat
+            loader (callable): 内容を返す読み込み関数（省略時は path を読む。
+                テンプレートパックのメンバーなどに使用）
+
+        Returns:
+            bytes or None: テンプレート内容。サイズ上限によりキャッシュ
+                対象外の場合は None
+        """
+        if not self.accepts(stat_result.st_size):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if (
+                entry is not None
+                and entry[0] == stat_result.st_mtime_ns
+                and entry[1] == stat_result.st_size
+            ):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        # ロック外で読み込む（同時ミス時は重複して読むが結果は同じ）
+        if loader is not None:
+            data = loader()
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+        if len(data) != stat_result.st_size:
+            # 計画後にテンプレートが変更された場合はキャッシュしない
+            return data
+
+        with self._lock:
+            old_entry = self._entries.pop(path, None)
+            if old_entry is not None:
+                self._current_bytes -= old_entry[1]
+            self._entries[path] = (stat_result.st_mtime_ns, len(data), data)
+            self._current_bytes += len(data)
+
+            # 上限を超えた分を古い順に削除
+            while self._current_bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._current_bytes -= evicted_size
+        return data
+
+    def clear(self):
+        """キャッシュ内容をすべて破棄する"""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
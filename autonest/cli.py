@@ -0,0 +1,488 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest コマンドラインインターフェース
+
+config.json を読み込み、GUI と同じフォルダ・ファイルを
+ディスプレイなしで対象フォルダに作成する。
+
+使用例:
+    python -m autonest C:/Projects/MyGame
+    python -m autonest ./work --config config.json --folder Assets/Editor
+    python -m autonest "students/*" --targets-from extra_targets.txt
+    python -m autonest ./work --rollback
+    python -m autonest "students/*" --verify
+    python -m autonest ./work --report run.json --profile run.prof
+    python -m autonest --list-profiles
+    python -m autonest ./work --config-profile unity
+    python -m autonest "projects/*" --watch
+"""
+
+import argparse
+import os
+import sys
+
+from .batch import expand_targets, run_batch, run_batch_processes
+from .config import CONFIG_FILE, ConfigError, load_config
+from .engine import FolderCreator, select_files, select_folders
+from .journal import has_pending_journal, rollback_pending
+from .profiles import ProfileLibrary
+from .report import RunReport
+from .template import parse_variable_assignments
+from .watch import DEFAULT_DEBOUNCE, TemplateSync, create_watcher
+
+
+def build_parser():
+    """
+    コマンドライン引数パーサーを構築
+
+    Returns:
+        argparse.ArgumentParser: 引数パーサー
+    """
+    parser = argparse.ArgumentParser(
+        prog="autonest",
+        description="AutoNest - フォルダ・ファイル自動作成ツール（CLI版）",
+    )
+    parser.add_argument(
+        "targets",
+        nargs="*",
+        metavar="TARGET",
+        help="フォルダ・ファイルを作成する対象フォルダ（複数・glob パターン指定可）",
+    )
+    parser.add_argument(
+        "-t",
+        "--targets-from",
+        metavar="FILE",
+        help="対象フォルダ一覧ファイル（1行1パスのテキストまたは JSON 配列）",
+    )
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=CONFIG_FILE,
+        help=f"設定ファイルパス（デフォルト: {CONFIG_FILE}）",
+    )
+    parser.add_argument(
+        "--config-profile",
+        metavar="NAME",
+        help="profiles_dir のプロファイルのフォルダ・ファイル構成を使用する",
+    )
+    parser.add_argument(
+        "--list-profiles",
+        action="store_true",
+        help="プロファイルの一覧を表示して終了する",
+    )
+    parser.add_argument(
+        "--build-profile-index",
+        action="store_true",
+        help="profiles_dir の *.json からプロファイル一覧（index.json）を作成して終了する",
+    )
+    parser.add_argument(
+        "--folder",
+        action="append",
+        dest="folders",
+        metavar="PATH",
+        help="作成するフォルダ（複数指定可、省略時は default_folders 全て）",
+    )
+    parser.add_argument(
+        "--file",
+        action="append",
+        dest="files",
+        metavar="NAME",
+        help="作成するファイル名（複数指定可、省略時は default_files 全て）",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        metavar="N",
+        help="ファイル作成の並列ワーカー数（省略時は performance.max_workers）",
+    )
+    parser.add_argument(
+        "-P",
+        "--processes",
+        type=int,
+        metavar="N",
+        help="一括作成時のワーカープロセス数（省略時は performance.processes）",
+    )
+    parser.add_argument(
+        "--var",
+        action="append",
+        dest="variables",
+        metavar="NAME=VALUE",
+        help="render 指定ファイルのテンプレート変数（複数指定可、config の variables より優先）",
+    )
+    parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="作成計画とツリーを表示するのみで、何も作成しない",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="何も作成せず、既存の作成先がテンプレートと同一かどうかを検証する",
+    )
+    parser.add_argument(
+        "--no-transaction",
+        action="store_true",
+        help="中断・致命的エラー時に作成した項目を取り消さない（apply_settings.transactional より優先）",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="作成記録を基に、テンプレートが変更された未編集のファイルを更新する"
+        "（apply_settings.incremental と同じ）",
+    )
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="中断された前回の作成処理の記録を基に、作成された項目を取り消して終了する",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="テンプレートを監視し、変更を対象フォルダの未編集のファイルに反映し続ける",
+    )
+    parser.add_argument(
+        "--watch-poll",
+        action="store_true",
+        help="--watch で inotify を使わず、更新時刻の定期確認で監視する",
+    )
+    parser.add_argument(
+        "--watch-debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        metavar="SEC",
+        help=f"--watch で変更をまとめて反映するまでの待ち時間（既定 {DEFAULT_DEBOUNCE}秒）",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="段階ごとの処理時間・操作回数・低速な項目を JSON で保存する",
+    )
+    parser.add_argument(
+        "--prometheus",
+        metavar="FILE",
+        help="実行レポートを Prometheus の textfile 形式（*.prom）で保存する",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="FILE",
+        help="cProfile で計測し、統計を保存する（上位の関数を標準エラーに表示）",
+    )
+    parser.add_argument(
+        "-q", "--quiet", action="store_true", help="ログ出力を抑制する"
+    )
+    return parser
+
+
+def rollback_targets(targets, log=None):
+    """
+    対象フォルダに残っているジャーナルを基に作成された項目を取り消す
+
+    Args:
+        targets (list): 対象フォルダパスのリスト
+        log (callable): ログコールバック
+
+    Returns:
+        int: 終了コード（0: 成功, 1: 削除できない項目あり）
+    """
+    log = log or (lambda message: None)
+    failed = False
+    for target in targets:
+        if not has_pending_journal(target):
+            log(f"{target}: 取り消す作成処理の記録はありません")
+            continue
+        rollback = rollback_pending(target, log)
+        log(f"↩️ {target}: {rollback.removed_count}個の項目を取り消しました")
+        for error in rollback.errors:
+            print(f"エラー: {target}: {error}", file=sys.stderr)
+        failed = failed or bool(rollback.errors)
+    return 1 if failed else 0
+
+
+def verify_targets(engine, targets, selected_folders, selected_files, log=None):
+    """
+    対象フォルダごとに既存の作成先を検証し、結果を表示する
+
+    Args:
+        engine (FolderCreator): 作成エンジン（テンプレートのハッシュを共有する）
+        targets (list): 対象フォルダパスのリスト
+        selected_folders (list): 作成対象フォルダリスト
+        selected_files (list): 作成対象ファイルリスト
+        log (callable): ログコールバック
+
+    Returns:
+        int: 終了コード（0: すべて一致, 1: 相違・不足・エラーあり）
+    """
+    log = log or (lambda message: None)
+    failed = False
+    for target in targets:
+        if not os.path.isdir(target):
+            print(f"エラー: 対象フォルダが存在しません: {target}", file=sys.stderr)
+            failed = True
+            continue
+        plan = engine.plan(target, selected_folders, selected_files)
+        result = engine.verify(plan)
+        for line in result.summary_lines():
+            log(line)
+        failed = failed or not result.ok
+    return 1 if failed else 0
+
+
+def watch_targets(
+    engine, targets, selected_files, polling=False, debounce=DEFAULT_DEBOUNCE, log=None
+):
+    """
+    テンプレートを監視し、変更を対象フォルダへ反映し続ける（Ctrl+C で終了）
+
+    監視の開始時に一度反映し、監視していない間の変更も取り込む。
+
+    Args:
+        engine (FolderCreator): 作成エンジン
+        targets (list): 反映先の対象フォルダパスのリスト
+        selected_files (list): 監視・反映するファイルリスト
+        polling (bool): inotify を使わずポーリングで監視するかどうか
+        debounce (float): 変更をまとめて反映するまでの待ち時間（秒）
+        log (callable): ログコールバック
+
+    Returns:
+        int: 終了コード（0: 終了）
+    """
+    log = log or (lambda message: None)
+    sync = TemplateSync(engine, targets, selected_files, log)
+    sync.sync()
+    watcher = create_watcher(sync.watched_paths, polling)
+    log(
+        f"👀 テンプレート{len(sync.watched_paths)}個を監視しています"
+        f"（{watcher.name}、対象フォルダ{len(targets)}個）。Ctrl+C で終了します"
+    )
+    try:
+        sync.run(watcher, debounce)
+    except KeyboardInterrupt:
+        log("⏹️ 監視を終了しました")
+    finally:
+        watcher.close()
+    return 0
+
+
+def list_profiles(library, build_index=False):
+    """
+    プロファイルの一覧を表示する
+
+    Args:
+        library (ProfileLibrary): プロファイルフォルダ
+        build_index (bool): 表示の前に index.json を作成するかどうか
+
+    Returns:
+        int: 終了コード（0: 成功, 2: 一覧を読み込めない・作成できない）
+    """
+    try:
+        if build_index:
+            profiles = library.build_index()
+            print(f"{library.index_path} を作成しました（{len(profiles)}個）")
+        else:
+            profiles = library.list_profiles()
+    except (ConfigError, OSError) as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        return 2
+    if not profiles:
+        print(f"プロファイルがありません: {library.directory}")
+    for profile in profiles:
+        if profile.description:
+            print(f"{profile.name}\t{profile.description}")
+        else:
+            print(profile.name)
+    return 0
+
+
+def _load_config(args):
+    """
+    設定ファイルを読み込み、--config-profile のプロファイルを適用する
+
+    Args:
+        args (argparse.Namespace): コマンドライン引数
+
+    Returns:
+        dict: 正規化した設定情報辞書
+
+    Raises:
+        ConfigError: 設定ファイル・プロファイルを読み込めない場合
+    """
+    config = load_config(args.config)
+    if args.config_profile:
+        library = ProfileLibrary(config["profiles_dir"])
+        config = library.load(args.config_profile, config)
+    return config
+
+
+def main(argv=None):
+    """
+    CLI エントリーポイント
+
+    Args:
+        argv (list): コマンドライン引数（None の場合は sys.argv を使用）
+
+    Returns:
+        int: 終了コード（0: 成功, 1: ファイルエラーあり・検証で相違あり,
+            2: 入力エラー）
+    """
+    args = build_parser().parse_args(argv)
+    report = RunReport() if args.report or args.prometheus else None
+
+    if args.profile:
+        # cProfile は計測する場合のみ読み込む
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        code = profiler.runcall(_run, args, report)
+        profiler.dump_stats(args.profile)
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        stats.sort_stats("cumulative").print_stats(20)
+    else:
+        code = _run(args, report)
+
+    if report is not None:
+        if not args.quiet:
+            for line in report.summary_lines():
+                print(line)
+        try:
+            if args.report:
+                report.write_json(args.report)
+            if args.prometheus:
+                report.write_prometheus(args.prometheus)
+        except OSError as e:
+            print(f"エラー: 実行レポートを保存できません: {e}", file=sys.stderr)
+            return 2
+    return code
+
+
+def _run(args, report):
+    """
+    解析済みの引数に従って作成・検証・取り消しを実行
+
+    Args:
+        args (argparse.Namespace): コマンドライン引数
+        report (RunReport): 実行レポート（None で記録しない）
+
+    Returns:
+        int: 終了コード
+    """
+    if args.list_profiles or args.build_profile_index:
+        try:
+            config = load_config(args.config)
+        except ConfigError as e:
+            print(f"エラー: {e}", file=sys.stderr)
+            return 2
+        return list_profiles(
+            ProfileLibrary(config["profiles_dir"]), args.build_profile_index
+        )
+
+    try:
+        targets = expand_targets(args.targets, args.targets_from)
+    except (OSError, ValueError) as e:
+        print(f"エラー: 対象フォルダ一覧を読み込めません: {e}", file=sys.stderr)
+        return 2
+    if not targets:
+        print("エラー: 対象フォルダが指定されていません。", file=sys.stderr)
+        return 2
+    if args.rollback:
+        return rollback_targets(targets, None if args.quiet else print)
+    batch_mode = len(targets) > 1 or args.targets_from is not None
+    if not batch_mode and not os.path.isdir(targets[0]):
+        print(f"エラー: 対象フォルダが存在しません: {targets[0]}", file=sys.stderr)
+        return 2
+
+    try:
+        cli_variables = parse_variable_assignments(args.variables)
+    except ValueError as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        return 2
+
+    try:
+        if report is not None:
+            with report.phase("config_load"):
+                config = _load_config(args)
+        else:
+            config = _load_config(args)
+    except ConfigError as e:
+        print(f"エラー: {e}", file=sys.stderr)
+        return 2
+    # ワーカープロセスにも反映されるよう設定として上書きする
+    apply_settings = dict(config.get("apply_settings", {}))
+    if args.no_transaction:
+        apply_settings["transactional"] = False
+    if args.incremental or args.watch:
+        apply_settings["incremental"] = True
+    config = dict(config, apply_settings=apply_settings)
+    selected_folders = select_folders(config, args.folders)
+    selected_files = select_files(config, args.files)
+
+    if not selected_folders and not selected_files:
+        print("警告: 作成するフォルダまたはファイルがありません。", file=sys.stderr)
+        return 2
+
+    # 一括作成時は項目ごとのログを省略し、対象フォルダごとの要約のみ表示する
+    item_log = None if args.quiet or batch_mode else print
+    engine = FolderCreator.from_config(config, log=item_log)
+    engine.report = report
+    if args.workers is not None:
+        engine.max_workers = max(1, args.workers)
+    engine.variables.update(cli_variables)
+    processes = args.processes
+    if processes is None:
+        processes = config.get("performance", {}).get("processes", 1)
+    try:
+        if args.watch:
+            return watch_targets(
+                engine,
+                targets,
+                selected_files,
+                polling=args.watch_poll,
+                debounce=args.watch_debounce,
+                log=None if args.quiet else print,
+            )
+        if args.verify:
+            return verify_targets(
+                engine,
+                targets,
+                selected_folders,
+                selected_files,
+                log=None if args.quiet else print,
+            )
+        if batch_mode and processes > 1 and len(targets) > 1:
+            # 対象フォルダをシャードに分け、各プロセスが独自のエンジンで処理する
+            batch = run_batch_processes(
+                config,
+                targets,
+                selected_folders,
+                selected_files,
+                processes,
+                variables=cli_variables,
+                max_workers=args.workers,
+                log=None if args.quiet else print,
+                dry_run=args.dry_run,
+                report=report,
+            )
+        elif batch_mode:
+            batch = run_batch(
+                engine,
+                targets,
+                selected_folders,
+                selected_files,
+                log=None if args.quiet else print,
+                dry_run=args.dry_run,
+            )
+        if batch_mode:
+            for line in batch.summary_lines():
+                print(line)
+            return 1 if batch.error_count else 0
+        if args.dry_run:
+            plan = engine.plan(targets[0], selected_folders, selected_files)
+            engine.log_plan(plan)
+            print(plan.render_tree())
+            return 1 if plan.errors else 0
+        result = engine.execute(targets[0], selected_folders, selected_files)
+    finally:
+        engine.close()
+    return 1 if result.file_errors else 0
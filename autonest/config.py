@@ -0,0 +1,430 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 設定ファイル読み込みモジュール
+
+config.json の読み込み・検証・正規化とデフォルト設定の生成を行う。
+GUI・CLI の両方から共通で利用される。
+
+読み込んだ設定はスキーマで検証した上で正規化（テンプレートパスの解決、
+重複項目の統合、暗黙の親フォルダとの競合チェック）され、
+ファイル内容のハッシュをキーとしてキャッシュフォルダに保存される。
+次回以降の起動では内容が変わっていなければ解析・正規化を省略する。
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from .fastcopy import FILE_MODES
+from .plan import normalize_relpath
+
+CONFIG_FILE = "config.json"
+PROFILES_DIR = "profiles"
+
+# 正規化結果の形式を変更した場合は更新する（古いキャッシュを無視するため）
+_CACHE_FORMAT = 3
+_MAX_REPORTED_ERRORS = 20
+
+
+class ConfigError(Exception):
+    """
+    設定ファイルの読み込み・検証に失敗した場合の例外
+
+    Attributes:
+        config_file (str): 設定ファイルパス
+        errors (list): 検出した問題の一覧
+    """
+
+    def __init__(self, config_file, errors):
+        self.config_file = config_file
+        self.errors = list(errors)
+        lines = [f"設定ファイル {config_file} が正しくありません:"]
+        lines.extend(f"  - {error}" for error in self.errors[:_MAX_REPORTED_ERRORS])
+        if len(self.errors) > _MAX_REPORTED_ERRORS:
+            lines.append(f"  ...ほか {len(self.errors) - _MAX_REPORTED_ERRORS}件")
+        super().__init__("\n".join(lines))
+
+
+# スキーマ: 型名、または {"type": ..., ...} の辞書
+#   "object" は properties（既知のキー）、required（必須キー）、
+#   values（任意キーの値の型）を持つ。"array" は items を持つ。
+_FILE_SCHEMA = {
+    "type": "object",
+    "required": ("name", "template_path"),
+    "properties": {
+        "name": "string",
+        "description": "string",
+        "template_path": "string",
+        "target_path": "string",
+        "render": "boolean",
+        "encoding": "string",
+        "mode": {"type": "string", "enum": FILE_MODES},
+    },
+}
+
+CONFIG_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "default_folders": {"type": "array", "items": "string"},
+        "default_files": {"type": "array", "items": _FILE_SCHEMA},
+        "window_settings": {
+            "type": "object",
+            "properties": {
+                "width": "integer",
+                "height": "integer",
+                "title": "string",
+            },
+        },
+        "log_settings": {
+            "type": "object",
+            "properties": {
+                "max_lines": "integer",
+                "auto_scroll": "boolean",
+                "flush_interval_ms": "integer",
+                "flush_chunk_lines": "integer",
+            },
+        },
+        "performance": {
+            "type": "object",
+            "properties": {
+                "max_workers": "integer",
+                "template_cache_mb": "number",
+                "processes": "integer",
+                "zero_copy": "boolean",
+                "copy_metadata": "boolean",
+            },
+        },
+        "apply_settings": {
+            "type": "object",
+            "properties": {"transactional": "boolean", "incremental": "boolean"},
+        },
+        "variables": {"type": "object", "values": "string"},
+        "template_pack": "string",
+        "profiles_dir": "string",
+    },
+}
+
+_TYPE_NAMES = {
+    "string": "文字列",
+    "integer": "整数",
+    "number": "数値",
+    "boolean": "true / false",
+    "array": "配列",
+    "object": "オブジェクト",
+}
+
+
+def _matches_type(value, type_name):
+    """値が JSON スキーマの型に一致するかどうか（bool は数値として扱わない）"""
+    if type_name == "string":
+        return isinstance(value, str)
+    if type_name == "boolean":
+        return isinstance(value, bool)
+    if type_name == "integer":
+        return isinstance(value, int) and not isinstance(value, bool)
+    if type_name == "number":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if type_name == "array":
+        return isinstance(value, list)
+    return isinstance(value, dict)
+
+
+def _validate(value, schema, location, errors):
+    """
+    値をスキーマで検証し、問題を errors に追加する
+
+    Args:
+        value: 検証する値
+        schema (str or dict): スキーマ
+        location (str): エラー表示用の位置（例: "default_files[3].name"）
+        errors (list): 問題の追加先
+    """
+    if isinstance(schema, str):
+        schema = {"type": schema}
+    type_name = schema["type"]
+    if not _matches_type(value, type_name):
+        errors.append(f"{location}: {_TYPE_NAMES[type_name]}で指定してください")
+        return
+
+    if "enum" in schema and value not in schema["enum"]:
+        choices = " / ".join(schema["enum"])
+        errors.append(f"{location}: {choices} のいずれかを指定してください")
+    elif type_name == "array":
+        for position, item in enumerate(value):
+            _validate(item, schema["items"], f"{location}[{position}]", errors)
+    elif type_name == "object":
+        properties = schema.get("properties")
+        for key in schema.get("required", ()):
+            if key not in value:
+                errors.append(f"{location}: {key} を指定してください")
+        for key, item in value.items():
+            child = f"{location}.{key}" if location else key
+            if properties is None:
+                _validate(item, schema["values"], child, errors)
+            elif key in properties:
+                _validate(item, properties[key], child, errors)
+            elif location or not key.startswith("_"):
+                # トップレベルの "_" で始まるキーはコメント用として許可する
+                errors.append(f"{child}: 不明な設定項目です")
+
+
+def validate_config(config, config_file=CONFIG_FILE, schema=CONFIG_SCHEMA):
+    """
+    設定をスキーマで検証
+
+    Args:
+        config (dict): 設定情報辞書
+        config_file (str): エラー表示用の設定ファイルパス
+        schema (dict): 検証に使うスキーマ（プロファイルでは項目を追加したもの）
+
+    Raises:
+        ConfigError: 問題が見つかった場合
+    """
+    errors = []
+    _validate(config, schema, "", errors)
+    if errors:
+        raise ConfigError(config_file, errors)
+
+
+def parse_config_data(data, config_file=CONFIG_FILE):
+    """
+    設定ファイルの内容（JSON）を解析
+
+    Args:
+        data (bytes): ファイルの内容（UTF-8、BOM 付きも可）
+        config_file (str): エラー表示用の設定ファイルパス
+
+    Returns:
+        任意: 解析結果（検証は行わない）
+
+    Raises:
+        ConfigError: UTF-8 として読み込めない・JSON の構文エラーの場合
+    """
+    try:
+        return json.loads(data.decode("utf-8-sig"))
+    except UnicodeDecodeError as e:
+        raise ConfigError(config_file, [f"UTF-8 として読み込めません: {e}"]) from e
+    except json.JSONDecodeError as e:
+        raise ConfigError(
+            config_file, [f"{e.lineno}行目 {e.colno}文字目: JSON の構文エラー ({e.msg})"]
+        ) from e
+
+
+def normalize_config(config, base_dir, config_file=CONFIG_FILE):
+    """
+    検証済みの設定を正規化
+
+    - template_path / template_pack / profiles_dir を設定ファイルのフォルダ基準で
+      解決する（テンプレートパック内の検索用に元の相対パスを template_member に残す）
+    - default_folders の重複（表記ゆれを含む）を除く
+    - 同じ name の default_files を1項目に統合する（後の項目のキーが優先）
+    - target_path を補完し、フォルダ・暗黙の親フォルダとの競合を検出する
+
+    Args:
+        config (dict): 検証済みの設定情報辞書
+        base_dir (str): 相対パスの基準フォルダ
+        config_file (str): エラー表示用の設定ファイルパス
+
+    Returns:
+        dict: 正規化した設定情報辞書（元の辞書は変更しない）
+
+    Raises:
+        ConfigError: 項目同士が競合している場合
+    """
+    normalized = dict(config)
+
+    folders = []
+    folder_keys = set()
+    for folder in config.get("default_folders", []):
+        key = os.path.normcase(normalize_relpath(folder))
+        if key and key not in folder_keys:
+            folder_keys.add(key)
+            folders.append(folder)
+    normalized["default_folders"] = folders
+
+    files = {}
+    for file_config in config.get("default_files", []):
+        name = file_config["name"]
+        merged = dict(files.get(name, {}))
+        merged.update(file_config)
+        files[name] = merged
+
+    for name, file_config in files.items():
+        template_path = file_config["template_path"]
+        file_config["template_member"] = normalize_relpath(template_path)
+        if not os.path.isabs(template_path):
+            file_config["template_path"] = os.path.normpath(
+                os.path.join(base_dir, template_path)
+            )
+        file_config.setdefault("target_path", name)
+
+    # フォルダ・ファイルの親（暗黙に作成されるフォルダ）を含む全フォルダ
+    target_keys = {
+        name: os.path.normcase(normalize_relpath(file_config["target_path"]))
+        for name, file_config in files.items()
+    }
+    dir_keys = set()
+    for key in list(folder_keys) + list(target_keys.values()):
+        parts = key.split("/")
+        dir_keys.update("/".join(parts[:depth]) for depth in range(1, len(parts)))
+    dir_keys.update(folder_keys)
+
+    errors = []
+    for name, file_config in files.items():
+        if target_keys[name] in dir_keys:
+            errors.append(
+                f"default_files ({name}): 作成先 {file_config['target_path']} が"
+                f"フォルダと競合しています"
+            )
+    if errors:
+        raise ConfigError(config_file, errors)
+    normalized["default_files"] = list(files.values())
+
+    template_pack = config.get("template_pack")
+    if template_pack and not os.path.isabs(template_pack):
+        normalized["template_pack"] = os.path.normpath(
+            os.path.join(base_dir, template_pack)
+        )
+    normalized["profiles_dir"] = os.path.normpath(
+        os.path.join(base_dir, config.get("profiles_dir") or PROFILES_DIR)
+    )
+    return normalized
+
+
+def get_cache_dir():
+    """
+    コンパイル済み設定のキャッシュフォルダを取得
+
+    環境変数 AUTONEST_CACHE_DIR、Windows では %LOCALAPPDATA%\\AutoNest\\cache、
+    それ以外では $XDG_CACHE_HOME/autonest（既定は ~/.cache/autonest）。
+
+    Returns:
+        str: キャッシュフォルダパス
+    """
+    cache_dir = os.environ.get("AUTONEST_CACHE_DIR")
+    if cache_dir:
+        return cache_dir
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):
+        return os.path.join(os.environ["LOCALAPPDATA"], "AutoNest", "cache")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "autonest")
+
+
+def _cache_path(config_path, data):
+    """設定ファイルのパスと内容からキャッシュファイルパスを求める"""
+    digest = hashlib.sha256()
+    digest.update(f"{_CACHE_FORMAT}\0{config_path}\0".encode("utf-8"))
+    digest.update(data)
+    return os.path.join(get_cache_dir(), f"config-{digest.hexdigest()}.json")
+
+
+def _load_cached(cache_path):
+    """
+    キャッシュを読み込む（存在しない・壊れている・形式が異なる場合は None）
+
+    キャッシュフォルダは他のユーザー・プロセスが書き込める場合があるため、
+    コードを実行しうる形式（pickle）ではなく JSON で保存している。
+    """
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != _CACHE_FORMAT:
+        return None
+    return data.get("config")
+
+
+def _store_cached(cache_path, config):
+    """キャッシュを書き込む（書き込めない場合は何もしない）"""
+    import tempfile
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {"format": _CACHE_FORMAT, "config": config}, f, ensure_ascii=False
+            )
+        # 同時に起動した別プロセスと競合しないよう置き換えで保存する
+        os.replace(temp_path, cache_path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+
+
+def load_config(config_file=CONFIG_FILE, use_cache=True):
+    """
+    設定ファイル（config.json）を読み込む
+
+    設定ファイルが存在しない場合はデフォルト設定を返す。
+    内容が不正な場合はデフォルト設定に戻さず ConfigError を送出する。
+
+    Args:
+        config_file (str): 設定ファイルパス
+        use_cache (bool): コンパイル済み設定のキャッシュを使用するかどうか
+
+    Returns:
+        dict: 正規化した設定情報辞書
+
+    Raises:
+        ConfigError: 設定ファイルを読み込めない・内容が不正な場合
+    """
+    if not os.path.exists(config_file):
+        return normalize_config(get_default_config(), os.getcwd(), config_file)
+
+    config_path = os.path.abspath(config_file)
+    try:
+        with open(config_path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        raise ConfigError(config_file, [str(e)]) from e
+
+    cache_path = _cache_path(config_path, data) if use_cache else None
+    if cache_path is not None:
+        cached = _load_cached(cache_path)
+        if isinstance(cached, dict):
+            return cached
+
+    config = parse_config_data(data, config_file)
+    validate_config(config, config_file)
+    config = normalize_config(config, os.path.dirname(config_path), config_file)
+    if cache_path is not None:
+        _store_cached(cache_path, config)
+    return config
+
+
+def get_default_config():
+    """
+    デフォルト設定を生成して返す
+
+    config.jsonが存在しない場合に使用される。
+
+    Returns:
+        dict: デフォルト設定辞書
+    """
+    return {
+        "default_folders": ["Assets/Editor"],
+        "default_files": [
+            {
+                "name": ".gitignore",
+                "description": "Git無視ファイル",
+                "template_path": "templates/.gitignore",
+                "target_path": ".gitignore",
+            }
+        ],
+        "window_settings": {
+            "width": 700,
+            "height": 600,
+            "title": "AutoNest - フォルダ自動作成ツール",
+        },
+        "log_settings": {"max_lines": 1000, "auto_scroll": True},
+    }
@@ -0,0 +1,1318 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 作成エンジン
+
+フォルダ・ファイルの作成計画（plan モジュール）を構築・実行する処理を
+GUI から独立して提供する。
+ログ出力はコンストラクタで渡されたコールバックに委譲するため、
+tkinter を一切 import せずに CLI やバッチジョブから利用できる。
+"""
+
+import errno
+import os
+import stat
+import threading
+import time
+from contextlib import nullcontext
+
+from .cache import TemplateCache
+from .fastcopy import MODE_COPY, copy_file, link_file, remove_partial
+from .journal import BACKUP_SUFFIX, UPDATE, Journal, JournalError
+from .manifest import ScaffoldManifest, hash_bytes, hash_file
+from .pack import TemplatePack, TemplatePackError
+from .plan import (
+    DIR,
+    FILE,
+    STATUS_CONFLICT,
+    STATUS_EXISTING,
+    STATUS_NEW,
+    build_plan,
+    normalize_relpath,
+)
+from .template import TemplateLibrary, builtin_variables
+from .verify import DIFFERS, IDENTICAL, MISSING, VerifyResult, compare_file
+
+# ファイル作成で発生した場合に残りの項目も作成できないとみなすエラー
+_FATAL_ERRNOS = frozenset(
+    code for code in (errno.ENOSPC, getattr(errno, "EDQUOT", None)) if code
+)
+
+
+def _null_log(message):
+    """ログ出力を行わないデフォルトのログコールバック"""
+
+
+def select_folders(config, names=None):
+    """
+    設定から作成対象フォルダリストを取得
+
+    Args:
+        config (dict): 設定情報辞書
+        names (list): 対象を絞り込むフォルダ名リスト（None の場合は全て）
+
+    Returns:
+        list: 作成対象フォルダリスト
+    """
+    default_folders = config.get("default_folders", [])
+    if names is None:
+        return list(default_folders)
+    return [folder for folder in default_folders if folder in names]
+
+
+def select_files(config, names=None):
+    """
+    設定から作成対象ファイルリストを取得
+
+    Args:
+        config (dict): 設定情報辞書
+        names (list): 対象を絞り込むファイル名リスト（None の場合は全て）
+
+    Returns:
+        list: (ファイル名, ファイル設定) のタプルリスト
+    """
+    selected_files = []
+    for file_config in config.get("default_files", []):
+        file_name = file_config.get("name", "")
+        if names is None or file_name in names:
+            selected_files.append((file_name, file_config))
+    return selected_files
+
+
+class ProgressEvent:
+    """
+    作成処理の進捗イベント
+
+    Attributes:
+        done (int): 処理済み項目数
+        total (int): 全項目数
+        path (str): 直前に処理した項目の相対パス
+        bytes_copied (int): これまでにコピーしたバイト数
+    """
+
+    def __init__(self, done, total, path, bytes_copied):
+        self.done = done
+        self.total = total
+        self.path = path
+        self.bytes_copied = bytes_copied
+
+
+class _RunContext:
+    """
+    1回の作成処理における進捗・中断状態
+
+    ワーカースレッドから進捗を更新できるようロックで保護する。
+    """
+
+    def __init__(
+        self, total, progress=None, cancel_event=None, variables=None, journal=None
+    ):
+        self.total = total
+        self.done = 0
+        self.bytes_copied = 0
+        self.variables = variables or {}  # テンプレート変数（作成先ごと）
+        self.journal = journal  # 作成した項目の記録先（None で記録しない）
+        self.failed = False  # 取り消しが必要な致命的エラーが発生したかどうか
+        # 作成先相対パス -> (テンプレートのハッシュ, 書き込んだ内容のハッシュ)
+        # （差分更新が有効な場合のみ記録する）
+        self.outputs = None
+        self._progress = progress
+        self._cancel_event = cancel_event
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        """中断が要求されているかどうか"""
+        return self._cancel_event is not None and self._cancel_event.is_set()
+
+    @property
+    def stopped(self):
+        """中断要求またはエラーにより残りの項目を処理しないかどうか"""
+        return self.failed or self.cancelled
+
+    def fail(self):
+        """
+        致命的な作成エラー（フォルダ作成の失敗・容量不足など）を通知
+
+        ジャーナルに記録している場合は全体を取り消すため、残りの項目を処理しない。
+        ファイルごとのエラーでは呼び出さない（他の項目の作成を続ける）。
+        """
+        if self.journal is not None:
+            self.failed = True
+
+    def record(self, kind, path):
+        """
+        作成した項目をジャーナルに記録（トランザクション無効時は何もしない）
+
+        Args:
+            kind (str): DIR または FILE
+            path (str): 作成した項目の相対パス
+        """
+        if self.journal is not None:
+            self.journal.record(kind, path)
+
+    def advance(self, path, nbytes=0):
+        """
+        処理済み項目を1つ進めて進捗イベントを通知
+
+        Args:
+            path (str): 処理した項目の相対パス
+            nbytes (int): コピーしたバイト数
+        """
+        with self._lock:
+            self.done += 1
+            self.bytes_copied += nbytes
+            event = ProgressEvent(self.done, self.total, path, self.bytes_copied)
+        if self._progress is not None:
+            self._progress(event)
+
+
+class CreationResult:
+    """
+    作成処理の結果
+
+    Attributes:
+        folder_created_count (int): 作成されたフォルダ数
+        file_created_count (int): 作成されたファイル数
+        file_updated_count (int): テンプレートの変更により置き換えたファイル数
+        existing_folders (list): 既存フォルダリスト
+        existing_files (list): 既存ファイルリスト
+        file_errors (list): ファイルエラーリスト
+        bytes_copied (int): コピーしたバイト数
+        cancelled (bool): 処理が途中で中断されたかどうか
+        rolled_back (bool): 失敗・中断により作成した項目を取り消したかどうか
+        rolled_back_count (int): ロールバックで削除した項目数
+    """
+
+    def __init__(self):
+        self.folder_created_count = 0
+        self.file_created_count = 0
+        self.file_updated_count = 0
+        self.existing_folders = []
+        self.existing_files = []
+        self.file_errors = []
+        self.bytes_copied = 0
+        self.cancelled = False
+        self.rolled_back = False
+        self.rolled_back_count = 0
+
+    @property
+    def has_changes(self):
+        """新規作成・既存スキップ・エラーのいずれかが存在するかどうか"""
+        return bool(
+            self.folder_created_count
+            or self.file_created_count
+            or self.file_updated_count
+            or self.existing_folders
+            or self.existing_files
+            or self.file_errors
+            or self.rolled_back
+        )
+
+    def to_dict(self):
+        """
+        結果を辞書形式に変換
+
+        Returns:
+            dict: 結果辞書
+        """
+        return {
+            "folder_created_count": self.folder_created_count,
+            "file_created_count": self.file_created_count,
+            "file_updated_count": self.file_updated_count,
+            "existing_folders": list(self.existing_folders),
+            "existing_files": list(self.existing_files),
+            "file_errors": list(self.file_errors),
+            "bytes_copied": self.bytes_copied,
+            "cancelled": self.cancelled,
+            "rolled_back": self.rolled_back,
+            "rolled_back_count": self.rolled_back_count,
+        }
+
+
+class ApplyRun:
+    """
+    1回の作成処理（FolderCreator.start_apply で開始する）
+
+    作成処理を準備・ディレクトリ作成・ファイル作成・確定の手順に分けて
+    提供する。FolderCreator.apply はこれらを順に呼び出し、
+    aio.AsyncFolderCreator は各項目の作成を自身のワーカープールで実行する。
+    create_dir / create_file はワーカースレッドから同時に呼び出してよい。
+
+    使用例:
+        run = engine.start_apply(plan, progress, cancel_event)
+        if run.ready:
+            try:
+                with run.phase("mkdir"):
+                    for level in run.dir_levels():
+                        run.add_dir_outcomes([run.create_dir(p) for p in level])
+                    run.flush_journal()
+                files = run.file_order()
+                with run.phase("copy"):
+                    outcomes = [run.create_file(f) for f in files]
+                run.add_file_outcomes(files, outcomes)
+            except Exception as e:
+                run.fail(e)
+        result = run.finish()
+
+    Attributes:
+        engine (FolderCreator): 作成エンジン
+        plan (ScaffoldPlan): 作成計画
+        result (CreationResult): 作成処理結果（finish で確定する）
+    """
+
+    def __init__(self, engine, plan, result, context):
+        self.engine = engine
+        self.plan = plan
+        self.result = result
+        self._context = context
+        self._errors = []  # 作成中に発生したエラー
+
+    @property
+    def ready(self):
+        """
+        作成を開始できたかどうか
+
+        前回のジャーナルが残っていて作成できない場合は False で、
+        そのまま finish を呼び出す。
+        """
+        return self._context is not None
+
+    @property
+    def stopped(self):
+        """中断要求または致命的なエラーにより残りの項目を処理しないかどうか"""
+        return self._context.stopped
+
+    def phase(self, name):
+        """
+        段階の経過時間を実行レポートに記録するコンテキストマネージャーを取得
+
+        Args:
+            name (str): 段階名（report モジュールの PHASES 参照）
+        """
+        return self.engine._phase(name)
+
+    def dir_levels(self):
+        """
+        作成するディレクトリを階層ごとにまとめる
+
+        同じ階層のディレクトリは互いに依存しないため同時に作成できる。
+
+        Returns:
+            list: 浅い階層から順の、同じ階層の相対パスリストのリスト
+        """
+        levels = {}
+        for rel_path in self.plan.dirs_to_create:
+            levels.setdefault(rel_path.count("/"), []).append(rel_path)
+        return [levels[depth] for depth in sorted(levels)]
+
+    def create_dir(self, rel_path):
+        """
+        計画されたディレクトリを1つ作成（失敗は致命的なエラーとして送出する）
+
+        Args:
+            rel_path (str): 正規化済み相対パス
+
+        Returns:
+            bool: 選択されたフォルダを作成した場合は True
+        """
+        return self.engine._create_dir(self.plan, rel_path, self._context)
+
+    def add_dir_outcomes(self, outcomes):
+        """
+        create_dir の結果を集計
+
+        Args:
+            outcomes (list): create_dir の結果のリスト
+        """
+        self.result.folder_created_count += sum(1 for outcome in outcomes if outcome)
+
+    def flush_journal(self):
+        """ジャーナルのバッファを書き出す（ディレクトリ作成の完了時に呼び出す）"""
+        if self._context.journal is not None:
+            self._context.journal.flush()
+
+    def file_order(self):
+        """
+        作成・更新するファイルを処理順に並べる
+
+        パック内のテンプレートはアーカイブ内の格納順に処理し、アーカイブを
+        先頭から順に読み進める。
+
+        Returns:
+            list: PlannedFile のリスト
+        """
+        return sorted(
+            self.plan.files_to_create + self.plan.files_to_update,
+            key=lambda f: -1 if f.pack_member is None else f.pack_member.offset,
+        )
+
+    def create_file(self, planned_file):
+        """
+        テンプレートから1ファイルを作成
+
+        Args:
+            planned_file (PlannedFile): 作成・更新するファイル
+
+        Returns:
+            bool or str or None: 作成成功時は True、エラー時はエラーメッセージ、
+                中断によりスキップした場合は None
+        """
+        return self.engine._create_file(self.plan, planned_file, self._context)
+
+    def add_file_outcomes(self, files, outcomes):
+        """
+        create_file の結果を集計
+
+        ログ以外は並列時も逐次時と同じ順序になるよう、投入順に集計する。
+
+        Args:
+            files (list): 処理した PlannedFile のリスト
+            outcomes (list): create_file の結果（files と同じ順序）
+        """
+        for planned_file, outcome in zip(files, outcomes):
+            if outcome is True and planned_file.update:
+                self.result.file_updated_count += 1
+            elif outcome is True:
+                self.result.file_created_count += 1
+            elif outcome:
+                self._errors.append(outcome)
+
+    def fail(self, error):
+        """
+        作成処理中の予期しない例外を致命的なエラーとして記録
+
+        トランザクションが無効な場合は取り消せないため、error を送出する。
+
+        Args:
+            error (Exception): 発生した例外
+
+        Raises:
+            Exception: トランザクションが無効な場合の error
+        """
+        if self._context.journal is None:
+            raise error
+        self._context.fail()
+        self.engine.log(f"❌ 作成処理エラー: {str(error)}")
+        self._errors.append(f"作成処理エラー - {str(error)}")
+
+    def finish(self):
+        """
+        作成処理の結果を確定
+
+        中断・致命的なエラーの場合は作成した項目を取り消し、それ以外は
+        ジャーナルを削除して作成記録を保存する。
+
+        Returns:
+            CreationResult: 作成処理結果
+        """
+        result = self.result
+        context = self._context
+        if context is None:
+            return result
+        result.file_errors.extend(self._errors)
+        result.bytes_copied = context.bytes_copied
+        result.cancelled = context.cancelled
+        if context.journal is not None:
+            if context.failed or result.cancelled:
+                self.engine._rollback(context.journal, result)
+            else:
+                context.journal.commit()
+        if self.plan.manifest is not None and not result.rolled_back:
+            self.engine._save_manifest(self.plan, context, result)
+        return result
+
+
+class FolderCreator:
+    """
+    フォルダ・ファイル作成エンジン
+
+    既存のフォルダ・ファイルは上書きせず、不足している項目のみを作成する。
+    すべての処理状況はログコールバックへ出力される。
+
+    Attributes:
+        log (callable): ログメッセージを受け取るコールバック
+        max_workers (int): ファイル作成の並列ワーカー数（1 の場合は逐次処理）
+        template_cache (TemplateCache): テンプレート内容キャッシュ（None で無効）
+        variables (dict): render 指定ファイルに適用するテンプレート変数
+        copy_metadata (bool): コピーしたファイルの更新時刻をテンプレートに合わせるか
+        zero_copy (bool): reflink / copy_file_range などのカーネル内コピーを使うか
+        template_pack_path (str): テンプレートパック（zip / tar）のパス（None で無効）
+        transactional (bool): 中断・致命的エラー時に作成した項目を取り消すかどうか
+        incremental (bool): 作成記録を基に変更されたテンプレートのファイルを更新するか
+        report (RunReport): 段階ごとの時間・操作回数の記録先（None で記録しない）
+    """
+
+    def __init__(
+        self,
+        log=None,
+        max_workers=1,
+        template_cache=None,
+        variables=None,
+        copy_metadata=True,
+        zero_copy=True,
+        template_pack_path=None,
+        transactional=True,
+        incremental=False,
+        report=None,
+    ):
+        """
+        エンジンの初期化
+
+        Args:
+            log (callable): ログメッセージを受け取るコールバック
+            max_workers (int): ファイル作成の並列ワーカー数
+            template_cache (TemplateCache): テンプレート内容キャッシュ
+            variables (dict): テンプレート変数
+            copy_metadata (bool): 更新時刻をテンプレートに合わせるかどうか
+            zero_copy (bool): カーネル内コピーを使うかどうか
+            template_pack_path (str): テンプレートパックのパス
+            transactional (bool): 作成した項目をジャーナルに記録し、中断・致命的な
+                エラーの発生時に取り消すかどうか
+            incremental (bool): 対象フォルダに作成記録を保存し、再実行時に
+                テンプレートが変更された未編集のファイルを更新するかどうか
+            report (RunReport): 段階ごとの時間・操作回数の記録先
+        """
+        self.log = log or _null_log
+        self.max_workers = max(1, int(max_workers))
+        self.template_cache = template_cache
+        self.variables = dict(variables or {})
+        self.copy_metadata = copy_metadata
+        self.zero_copy = zero_copy
+        self.template_pack_path = template_pack_path
+        self.transactional = transactional
+        self.incremental = incremental
+        self.report = report
+        self.templates = TemplateLibrary()
+        self._template_digests = {}
+        self._template_digests_lock = threading.Lock()
+        self._executor = None
+        self._template_pack = None
+        self._template_pack_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config, log=None):
+        """
+        設定の performance / apply_settings セクションからエンジンを生成
+
+        Args:
+            config (dict): 設定情報辞書
+            log (callable): ログメッセージを受け取るコールバック
+
+        Returns:
+            FolderCreator: 作成エンジン
+        """
+        performance = config.get("performance", {})
+        apply_settings = config.get("apply_settings", {})
+        cache_mb = performance.get("template_cache_mb", 64)
+        template_cache = None
+        if cache_mb:
+            template_cache = TemplateCache(int(cache_mb * 1024 * 1024))
+        return cls(
+            log=log,
+            max_workers=performance.get("max_workers", 1),
+            template_cache=template_cache,
+            variables=config.get("variables", {}),
+            copy_metadata=performance.get("copy_metadata", True),
+            zero_copy=performance.get("zero_copy", True),
+            template_pack_path=config.get("template_pack") or None,
+            transactional=apply_settings.get("transactional", True),
+            incremental=apply_settings.get("incremental", False),
+        )
+
+    def close(self):
+        """ワーカープールを終了し、テンプレートパックを閉じる"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._template_pack_lock:
+            if self._template_pack is not None:
+                self._template_pack.close()
+                self._template_pack = None
+
+    def _phase(self, name):
+        """
+        段階の経過時間を記録するコンテキストマネージャーを取得
+
+        Args:
+            name (str): 段階名（report モジュールの PHASES 参照）
+
+        Returns:
+            contextmanager: report が設定されていない場合は何もしない
+        """
+        if self.report is None:
+            return nullcontext()
+        return self.report.phase(name)
+
+    def _count(self, name, amount=1):
+        """操作回数を記録（report が設定されていない場合は何もしない）"""
+        if self.report is not None:
+            self.report.count(name, amount)
+
+    def _get_template_pack(self):
+        """
+        テンプレートパックを取得（初回またはアーカイブ更新時に開き直す）
+
+        Returns:
+            TemplatePack or None: テンプレートパック。設定されていない場合は None
+
+        Raises:
+            TemplatePackError: アーカイブを開けない場合
+        """
+        if not self.template_pack_path:
+            return None
+        try:
+            archive_stat = os.stat(self.template_pack_path)
+        except OSError as e:
+            raise TemplatePackError(
+                f"テンプレートパック {self.template_pack_path} を開けません: {str(e)}"
+            ) from e
+        signature = (archive_stat.st_mtime_ns, archive_stat.st_size)
+        with self._template_pack_lock:
+            pack = self._template_pack
+            if pack is None or pack.signature != signature:
+                # 実行中の計画が古いパックを参照している可能性があるため閉じない
+                pack = TemplatePack(self.template_pack_path)
+                self._template_pack = pack
+            return pack
+
+    def _get_executor(self):
+        """
+        ファイル作成用のワーカープールを取得（初回呼び出し時に生成）
+
+        Returns:
+            ThreadPoolExecutor: ワーカープール
+        """
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="autonest"
+            )
+        return self._executor
+
+    def plan(self, folder_path, selected_folders, selected_files, index=None):
+        """
+        作成計画を構築（ファイルシステムへの書き込みは行わない）
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+            index (FileSystemIndex): 再利用するインデックス（省略可）
+
+        Returns:
+            ScaffoldPlan: 作成計画
+        """
+        try:
+            template_pack = self._get_template_pack()
+            pack_error = None
+        except TemplatePackError as e:
+            # パックなしで計画し、ファイルシステム上のテンプレートのみ使用する
+            template_pack = None
+            pack_error = str(e)
+        start = time.perf_counter()
+        scan_seconds = index.scan_seconds if index is not None else 0.0
+        scan_count = index.scan_count if index is not None else 0
+        plan = build_plan(
+            folder_path, selected_folders, selected_files, index, template_pack
+        )
+        if self.report is not None:
+            # 計画の時間のうちディレクトリの走査に使った時間を分けて記録する
+            scanned = plan.index.scan_seconds - scan_seconds
+            self.report.add_time("scan", scanned)
+            self.report.add_time("plan", time.perf_counter() - start - scanned)
+            self.report.count("scandir", plan.index.scan_count - scan_count)
+        if pack_error:
+            plan.errors.insert(0, pack_error)
+        if self.incremental:
+            with self._phase("manifest"):
+                self._plan_updates(plan)
+        return plan
+
+    def _plan_updates(self, plan):
+        """
+        作成記録と比較して、置き換える既存ファイルを計画に追加
+
+        記録時からテンプレートが変更されていて、かつ作成先が記録時から
+        編集されていないファイルのみを対象とする。記録のない既存ファイルは、
+        内容がテンプレートと同一の場合のみ記録に取り込む（次回以降の更新対象）。
+        異なる場合は記録外として記録し、次回以降は変更がなければ読み込まない。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+        """
+        manifest = ScaffoldManifest.load(plan.folder_path)
+        plan.manifest = manifest
+        for planned_file in plan.existing_planned:
+            # リンクはテンプレートの変更がそのまま反映されるため対象外
+            if planned_file.config.get("mode", MODE_COPY) != MODE_COPY:
+                continue
+            try:
+                digest = self._template_digest(plan, planned_file)
+                entry = manifest.get(planned_file.target_path)
+                if entry is None:
+                    self._adopt_existing(plan, planned_file, digest)
+                elif entry.get("template") != digest and manifest.is_unmodified(
+                    planned_file.target_path
+                ):
+                    planned_file.update = True
+                    plan.files_to_update.append(planned_file)
+            except OSError as e:
+                plan.errors.append(
+                    f"{planned_file.name}: 更新の確認に失敗しました - {str(e)}"
+                )
+        if plan.files_to_update:
+            # 置き換えるファイルは既存スキップとして扱わない
+            updated = {planned_file.name for planned_file in plan.files_to_update}
+            plan.existing_files = [
+                name for name in plan.existing_files if name not in updated
+            ]
+
+    def _adopt_existing(self, plan, planned_file, digest):
+        """
+        作成記録のない既存ファイルをテンプレートと比較して記録
+
+        内容が同一の場合は作成記録に取り込み、異なる場合は記録外のファイルと
+        して stat とともに記録する。記録外のファイルは、テンプレートと作成先の
+        サイズ・更新時刻が変わらない限り次回以降は内容を読まない。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            planned_file (PlannedFile): 作成先が既に存在するファイル
+            digest (str): テンプレート内容のハッシュ
+        """
+        target_path = planned_file.target_path
+        manifest = plan.manifest
+        if planned_file.config.get("render") or manifest.is_known_unmanaged(
+            target_path, digest
+        ):
+            return
+        if digest == hash_file(os.path.join(plan.folder_path, target_path)):
+            manifest.record(target_path, digest, digest)
+        else:
+            manifest.record_unmanaged(target_path, digest)
+
+    def _template_digest(self, plan, planned_file):
+        """
+        テンプレート内容のハッシュを取得（テンプレートごとに1回だけ計算）
+
+        計算結果はエンジンに保持し、複数の作成先・対象フォルダで共有する。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            planned_file (PlannedFile): 作成予定のファイル
+
+        Returns:
+            str: 16進数のハッシュ値
+        """
+        member = planned_file.pack_member
+        template_stat = planned_file.template_stat
+        key = (
+            planned_file.template_path if member is None else member.cache_key,
+            template_stat.st_mtime_ns,
+            template_stat.st_size,
+        )
+        with self._template_digests_lock:
+            digest = self._template_digests.get(key)
+        if digest is None:
+            self._count("hash")
+            # 大きいテンプレートでもメモリに読み込まずに計算する
+            if member is None:
+                digest = hash_file(planned_file.template_path)
+            else:
+                digest = plan.template_pack.hash(member)
+            with self._template_digests_lock:
+                self._template_digests[key] = digest
+        return digest
+
+    def execute(
+        self,
+        folder_path,
+        selected_folders,
+        selected_files,
+        progress=None,
+        cancel_event=None,
+    ):
+        """
+        フォルダ・ファイル作成処理を実行
+
+        計画を構築してログに出力した後、必要な項目のみを作成する。
+        中断は項目と項目の間でのみ行われるため、作成途中のファイルが
+        残ることはない。transactional が True の場合、中断時と致命的な
+        エラー（フォルダ作成の失敗・容量不足など）の発生時は、この処理で
+        作成した項目をすべて取り消す。
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+            progress (callable): ProgressEvent を受け取るコールバック
+            cancel_event (threading.Event): セットされると処理を中断する
+
+        Returns:
+            CreationResult: 作成処理結果
+        """
+        # 処理開始ログ
+        self.log("=" * 50)
+        self.log("フォルダ・ファイル作成処理開始")
+        self.log(f"対象フォルダ: {folder_path}")
+        self.log(
+            f"作成対象: フォルダ{len(selected_folders)}個, ファイル{len(selected_files)}個"
+        )
+        self.log("-" * 30)
+
+        plan = self.plan(folder_path, selected_folders, selected_files)
+        self.log_plan(plan)
+        result = self.apply(plan, progress, cancel_event)
+        self.log_summary(result)
+        return result
+
+    def log_plan(self, plan):
+        """
+        作成計画の内容をログに出力
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+        """
+        if plan.folder_entries:
+            self.log("📁 フォルダ構造チェック中...")
+            for folder, status in plan.folder_entries:
+                if status == STATUS_EXISTING:
+                    self.log(f"⚠️  既存フォルダ: {folder}")
+                elif status == STATUS_NEW:
+                    self.log(f"📁 フォルダ作成予定: {folder}")
+
+        if plan.file_entries:
+            self.log("-" * 30)
+            self.log("📄 ファイル構造チェック中...")
+            for _, target_path, status in plan.file_entries:
+                if status == STATUS_EXISTING:
+                    self.log(f"⚠️  既存ファイル: {target_path}")
+                elif status == STATUS_NEW:
+                    self.log(f"📄 ファイル作成予定: {target_path}")
+            for planned_file in plan.files_to_update:
+                self.log(f"🔄 ファイル更新予定: {planned_file.target_path}")
+
+        # 計画時エラーの表示
+        if plan.errors:
+            self.log("-" * 30)
+            self.log("🚨 ファイルエラー:")
+            for error in plan.errors:
+                self.log(f"   ❌ {error}")
+
+    def apply(self, plan, progress=None, cancel_event=None):
+        """
+        作成計画を実行
+
+        ディレクトリは親から順に os.mkdir で作成するため、存在確認の
+        システムコールは発生しない。max_workers が 2 以上の場合は
+        同じ階層のディレクトリ作成とファイルコピーを並列に行う。
+
+        transactional が True の場合は作成した項目を対象フォルダ直下の
+        ジャーナルに記録し、中断または致命的なエラー（フォルダ作成の
+        失敗・容量不足など）が発生した時点で記録を逆順にたどって取り消す。
+        ファイルごとのエラーや計画時のエラー（テンプレートが見つからない
+        など）では取り消さず、他の項目を作成してエラーとして報告する。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            progress (callable): ProgressEvent を受け取るコールバック
+            cancel_event (threading.Event): セットされると処理を中断する
+
+        Returns:
+            CreationResult: 作成処理結果
+        """
+        run = self.start_apply(plan, progress, cancel_event)
+        if run.ready:
+            try:
+                self._apply_items(run)
+            except Exception as e:
+                run.fail(e)
+        return run.finish()
+
+    def start_apply(self, plan, progress=None, cancel_event=None):
+        """
+        作成処理を開始（結果・進捗状態を準備し、ジャーナルを開く）
+
+        項目の作成は返された ApplyRun の手順で行う。apply を使わずに
+        作成処理の実行方法を変える場合（aio モジュールなど）に利用する。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            progress (callable): ProgressEvent を受け取るコールバック
+            cancel_event (threading.Event): セットされると処理を中断する
+
+        Returns:
+            ApplyRun: 作成処理。前回のジャーナルが残っていて作成できない場合、
+                ready が False になる
+        """
+        result = CreationResult()
+        result.existing_folders = list(plan.existing_folders)
+        result.existing_files = list(plan.existing_files)
+        result.file_errors = list(plan.errors)
+
+        journal = None
+        if self.transactional and plan.pending_items + len(plan.dirs_to_create):
+            try:
+                journal = Journal(plan.folder_path)
+            except JournalError as e:
+                # 前回の記録を上書きすると取り消せなくなるため何も作成しない
+                self.log(f"❌ {str(e)}")
+                result.file_errors.append(str(e))
+                return ApplyRun(self, plan, result, None)
+
+        variables = builtin_variables(plan.folder_path)
+        variables.update(self.variables)
+        context = _RunContext(
+            plan.total_items, progress, cancel_event, variables, journal
+        )
+        context.done = plan.total_items - plan.pending_items
+        if plan.manifest is not None:
+            context.outputs = {}
+
+        if plan.dirs_to_create or plan.files_to_create or plan.files_to_update:
+            self.log("🔨 作成開始...")
+        return ApplyRun(self, plan, result, context)
+
+    def _save_manifest(self, plan, context, result):
+        """
+        作成・更新したファイルを作成記録に追加して保存
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            context (_RunContext): 進捗・中断状態
+            result (CreationResult): 作成処理結果
+        """
+        try:
+            for target_path, digests in context.outputs.items():
+                plan.manifest.record(target_path, *digests)
+            plan.manifest.save()
+        except OSError as e:
+            self.log(f"❌ 作成記録を保存できません: {str(e)}")
+            result.file_errors.append(f"作成記録を保存できません - {str(e)}")
+
+    def _apply_items(self, run):
+        """
+        計画されたディレクトリ・ファイルを作成
+
+        Args:
+            run (ApplyRun): 作成処理
+        """
+        # ディレクトリ作成（同じ階層ごとにまとめて実行）
+        with run.phase("mkdir"):
+            for level in run.dir_levels():
+                if run.stopped:
+                    break
+                run.add_dir_outcomes(self._run_tasks(run.create_dir, level))
+            run.flush_journal()
+
+        if not run.stopped:
+            files = run.file_order()
+            with run.phase("copy"):
+                outcomes = self._run_tasks(run.create_file, files)
+            run.add_file_outcomes(files, outcomes)
+
+    def _rollback(self, journal, result):
+        """
+        ジャーナルに記録した項目を取り消し、結果に反映
+
+        Args:
+            journal (Journal): 今回の作成処理のジャーナル
+            result (CreationResult): 作成処理結果
+        """
+        self.log("↩️ 作成した項目を取り消しています...")
+        with self._phase("rollback"):
+            rollback = journal.rollback(self.log)
+        result.rolled_back = True
+        result.rolled_back_count = rollback.removed_count
+        result.folder_created_count = 0
+        result.file_created_count = 0
+        result.file_updated_count = 0
+        result.bytes_copied = 0
+        result.file_errors.extend(rollback.errors)
+
+    def verify(self, plan, progress=None, cancel_event=None):
+        """
+        既存の作成先がテンプレートと同一かどうかを検証（何も変更しない）
+
+        フォルダは存在すれば同一とみなす。ファイルはサイズ・更新時刻・
+        作成記録による判定を先に行い、判定できない場合のみ内容のハッシュを
+        比較する（verify モジュール参照）。max_workers が 2 以上の場合は
+        ファイルの比較を並列に行う。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            progress (callable): ProgressEvent を受け取るコールバック
+            cancel_event (threading.Event): セットされると処理を中断する
+
+        Returns:
+            VerifyResult: 検証結果
+        """
+        result = VerifyResult(plan.folder_path)
+        result.errors = list(plan.errors)
+        manifest = plan.manifest or ScaffoldManifest.load(plan.folder_path)
+        variables = builtin_variables(plan.folder_path)
+        variables.update(self.variables)
+        context = _RunContext(
+            len(plan.existing_planned), progress, cancel_event, variables
+        )
+
+        statuses = {}
+        for planned_file in plan.files_to_create:
+            statuses[planned_file.target_path] = MISSING
+        with self._phase("verify"):
+            outcomes = self._run_tasks(
+                lambda planned_file: self._verify_file(
+                    plan, planned_file, context, manifest
+                ),
+                plan.existing_planned,
+            )
+        for planned_file, outcome in zip(plan.existing_planned, outcomes):
+            if outcome in (IDENTICAL, DIFFERS, MISSING):
+                statuses[planned_file.target_path] = outcome
+            elif outcome:
+                result.errors.append(outcome)
+
+        for folder, status in plan.folder_entries:
+            if status == STATUS_EXISTING:
+                result.entries.append((folder, IDENTICAL))
+            elif status == STATUS_NEW:
+                result.entries.append((folder, MISSING))
+        for _, target_path, status in plan.file_entries:
+            if status == STATUS_CONFLICT:
+                result.entries.append((target_path, DIFFERS))
+                continue
+            outcome = statuses.get(normalize_relpath(target_path))
+            if outcome is not None:
+                result.entries.append((target_path, outcome))
+        result.cancelled = context.cancelled
+        return result
+
+    def _verify_file(self, plan, planned_file, context, manifest):
+        """
+        既存の作成先1ファイルを検証
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            planned_file (PlannedFile): 作成先が存在するファイル
+            context (_RunContext): 進捗・中断状態
+            manifest (ScaffoldManifest): 対象フォルダの作成記録
+
+        Returns:
+            str or None: IDENTICAL / DIFFERS / MISSING、エラー時はエラーメッセージ、
+                中断によりスキップした場合は None
+        """
+        if context.stopped:
+            return None
+        target_path = planned_file.target_path
+        try:
+            if planned_file.config.get("render"):
+                rendered = self._render(plan, planned_file, context.variables)
+                outcome = compare_file(
+                    os.path.join(plan.folder_path, target_path),
+                    len(rendered),
+                    lambda: hash_bytes(rendered),
+                    manifest_entry=manifest.get(target_path),
+                )
+            else:
+                outcome = compare_file(
+                    os.path.join(plan.folder_path, target_path),
+                    planned_file.template_size,
+                    lambda: self._template_digest(plan, planned_file),
+                    None if planned_file.pack_member else planned_file.template_path,
+                    planned_file.template_stat,
+                    manifest.get(target_path),
+                )
+        except Exception as e:
+            outcome = f"{planned_file.name}: 検証エラー - {str(e)}"
+        context.advance(target_path)
+        return outcome
+
+    def _run_tasks(self, func, items):
+        """
+        項目ごとの処理を逐次またはワーカープールで実行
+
+        Args:
+            func (callable): func(item) 形式の処理関数
+            items (list): 処理対象項目リスト
+
+        Returns:
+            list: 各項目の処理結果（投入順）
+        """
+        if self.max_workers > 1 and len(items) > 1:
+            executor = self._get_executor()
+            futures = [executor.submit(func, item) for item in items]
+            # 例外は全タスクの終了を待ってから送出する（ロールバック中に
+            # 他のワーカーが項目を作成しないようにするため）
+            outcomes = []
+            error = None
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    error = error or e
+            if error is not None:
+                raise error
+            return outcomes
+        return [func(item) for item in items]
+
+    def _create_dir(self, plan, rel_path, context):
+        """
+        計画されたディレクトリを1つ作成
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            rel_path (str): 正規化済み相対パス
+            context (_RunContext): 進捗・中断状態
+
+        Returns:
+            bool: 選択されたフォルダを作成した場合は True
+        """
+        if context.stopped:
+            return False
+        try:
+            os.mkdir(os.path.join(plan.folder_path, rel_path))
+        except OSError:
+            context.fail()
+            raise
+        self._count("mkdir")
+        context.record(DIR, rel_path)
+        plan.index.mark_created(rel_path, DIR)
+        if rel_path in plan.explicit_dirs:
+            self.log(f"✅ フォルダ作成完了: {rel_path}")
+            context.advance(rel_path)
+            return True
+        self.log(f"📁 ディレクトリ作成: {rel_path}")
+        return False
+
+    def _create_file(self, plan, planned_file, context):
+        """
+        テンプレートから1ファイルを作成
+
+        既存ファイルを置き換える場合（planned_file.update）は元のファイルを
+        退避してから作成し、失敗した場合は元に戻す。ジャーナルに記録している
+        場合、退避したファイルは作成処理全体の完了時に削除される。
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            planned_file (PlannedFile): 作成予定のファイル
+            context (_RunContext): 進捗・中断状態
+
+        Returns:
+            bool or str or None: 作成成功時は True、エラー時はエラーメッセージ、
+                中断・他の項目のエラーによりスキップした場合は None
+        """
+        if context.stopped:
+            return None
+
+        target_path = planned_file.target_path
+        file_config = planned_file.config
+        full_target_path = os.path.join(plan.folder_path, target_path)
+        backup_path = None
+        start = time.perf_counter()
+        try:
+            if planned_file.update:
+                os.replace(full_target_path, full_target_path + BACKUP_SUFFIX)
+                backup_path = full_target_path + BACKUP_SUFFIX
+                context.record(UPDATE, target_path)
+            rendered = None
+            if file_config.get("render"):
+                # 変数を置換して書き込む（解析済みテンプレートを再利用）
+                rendered = self._render(plan, planned_file, context.variables)
+                self._write_bytes(
+                    full_target_path, rendered, planned_file.template_stat, False
+                )
+                written = len(rendered)
+                operation = "render"
+            elif self._link_file(planned_file, full_target_path):
+                # リンクは内容を書き込まないためコピー量に含めない
+                written = 0
+                operation = planned_file.config["mode"]
+            else:
+                data = None
+                cache_key, loader = self._template_source(plan, planned_file)
+                if self.template_cache is not None:
+                    data = self.template_cache.get(
+                        cache_key, planned_file.template_stat, loader
+                    )
+                if data is not None:
+                    # キャッシュ済みの内容をメモリから書き込む
+                    self._write_bytes(
+                        full_target_path,
+                        data,
+                        planned_file.template_stat,
+                        self.copy_metadata,
+                    )
+                    operation = "write_cached"
+                elif planned_file.pack_member is not None:
+                    # パックのメンバーを作成先へ直接書き出す
+                    plan.template_pack.extract(
+                        planned_file.pack_member, full_target_path, self.copy_metadata
+                    )
+                    operation = "pack_extract"
+                else:
+                    # キャッシュ対象外（大きいテンプレートなど）はカーネル内でコピー
+                    operation = "copy." + copy_file(
+                        planned_file.template_path,
+                        full_target_path,
+                        planned_file.template_stat,
+                        copy_metadata=self.copy_metadata,
+                        zero_copy=self.zero_copy,
+                    )
+                written = planned_file.template_size
+            if context.outputs is not None:
+                template_digest = self._template_digest(plan, planned_file)
+                output_digest = template_digest
+                if rendered is not None:
+                    output_digest = hash_bytes(rendered)
+                context.outputs[target_path] = (template_digest, output_digest)
+            if self.report is not None:
+                self.report.count(operation)
+                self.report.count("bytes_written", written)
+                self.report.item(target_path, time.perf_counter() - start, written)
+            if planned_file.update:
+                if context.journal is None:
+                    os.remove(backup_path)
+                self._count("update")
+                self.log(f"🔄 ファイル更新完了: {target_path}")
+            else:
+                context.record(FILE, target_path)
+                plan.index.mark_created(target_path, FILE)
+                self.log(f"✅ ファイル作成完了: {target_path}")
+            context.advance(target_path, written)
+            return True
+        except Exception as e:
+            self.log(f"❌ ファイル作成エラー: {planned_file.name} - {str(e)}")
+            if backup_path is not None:
+                try:
+                    os.replace(backup_path, full_target_path)
+                except OSError:
+                    pass
+            self._count("errors")
+            if getattr(e, "errno", None) in _FATAL_ERRNOS:
+                # 容量不足では残りの項目も作成できないため全体を取り消す
+                context.fail()
+            context.advance(target_path)
+            return f"{planned_file.name}: ファイル作成エラー - {str(e)}"
+
+    def _render(self, plan, planned_file, variables):
+        """
+        render 指定のファイルの内容を生成
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            planned_file (PlannedFile): 作成予定のファイル
+            variables (dict): テンプレート変数
+
+        Returns:
+            bytes: 変数を置換した内容（encoding 指定で符号化済み）
+        """
+        encoding = planned_file.config.get("encoding", "utf-8")
+        cache_key, loader = self._template_source(plan, planned_file)
+        compiled = self.templates.get(
+            cache_key,
+            planned_file.template_stat,
+            encoding,
+            self.template_cache,
+            loader,
+        )
+        return compiled.render(variables).encode(encoding)
+
+    def _link_file(self, planned_file, full_target_path):
+        """
+        mode 指定（hardlink / symlink）に従ってリンクを作成
+
+        Args:
+            planned_file (PlannedFile): 作成予定のファイル
+            full_target_path (str): 作成先の絶対パス
+
+        Returns:
+            bool: リンクを作成した場合は True。mode が copy の場合、または
+                リンクを作成できずコピーに切り替える場合は False
+        """
+        mode = planned_file.config.get("mode", MODE_COPY)
+        if mode == MODE_COPY:
+            return False
+        if planned_file.pack_member is None and link_file(
+            planned_file.template_path, full_target_path, mode
+        ):
+            return True
+        self.log(
+            f"↪️ {mode} を作成できないためコピーします: {planned_file.target_path}"
+        )
+        return False
+
+    @staticmethod
+    def _template_source(plan, planned_file):
+        """
+        テンプレート内容のキャッシュキーと読み込み関数を取得
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+            planned_file (PlannedFile): 作成予定のファイル
+
+        Returns:
+            tuple: (キャッシュキー, 読み込み関数)。ファイルシステム上の
+                テンプレートの場合はパスと None
+        """
+        member = planned_file.pack_member
+        if member is None:
+            return planned_file.template_path, None
+        return member.cache_key, lambda: plan.template_pack.read(member)
+
+    @staticmethod
+    def _write_bytes(full_target_path, data, template_stat, copy_times=True):
+        """
+        メモリ上のテンプレート内容をファイルに書き込む
+
+        パーミッション（copy_times が True の場合は更新時刻も）をテンプレートに合わせる。
+        既存ファイルを誤って上書きしないよう排他モードで作成する。
+
+        Args:
+            full_target_path (str): 作成先の絶対パス
+            data (bytes): 書き込む内容
+            template_stat (os.stat_result): テンプレートの stat
+            copy_times (bool): 更新時刻もテンプレートに合わせるかどうか
+                （変数置換で内容が変わる場合は False）
+        """
+        with open(full_target_path, "xb") as f:
+            try:
+                f.write(data)
+            except BaseException:
+                remove_partial(f, full_target_path)
+                raise
+        os.chmod(full_target_path, stat.S_IMODE(template_stat.st_mode))
+        if copy_times:
+            os.utime(
+                full_target_path,
+                ns=(template_stat.st_atime_ns, template_stat.st_mtime_ns),
+            )
+
+    def log_summary(self, result):
+        """
+        作成処理完了結果をログに出力
+
+        Args:
+            result (CreationResult): 作成処理結果
+        """
+        self.log("-" * 30)
+        if result.rolled_back:
+            reason = "中断" if result.cancelled else "エラー"
+            self.log(
+                f"↩️ {reason}のため作成した項目を取り消しました"
+                f"（{result.rolled_back_count}個削除）"
+            )
+        elif result.cancelled:
+            self.log("⏹️ 処理が中断されました（作成済みの項目はそのまま残ります）")
+        self.log(
+            f"🎉 【完了】フォルダ新規作成: {result.folder_created_count}個, "
+            f"ファイル新規作成: {result.file_created_count}個"
+        )
+        if result.file_updated_count:
+            self.log(f"🔄 テンプレート更新の反映: ファイル{result.file_updated_count}個")
+        if result.existing_folders or result.existing_files:
+            self.log(
+                f"⚠️ 既存スキップ: フォルダ{len(result.existing_folders)}個, "
+                f"ファイル{len(result.existing_files)}個"
+            )
+        self.log("=" * 50)
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 高速ファイルコピーモジュール
+
+テンプレートをカーネル内でコピーし、Python のバッファを経由した
+読み書きを避ける。次の順に試し、使用できない場合は通常のコピーに戻る。
+
+1. reflink（FICLONE ioctl、btrfs / XFS などでデータブロックを共有）
+2. os.copy_file_range（Linux、同一ファイルシステム内ではサーバー側コピー）
+3. os.sendfile（Linux）
+4. 1MB 単位のバッファコピー
+
+一度失敗した方式は (コピー元デバイス, コピー先デバイス) の組ごとに記録し、
+以降のファイルでは試さない。
+
+編集されることのない大きなテンプレート向けに、コピーの代わりに
+ハードリンク・シンボリックリンクを作成する link_file も提供する。
+"""
+
+import errno
+import os
+import shutil
+import stat
+import sys
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# linux/fs.h: #define FICLONE _IOW(0x94, 9, int)
+FICLONE = 0x40049409
+
+MODE_COPY = "copy"
+MODE_HARDLINK = "hardlink"
+MODE_SYMLINK = "symlink"
+FILE_MODES = (MODE_COPY, MODE_HARDLINK, MODE_SYMLINK)
+
+METHOD_REFLINK = "reflink"
+METHOD_COPY_FILE_RANGE = "copy_file_range"
+METHOD_SENDFILE = "sendfile"
+METHOD_BUFFERED = "buffered"
+
+_BUFFER_SIZE = 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024 * 1024  # copy_file_range / sendfile の1回あたりの上限
+
+# この方式が使えないことを示すエラー（他の方式で再試行する）
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTTY,
+    errno.EBADF,
+    errno.EOPNOTSUPP,
+    getattr(errno, "ENOTSUP", errno.EOPNOTSUPP),
+    getattr(errno, "ENOTSOCK", errno.EINVAL),
+}
+
+_unsupported = set()  # (方式, コピー元デバイス, コピー先デバイス)
+_unsupported_lock = threading.Lock()
+
+
+def _is_supported(method, devices):
+    """指定方式がこのデバイスの組で使用可能と見込まれるかどうか"""
+    return (method,) + devices not in _unsupported
+
+
+def _mark_unsupported(method, devices):
+    """指定方式をこのデバイスの組で使用しないよう記録"""
+    with _unsupported_lock:
+        _unsupported.add((method,) + devices)
+
+
+def _reflink(src_fd, dst_fd, size):
+    """FICLONE でデータブロックを共有する"""
+    fcntl.ioctl(dst_fd, FICLONE, src_fd)
+
+
+def _copy_file_range(src_fd, dst_fd, size):
+    """copy_file_range でカーネル内コピーする"""
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(
+            src_fd, dst_fd, min(size - offset, _CHUNK_SIZE), offset, offset
+        )
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+def _sendfile(src_fd, dst_fd, size):
+    """sendfile でカーネル内コピーする"""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, min(size - offset, _CHUNK_SIZE))
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def _zero_copy_methods():
+    """この環境で試す高速コピー方式の一覧（優先順）"""
+    methods = []
+    if fcntl is not None and sys.platform.startswith("linux"):
+        methods.append((METHOD_REFLINK, _reflink))
+    if hasattr(os, "copy_file_range"):
+        methods.append((METHOD_COPY_FILE_RANGE, _copy_file_range))
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        methods.append((METHOD_SENDFILE, _sendfile))
+    return methods
+
+
+_ZERO_COPY_METHODS = _zero_copy_methods()
+
+
+def copy_file(src, dst, src_stat=None, copy_metadata=True, zero_copy=True):
+    """
+    ファイルをコピー
+
+    既存ファイルを誤って上書きしないよう、コピー先は排他モードで作成する。
+    パーミッションは常にコピー元に合わせ、copy_metadata が True の場合は
+    更新時刻も合わせる（shutil.copy2 相当）。
+
+    Args:
+        src (str): コピー元ファイルパス
+        dst (str): コピー先ファイルパス
+        src_stat (os.stat_result): コピー元の stat（省略時は取得する）
+        copy_metadata (bool): 更新時刻もコピー元に合わせるかどうか
+        zero_copy (bool): カーネル内コピー（reflink など）を試すかどうか
+
+    Returns:
+        str: 使用したコピー方式（METHOD_* のいずれか）
+    """
+    with open(src, "rb") as fsrc:
+        if src_stat is None:
+            src_stat = os.fstat(fsrc.fileno())
+        with open(dst, "xb") as fdst:
+            try:
+                method = _copy_contents(fsrc, fdst, src_stat, zero_copy)
+            except BaseException:
+                remove_partial(fdst, dst)
+                raise
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    if copy_metadata:
+        os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    return method
+
+
+def remove_partial(file, path):
+    """
+    書き込み途中で失敗したファイルを閉じて削除する
+
+    排他モードで作成した直後のファイルにのみ使用する（既存ファイルを
+    削除しないため）。削除できない場合は何もしない。
+
+    Args:
+        file (file): 書き込み中のファイルオブジェクト
+        path (str): ファイルパス
+    """
+    try:
+        # Windows では開いたままのファイルを削除できないため先に閉じる
+        file.close()
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _copy_contents(fsrc, fdst, src_stat, zero_copy):
+    """
+    開いたファイル間で内容をコピー
+
+    Args:
+        fsrc (file): コピー元（バイナリ読み込み）
+        fdst (file): コピー先（バイナリ書き込み、空）
+        src_stat (os.stat_result): コピー元の stat
+        zero_copy (bool): カーネル内コピーを試すかどうか
+
+    Returns:
+        str: 使用したコピー方式
+    """
+    size = src_stat.st_size
+    if zero_copy and size > 0:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        devices = (src_stat.st_dev, os.fstat(dst_fd).st_dev)
+        for method, func in _ZERO_COPY_METHODS:
+            if not _is_supported(method, devices):
+                continue
+            try:
+                copied = func(src_fd, dst_fd, size)
+            except OSError as e:
+                if e.errno not in _UNSUPPORTED_ERRNOS:
+                    raise
+                _mark_unsupported(method, devices)
+                # 途中まで書き込まれている可能性があるため先頭からやり直す
+                fdst.seek(0)
+                fdst.truncate()
+                continue
+            if copied is not None and copied < size:
+                # コピー中にファイルが縮んだ場合など。残りは通常コピーで補う
+                fsrc.seek(copied)
+                fdst.seek(copied)
+                shutil.copyfileobj(fsrc, fdst, _BUFFER_SIZE)
+            return method
+
+    shutil.copyfileobj(fsrc, fdst, _BUFFER_SIZE)
+    return METHOD_BUFFERED
+
+
+def link_file(src, dst, mode):
+    """
+    コピーの代わりにリンクを作成
+
+    ハードリンクはコピー元と同じファイルシステム上でのみ作成できる。
+    シンボリックリンクはコピー元の絶対パスを指す（Windows では
+    権限によって作成できない場合がある）。
+
+    Args:
+        src (str): リンク元（テンプレート）ファイルパス
+        dst (str): 作成するリンクのパス
+        mode (str): MODE_HARDLINK または MODE_SYMLINK
+
+    Returns:
+        bool: リンクを作成できた場合は True。デバイスが異なる・権限がない
+            などで作成できない場合は False（呼び出し側でコピーに切り替える）
+
+    Raises:
+        FileExistsError: リンクの作成先が既に存在する場合
+    """
+    try:
+        if mode == MODE_HARDLINK:
+            os.link(src, dst)
+        else:
+            os.symlink(os.path.abspath(src), dst)
+    except FileExistsError:
+        raise
+    except (OSError, NotImplementedError):
+        return False
+    return True
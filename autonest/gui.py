@@ -0,0 +1,1494 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest GUI モジュール
+
+tkinter による GUI（フォルダ・ファイル選択、プレビュー、ログ表示）を提供する。
+tkinter の読み込みには時間がかかるため、このモジュールはウィンドウを
+作成する時点で初めて import される（advanced_folder_creator.py 参照）。
+"""
+
+import os
+import queue
+import threading
+import time
+import tkinter as tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import filedialog, font, messagebox, ttk
+
+from .batch import BatchResult, expand_targets, run_batch, run_batch_processes
+from .config import PROFILES_DIR, ConfigError, load_config
+from .engine import FolderCreator
+from .journal import discard_pending, has_pending_journal, rollback_pending
+from .plan import FileSystemIndex
+from .profiles import ProfileLibrary
+from .report import RunReport
+from .verify import VerifyResult
+
+
+# プロファイル選択欄で config.json の構成を表す項目
+_BASE_PROFILE_LABEL = "（config.json）"
+
+
+class CheckList:
+    """
+    ttk.Treeview ベースの仮想化チェックボックスリスト
+
+    項目ごとに Checkbutton や BooleanVar を作らず、選択状態は集合で保持する。
+    ツリービューには表示領域に収まる行数分の行だけを作成し、スクロール時は
+    その行の表示テキストを差し替える。そのため、項目数が多くてもウィジェット
+    数・メモリ使用量・ウィンドウ構築時間は増えない。絞り込み入力欄を備える。
+
+    Attributes:
+        frame (ttk.Frame): リスト全体を含むフレーム
+        tree (ttk.Treeview): 項目を表示するツリービュー
+    """
+
+    CHECKED = "☑"
+    UNCHECKED = "☐"
+
+    def __init__(self, parent, keys, on_change=None, height=4):
+        """
+        チェックリストの初期化
+
+        Args:
+            parent: 親ウィジェット
+            keys (list): 項目名リスト（表示順）
+            on_change (callable): 選択状態が変わった際に呼ばれるコールバック
+            height (int): 表示行数（ウィンドウの大きさに合わせて増減する）
+        """
+        self._on_change = on_change
+        self._keys = []
+        self._checked = set()
+        self._visible = []  # 絞り込み後に表示する項目の位置
+        self._offset = 0  # 先頭行に表示している _visible の位置
+        self._rows = []  # ツリービューの行 ID（表示行数分のみ）
+
+        self.frame = ttk.Frame(parent)
+        self.frame.columnconfigure(1, weight=1)
+        self.frame.rowconfigure(1, weight=1)
+
+        # 絞り込み入力欄
+        ttk.Label(self.frame, text="絞り込み:").grid(
+            row=0, column=0, sticky=tk.W, padx=(0, 5), pady=(0, 5)
+        )
+        self._filter_var = tk.StringVar()
+        self._filter_var.trace_add("write", lambda *args: self._apply_filter())
+        filter_entry = ttk.Entry(self.frame, textvariable=self._filter_var)
+        filter_entry.grid(
+            row=0, column=1, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 5)
+        )
+
+        # 項目リスト（スクロールは行の差し替えで行う）
+        self.tree = ttk.Treeview(
+            self.frame, show="tree", selectmode="browse", height=height
+        )
+        self._scrollbar = ttk.Scrollbar(
+            self.frame, orient=tk.VERTICAL, command=self._on_scrollbar
+        )
+        self.tree.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self._scrollbar.grid(row=1, column=2, sticky=(tk.N, tk.S))
+        self._resize_rows(height)
+
+        self.tree.bind("<Button-1>", self._on_click)
+        self.tree.bind("<space>", self._on_space)
+        self.tree.bind("<Up>", lambda event: self._move_focus(-1))
+        self.tree.bind("<Down>", lambda event: self._move_focus(1))
+        self.tree.bind("<Prior>", lambda event: self._scroll(-len(self._rows)))
+        self.tree.bind("<Next>", lambda event: self._scroll(len(self._rows)))
+        self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tree.bind("<Button-4>", lambda event: self._scroll(-3))
+        self.tree.bind("<Button-5>", lambda event: self._scroll(3))
+        self.tree.bind("<Configure>", self._on_configure)
+
+        self.set_items(keys)
+
+    def set_items(self, keys, checked=True):
+        """
+        表示項目を置き換える
+
+        Args:
+            keys (list): 項目名リスト（表示順）
+            checked (bool): 初期状態で選択するかどうか
+        """
+        self._keys = list(keys)
+        self._checked = set(self._keys) if checked else set()
+        self._apply_filter()
+
+    def checked_keys(self):
+        """
+        選択されている項目を表示順で取得
+
+        Returns:
+            list: 選択項目名リスト
+        """
+        return [key for key in self._keys if key in self._checked]
+
+    def set_all(self, value):
+        """
+        全項目の選択状態を一括で変更
+
+        Args:
+            value (bool): 選択する場合は True
+        """
+        self._checked = set(self._keys) if value else set()
+        self._render()
+        self._notify()
+
+    def toggle(self, position):
+        """
+        項目の選択状態を反転
+
+        Args:
+            position (int): 項目の位置
+        """
+        key = self._keys[position]
+        if key in self._checked:
+            self._checked.discard(key)
+        else:
+            self._checked.add(key)
+        self._render()
+        self._notify()
+
+    def _row_text(self, position):
+        """行の表示テキストを生成"""
+        key = self._keys[position]
+        mark = self.CHECKED if key in self._checked else self.UNCHECKED
+        return f"{mark} {key}"
+
+    def _apply_filter(self):
+        """絞り込み文字列に一致する項目だけを表示し直す"""
+        text = self._filter_var.get().strip().lower()
+        if text:
+            self._visible = [
+                i for i, key in enumerate(self._keys) if text in key.lower()
+            ]
+        else:
+            self._visible = range(len(self._keys))
+        self._offset = 0
+        self._render()
+
+    def _resize_rows(self, count):
+        """
+        ツリービューの行数を表示行数に合わせて増減
+
+        Args:
+            count (int): 表示行数
+        """
+        count = max(1, count)
+        while len(self._rows) < count:
+            self._rows.append(self.tree.insert("", tk.END, text=""))
+        if len(self._rows) > count:
+            self.tree.delete(*self._rows[count:])
+            del self._rows[count:]
+
+    def _render(self):
+        """先頭位置から表示行数分の項目を行に表示し、スクロールバーを更新"""
+        total = len(self._visible)
+        self._offset = max(0, min(self._offset, total - len(self._rows)))
+        for index, row in enumerate(self._rows):
+            visible_index = self._offset + index
+            if visible_index < total:
+                self.tree.item(row, text=self._row_text(self._visible[visible_index]))
+            else:
+                self.tree.item(row, text="")
+        if total:
+            first = self._offset / total
+            last = min(1.0, (self._offset + len(self._rows)) / total)
+        else:
+            first, last = 0.0, 1.0
+        self._scrollbar.set(first, last)
+
+    def _position_of(self, row):
+        """
+        行に表示している項目の位置を取得
+
+        Args:
+            row (str): ツリービューの行 ID
+
+        Returns:
+            int or None: 項目の位置（空行の場合は None）
+        """
+        if row not in self._rows:
+            return None
+        visible_index = self._offset + self._rows.index(row)
+        if visible_index >= len(self._visible):
+            return None
+        return self._visible[visible_index]
+
+    def _scroll(self, amount):
+        """
+        表示位置を行単位でずらす
+
+        Args:
+            amount (int): ずらす行数（負の値で上へ）
+        """
+        self._offset += amount
+        self._render()
+        return "break"
+
+    def _on_scrollbar(self, command, *args):
+        """スクロールバーの操作（moveto / scroll）を表示位置に反映"""
+        if command == "moveto":
+            self._offset = int(float(args[0]) * len(self._visible))
+            self._render()
+        elif command == "scroll":
+            amount = int(args[0])
+            if args[1] == "pages":
+                amount *= len(self._rows)
+            self._scroll(amount)
+
+    def _on_mouse_wheel(self, event):
+        """マウスホイールで3行ずつスクロール（Windows / macOS）"""
+        return self._scroll(-3 if event.delta > 0 else 3)
+
+    def _row_height(self):
+        """ツリービューの1行の高さ（ピクセル）を取得"""
+        bbox = self.tree.bbox(self._rows[0])
+        if bbox:
+            return bbox[3]
+        try:
+            return int(ttk.Style(self.tree).lookup("Treeview", "rowheight"))
+        except (TypeError, ValueError):
+            return font.nametofont("TkDefaultFont").metrics("linespace")
+
+    def _on_configure(self, event):
+        """ウィジェットの高さに合わせて行数を増減（枠線の分を除く）"""
+        count = max(1, (event.height - 4) // max(1, self._row_height()))
+        if count != len(self._rows):
+            self._resize_rows(count)
+            self._render()
+
+    def _move_focus(self, step):
+        """
+        フォーカス行を上下に移動し、端の行ではリストをスクロール
+
+        Args:
+            step (int): 移動量（-1: 上、1: 下）
+        """
+        row = self.tree.focus()
+        index = self._rows.index(row) + step if row in self._rows else 0
+        if index < 0 or index >= len(self._rows):
+            self._scroll(step)
+            index = min(max(index, 0), len(self._rows) - 1)
+        self.tree.focus(self._rows[index])
+        self.tree.selection_set(self._rows[index])
+        return "break"
+
+    def _on_click(self, event):
+        """クリックされた行の選択状態を反転"""
+        position = self._position_of(self.tree.identify_row(event.y))
+        if position is not None:
+            self.toggle(position)
+
+    def _on_space(self, event):
+        """フォーカス行の選択状態をスペースキーで反転"""
+        position = self._position_of(self.tree.focus())
+        if position is not None:
+            self.toggle(position)
+
+    def _notify(self):
+        """選択状態の変更をコールバックへ通知"""
+        if self._on_change is not None:
+            self._on_change()
+
+
+class AdvancedFolderCreatorApp:
+    """
+    AutoNestメインアプリケーションクラス
+
+    フォルダとファイルの自動作成機能を持つGUIアプリケーション。
+    設定ファイルベースの柔軟なカスタマイズと安全な作成処理を提供。
+
+    Attributes:
+        root (tk.Tk): メインウィンドウ
+        config (dict): 設定情報
+        selected_folder (tk.StringVar): 選択された対象フォルダパス
+        folder_list (CheckList): フォルダ選択リスト
+        file_list (CheckList): ファイル選択リスト
+        file_configs (dict): ファイル名とファイル設定の対応
+        base_config (dict): config.json の設定（プロファイル適用前）
+        profile_library (ProfileLibrary): プロファイルフォルダ
+    """
+
+    def __init__(self, root, config=None):
+        """
+        アプリケーションの初期化
+
+        Args:
+            root (tk.Tk): Tkinterのルートウィンドウ
+            config (dict): 読み込み済みの設定（省略時は config.json を読み込む）
+        """
+        self.root = root
+        self.config = config if config is not None else load_config()
+        self.base_config = self.config
+        self.profile_library = ProfileLibrary(
+            self.config.get("profiles_dir") or PROFILES_DIR
+        )
+        self._create_engines(self.config)
+
+        # ウィンドウ設定の適用
+        self._setup_window()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # アプリケーション状態の初期化
+        self._initialize_variables()
+
+        # UIコンポーネントの構築
+        self.setup_ui()
+
+    def _create_engines(self, config):
+        """
+        設定から作成処理用とプレビュー用の作成エンジンを生成
+
+        プレビュー用のエンジンは計測結果の記録先を持たず、差分更新の確認
+        （既存ファイルのハッシュ計算）も行わない。そのため、チェックの
+        切り替えごとの再計画でメインスレッドが止まらず、実行中の処理の
+        計測結果にも含まれない。
+
+        Args:
+            config (dict): 設定情報辞書
+        """
+        self.engine = FolderCreator.from_config(config, log=self.log)
+        self.preview_engine = FolderCreator(
+            log=self.log, template_pack_path=config.get("template_pack") or None
+        )
+
+    def _setup_window(self):
+        """ウィンドウの基本設定を行う"""
+        window_config = self.config.get("window_settings", {})
+        self.root.title(window_config.get("title", "AutoNest - フォルダ自動作成ツール"))
+
+        width = window_config.get("width", 700)
+        height = window_config.get("height", 500)
+        self.root.geometry(f"{width}x{height}")
+        self.root.resizable(True, True)
+
+    def _initialize_variables(self):
+        """アプリケーション変数の初期化"""
+        # 選択されたフォルダパス
+        self.selected_folder = tk.StringVar()
+
+        # ファイル名 -> ファイル設定（選択状態は各 CheckList が保持）
+        self.file_configs = {}
+
+        # プロファイル選択欄（プロファイルがない場合は None）
+        self.profile_combo = None
+        self._profile_names = {}  # 表示名 -> プロファイル名
+        self._profile_label = _BASE_PROFILE_LABEL  # 現在のプロファイルの表示名
+
+        # ログバッファ（タイマーでまとめてテキストエリアへ反映）
+        log_config = self.config.get("log_settings", {})
+        self._log_max_lines = log_config.get("max_lines", 1000)
+        self._log_auto_scroll = log_config.get("auto_scroll", True)
+        self._log_flush_interval = log_config.get("flush_interval_ms", 50)
+        self._log_flush_chunk = log_config.get("flush_chunk_lines", 500)
+        # 最大行数を超える未反映行は表示前に削除されるため保持しない
+        self._log_queue = deque(maxlen=self._log_max_lines)
+        self._log_line_count = 0  # テキストエリア内の行数
+
+        # 作成処理ワーカー（バックグラウンドスレッド）の状態
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._worker_events = queue.Queue()  # ワーカーからUIへのイベント
+        self._cancel_event = None  # 実行中の処理の中断要求
+        self._run_report = None  # 実行中の処理の計測結果
+
+        # プレビュー描画状態
+        self._preview_pending = False  # アイドル時の再描画が予約済みかどうか
+        self._preview_lines = []  # 現在表示中のプレビュー行
+        self._preview_index = None  # プレビュー用ファイルシステムインデックス
+
+    def setup_ui(self):
+        """
+        メインUIコンポーネントを設定・配置
+
+        以下のUIセクションを順次構築：
+        1. メインフレームとグリッド設定
+        2. タイトルラベル
+        3. フォルダ選択セクション
+        4. フォルダ・ファイル選択セクション
+        5. プレビューセクション
+        6. 操作ボタンセクション
+        7. ログ表示セクション
+        """
+        # メインフレームの構築とグリッド設定
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        # ウィンドウ全体のリサイズ対応
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+
+        # アプリケーションタイトル
+        title_label = ttk.Label(
+            main_frame,
+            text="AutoNest - フォルダ自動作成ツール",
+            font=("Arial", 16, "bold"),
+        )
+        title_label.grid(row=0, column=0, columnspan=3, pady=(0, 20))
+
+        # 対象フォルダ選択UI
+        self._setup_folder_selection_ui(main_frame)
+
+        # フォルダ・ファイル選択UI（水平配置）
+        self._setup_item_selection_ui(main_frame)
+
+        # ディレクトリ構造プレビューUI
+        self.setup_preview_frame(main_frame)
+
+        # 操作ボタンUI
+        self._setup_action_buttons(main_frame)
+
+        # ログ表示UI
+        self._setup_log_ui(main_frame)
+
+    def _setup_folder_selection_ui(self, parent):
+        """対象フォルダ選択UIセクションを構築"""
+        folder_frame = ttk.LabelFrame(parent, text="対象フォルダの選択", padding="10")
+        folder_frame.grid(
+            row=1, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10)
+        )
+        folder_frame.columnconfigure(1, weight=1)
+
+        # フォルダパス表示ラベル
+        ttk.Label(folder_frame, text="選択フォルダ:").grid(
+            row=0, column=0, sticky=tk.W, padx=(0, 10)
+        )
+
+        # フォルダパス表示エントリ（読み取り専用）
+        folder_entry = ttk.Entry(
+            folder_frame, textvariable=self.selected_folder, state="readonly", width=50
+        )
+        folder_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=(0, 10))
+
+        # フォルダ参照ボタン
+        browse_button = ttk.Button(
+            folder_frame, text="参照...", command=self.browse_folder
+        )
+        browse_button.grid(row=0, column=2, sticky=tk.W)
+
+        # プロファイル選択欄
+        self._setup_profile_selector(folder_frame)
+
+    def _setup_profile_selector(self, parent):
+        """
+        プロファイル選択欄を構築（プロファイルがない場合は表示しない）
+
+        一覧は index.json のみから作成し、プロファイルの内容は選択時に読み込む。
+
+        Args:
+            parent: 親ウィジェット
+        """
+        try:
+            profiles = self.profile_library.list_profiles()
+        except ConfigError as e:
+            self.log(f"❌ プロファイル一覧を読み込めません: {e}")
+            return
+        if not profiles:
+            return
+
+        self._profile_names = {}
+        for profile in profiles:
+            label = profile.name
+            if profile.description:
+                label = f"{profile.name} - {profile.description}"
+            self._profile_names[label] = profile.name
+
+        ttk.Label(parent, text="プロファイル:").grid(
+            row=1, column=0, sticky=tk.W, padx=(0, 10), pady=(5, 0)
+        )
+        self.profile_combo = ttk.Combobox(
+            parent,
+            values=[_BASE_PROFILE_LABEL] + list(self._profile_names),
+            state="readonly",
+        )
+        self.profile_combo.set(_BASE_PROFILE_LABEL)
+        self.profile_combo.grid(
+            row=1, column=1, sticky=(tk.W, tk.E), padx=(0, 10), pady=(5, 0)
+        )
+        self.profile_combo.bind(
+            "<<ComboboxSelected>>",
+            lambda event: self.select_profile(self.profile_combo.get()),
+        )
+
+    def select_profile(self, label):
+        """
+        プロファイルを切り替え、フォルダ・ファイルの選択リストのみを再構築
+
+        Args:
+            label (str): プロファイル選択欄の表示名
+        """
+        if label == self._profile_label:
+            return
+        name = self._profile_names.get(label)
+        try:
+            if name is None:
+                config = self.base_config
+            else:
+                config = self.profile_library.load(name, self.base_config)
+        except ConfigError as e:
+            self.profile_combo.set(self._profile_label)
+            messagebox.showerror("プロファイルエラー", str(e))
+            return
+
+        self._profile_label = label
+        self.config = config
+        self.engine.close()
+        self.preview_engine.close()
+        self._create_engines(config)
+
+        self.file_configs = {}
+        for file_config in config.get("default_files", []):
+            self.file_configs[file_config.get("name", "")] = file_config
+        folders = config.get("default_folders", [])
+        self.folder_list.set_items(folders)
+        self.file_list.set_items(list(self.file_configs))
+        self.log(
+            f"📚 プロファイル切り替え: {label}（フォルダ{len(folders)}個, "
+            f"ファイル{len(self.file_configs)}個）"
+        )
+        self.schedule_preview_update()
+
+    def _setup_item_selection_ui(self, parent):
+        """フォルダ・ファイル選択UIセクションを構築（水平配置）"""
+        selection_frame = ttk.Frame(parent)
+        selection_frame.grid(
+            row=2, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10)
+        )
+        selection_frame.columnconfigure(0, weight=1)
+        selection_frame.columnconfigure(1, weight=1)
+
+        # フォルダ選択セクション（左側）
+        self.setup_folder_selection_frame(selection_frame, column=0)
+
+        # ファイル選択セクション（右側）
+        self.setup_file_selection_frame(selection_frame, column=1)
+
+    def _setup_action_buttons(self, parent):
+        """操作ボタンセクションを構築"""
+        button_frame = ttk.Frame(parent)
+        button_frame.grid(row=4, column=0, columnspan=3, pady=10)
+
+        # メイン作成ボタン
+        self.create_button = ttk.Button(
+            button_frame,
+            text="フォルダとファイルを作成",
+            command=self.create_folders_and_files,
+        )
+        self.create_button.grid(row=0, column=0, padx=(0, 10))
+
+        # 全選択ボタン
+        select_all_button = ttk.Button(
+            button_frame, text="全て選択", command=self.select_all_folders
+        )
+        select_all_button.grid(row=0, column=1, padx=(0, 10))
+
+        # 全解除ボタン
+        deselect_all_button = ttk.Button(
+            button_frame, text="全て解除", command=self.deselect_all_folders
+        )
+        deselect_all_button.grid(row=0, column=2, padx=(0, 10))
+
+        # 中断ボタン（作成処理中のみ有効）
+        self.cancel_button = ttk.Button(
+            button_frame, text="中断", command=self.cancel_creation, state=tk.DISABLED
+        )
+        self.cancel_button.grid(row=0, column=3, padx=(0, 10))
+
+        # 一括作成ボタン（対象フォルダ一覧ファイルを選択）
+        self.batch_button = ttk.Button(
+            button_frame, text="一括作成...", command=self.create_batch_from_manifest
+        )
+        self.batch_button.grid(row=0, column=4, padx=(0, 10))
+
+        # 検証ボタン（既存ファイルがテンプレートと同一かを確認）
+        self.verify_button = ttk.Button(
+            button_frame, text="検証", command=self.verify_existing_files
+        )
+        self.verify_button.grid(row=0, column=5)
+
+        # 進捗バーと進捗ラベル
+        self.progress_bar = ttk.Progressbar(
+            button_frame, orient=tk.HORIZONTAL, mode="determinate", length=300
+        )
+        self.progress_bar.grid(row=1, column=0, columnspan=6, pady=(10, 0))
+        self.progress_label = ttk.Label(button_frame, text="")
+        self.progress_label.grid(row=2, column=0, columnspan=6)
+
+    def _setup_log_ui(self, parent):
+        """ログ表示UIセクションを構築"""
+        log_frame = ttk.LabelFrame(parent, text="ログ", padding="10")
+        log_frame.grid(
+            row=5, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0)
+        )
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+        parent.rowconfigure(5, weight=1)
+
+        # ログテキストエリア（スクロールバー付き）
+        self.log_text = tk.Text(log_frame, height=8, wrap=tk.WORD)
+        scrollbar = ttk.Scrollbar(
+            log_frame, orient=tk.VERTICAL, command=self.log_text.yview
+        )
+        self.log_text.configure(yscrollcommand=scrollbar.set)
+
+        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+
+        # ログクリアボタン
+        clear_log_button = ttk.Button(
+            log_frame, text="ログクリア", command=self.clear_log
+        )
+        clear_log_button.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+
+        # ログバッファの定期反映を開始
+        self.root.after(self._log_flush_interval, self._flush_log)
+
+    def setup_folder_selection_frame(self, parent, column=0):
+        """
+        フォルダ選択チェックリストフレームを構築
+
+        設定ファイルから読み込んだフォルダリストを基に、
+        絞り込み可能なチェックリストを作成する。
+
+        Args:
+            parent: 親ウィジェット
+            column (int): グリッド配置用のカラム番号
+        """
+        folder_selection_frame = ttk.LabelFrame(
+            parent, text="作成するフォルダを選択", padding="10"
+        )
+        folder_selection_frame.grid(
+            row=0,
+            column=column,
+            sticky=(tk.W, tk.E, tk.N, tk.S),
+            padx=(0, 5 if column == 0 else 0),
+        )
+        folder_selection_frame.columnconfigure(0, weight=1)
+        folder_selection_frame.rowconfigure(0, weight=1)
+
+        # 設定のフォルダリストから選択リストを作成（デフォルトで選択）
+        self.folder_list = CheckList(
+            folder_selection_frame,
+            self.config.get("default_folders", []),
+            on_change=self.schedule_preview_update,
+        )
+        self.folder_list.frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    def setup_file_selection_frame(self, parent, column=1):
+        """
+        ファイル選択チェックリストフレームを構築
+
+        設定ファイルから読み込んだファイルリストを基に、
+        絞り込み可能なチェックリストを作成する。
+
+        Args:
+            parent: 親ウィジェット
+            column (int): グリッド配置用のカラム番号
+        """
+        file_selection_frame = ttk.LabelFrame(
+            parent, text="作成するファイルを選択(実験機能)", padding="10"
+        )
+        file_selection_frame.grid(
+            row=0,
+            column=column,
+            sticky=(tk.W, tk.E, tk.N, tk.S),
+            padx=(5 if column == 1 else 0, 0),
+        )
+        file_selection_frame.columnconfigure(0, weight=1)
+        file_selection_frame.rowconfigure(0, weight=1)
+
+        # 設定のファイルリストから選択リストを作成（デフォルトで選択）
+        self.file_configs = {}
+        for file_config in self.config.get("default_files", []):
+            self.file_configs[file_config.get("name", "")] = file_config
+        self.file_list = CheckList(
+            file_selection_frame,
+            list(self.file_configs),
+            on_change=self.schedule_preview_update,
+        )
+        self.file_list.frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+    def setup_preview_frame(self, parent):
+        """
+        ディレクトリ構造プレビューフレームを構築
+
+        作成予定のフォルダ・ファイル構造をツリー形式で表示する
+        プレビュー機能を提供する。
+
+        Args:
+            parent: 親ウィジェット
+        """
+        preview_frame = ttk.LabelFrame(
+            parent, text="ディレクトリ構造(実験機能)", padding="10"
+        )
+        preview_frame.grid(
+            row=3, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(0, 10)
+        )
+        preview_frame.columnconfigure(0, weight=1)
+        preview_frame.rowconfigure(0, weight=1)
+
+        # プレビューテキストエリア（水平・垂直スクロールバー付き）
+        self.preview_text = tk.Text(
+            preview_frame,
+            height=5,
+            wrap=tk.NONE,
+            font=("Consolas", 9),
+            bg="#f8f8f8",
+            state=tk.DISABLED,
+        )
+
+        # スクロールバーの設定
+        preview_scrollbar_v = ttk.Scrollbar(
+            preview_frame, orient=tk.VERTICAL, command=self.preview_text.yview
+        )
+        preview_scrollbar_h = ttk.Scrollbar(
+            preview_frame, orient=tk.HORIZONTAL, command=self.preview_text.xview
+        )
+
+        self.preview_text.configure(
+            yscrollcommand=preview_scrollbar_v.set,
+            xscrollcommand=preview_scrollbar_h.set,
+        )
+
+        # ウィジェット配置
+        self.preview_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        preview_scrollbar_v.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        preview_scrollbar_h.grid(row=1, column=0, sticky=(tk.W, tk.E))
+
+        # プレビュー更新ボタン
+        update_preview_button = ttk.Button(
+            preview_frame, text="プレビュー更新", command=self.update_preview
+        )
+        update_preview_button.grid(row=2, column=0, sticky=tk.W, pady=(5, 0))
+
+        # 初期プレビューを表示
+        self.update_preview()
+
+    def update_preview(self):
+        """
+        プレビューテキストを更新
+
+        対象フォルダを再走査した上で、現在選択されているフォルダと
+        ファイルを基に作成予定のディレクトリ構造をツリー形式で表示する。
+        """
+        self._preview_index = None
+        self._render_preview()
+
+    def schedule_preview_update(self):
+        """
+        プレビューの再描画をアイドル時に1回だけ行うよう予約
+
+        チェックボックスの一括変更などで短時間に何度呼ばれても、
+        再描画は次のアイドルサイクルでまとめて1回だけ実行される。
+        """
+        if self._preview_pending:
+            return
+        self._preview_pending = True
+        self.root.after_idle(self._render_preview)
+
+    def _render_preview(self):
+        """
+        プレビュー内容を計算し、変更された行のみテキストエリアに反映
+
+        ファイルシステムインデックスは対象フォルダが変わるか
+        update_preview が呼ばれるまで再利用する。
+        """
+        self._preview_pending = False
+        if not hasattr(self, "preview_text"):
+            return
+
+        target_path = self.selected_folder.get().strip()
+        if not target_path:
+            self._set_preview_lines(["ターゲットフォルダが指定されていません。"])
+            return
+
+        # 選択されたフォルダとファイルを取得
+        selected_folders = self.folder_list.checked_keys()
+        selected_files = self._selected_files()
+
+        # 選択項目がない場合の処理
+        if not selected_folders and not selected_files:
+            self._set_preview_lines(
+                ["作成するフォルダまたはファイルが選択されていません。"]
+            )
+            return
+
+        # 作成処理と同じ計画を構築してツリー構造を表示
+        if self._preview_index is None or self._preview_index.root != target_path:
+            self._preview_index = FileSystemIndex(target_path)
+        plan = self.preview_engine.plan(
+            target_path, selected_folders, selected_files, self._preview_index
+        )
+        lines = self.generate_tree_structure(plan).split("\n")
+        if self.engine.incremental and plan.existing_planned:
+            # 更新の有無は作成時に判定する（ここでは既存ファイルを読まない）
+            lines.append("")
+            lines.append(
+                f"🔄 既存ファイル{len(plan.existing_planned)}個は、テンプレートが"
+                "変更されていれば作成時に更新される場合があります"
+            )
+        self._set_preview_lines(lines)
+
+    def _set_preview_lines(self, lines):
+        """
+        プレビューテキストを指定行に更新（差分行のみ書き換え）
+
+        前回表示内容との共通の先頭行・末尾行を除いた範囲だけを
+        削除・挿入するため、1項目の変更では数行の書き換えで済む。
+
+        Args:
+            lines (list): 表示する行リスト
+        """
+        old_lines = self._preview_lines
+        if lines == old_lines:
+            return
+
+        # 共通の先頭行数・末尾行数を求める
+        limit = min(len(old_lines), len(lines))
+        head = 0
+        while head < limit and old_lines[head] == lines[head]:
+            head += 1
+        tail = 0
+        while (
+            tail < limit - head
+            and old_lines[len(old_lines) - 1 - tail] == lines[len(lines) - 1 - tail]
+        ):
+            tail += 1
+
+        # 変更範囲のみ置き換える（各行は改行付きで保持）
+        self.preview_text.config(state=tk.NORMAL)
+        self.preview_text.delete(f"{head + 1}.0", f"{len(old_lines) - tail + 1}.0")
+        changed = lines[head : len(lines) - tail]
+        if changed:
+            self.preview_text.insert(
+                f"{head + 1}.0", "".join(line + "\n" for line in changed)
+            )
+        self.preview_text.config(state=tk.DISABLED)
+        self._preview_lines = list(lines)
+
+    def generate_tree_structure(self, plan):
+        """
+        ディレクトリツリー構造文字列を生成
+
+        Args:
+            plan (ScaffoldPlan): 作成計画
+
+        Returns:
+            str: ツリー構造を表現した文字列
+        """
+        return plan.render_tree()
+
+    def browse_folder(self):
+        """
+        フォルダ選択ダイアログを開く
+
+        ユーザーが対象フォルダを選択できるファイルダイアログを表示し、
+        選択結果をログに記録してプレビューを更新する。
+        """
+        folder_path = filedialog.askdirectory(title="対象フォルダを選択してください")
+        if folder_path:
+            self.selected_folder.set(folder_path)
+            self.log(f"フォルダが選択されました: {folder_path}")
+            self.update_preview()
+
+    def _selected_files(self):
+        """
+        選択されているファイルを取得
+
+        Returns:
+            list: (ファイル名, ファイル設定) のタプルリスト
+        """
+        return [
+            (file_name, self.file_configs[file_name])
+            for file_name in self.file_list.checked_keys()
+        ]
+
+    def select_all_folders(self):
+        """
+        全てのフォルダとファイルを選択
+
+        UI上のすべてのチェックボックスを選択状態にし、
+        結果をログに記録する。
+        """
+        self.folder_list.set_all(True)
+        self.file_list.set_all(True)
+        self.log("全てのフォルダとファイルが選択されました")
+
+    def deselect_all_folders(self):
+        """
+        全てのフォルダとファイル選択を解除
+
+        UI上のすべてのチェックボックスを非選択状態にし、
+        結果をログに記録する。
+        """
+        self.folder_list.set_all(False)
+        self.file_list.set_all(False)
+        self.log("全てのフォルダとファイル選択が解除されました")
+
+    def log(self, message):
+        """
+        ログメッセージをバッファに追加
+
+        メッセージはキューに積まれ、_flush_log によって一定間隔で
+        まとめてログテキストエリアへ反映される。ウィジェットに
+        触れないため、どのスレッドからでも呼び出せる。
+
+        Args:
+            message (str): 表示するログメッセージ
+        """
+        self._log_queue.append(message)
+
+    def _flush_log(self):
+        """
+        バッファされたログをテキストエリアへ反映
+
+        キューから最大 flush_chunk_lines 行を取り出して一度に挿入し、
+        行数カウンタを用いて最大行数を超えた古い行を削除する。
+        処理後は次回の反映をタイマーに登録する。
+        """
+        start = time.perf_counter()
+        chunk = []
+        while self._log_queue and len(chunk) < self._log_flush_chunk:
+            chunk.append(self._log_queue.popleft())
+
+        if chunk:
+            self.log_text.insert(tk.END, "\n".join(chunk) + "\n")
+            self._log_line_count += sum(line.count("\n") + 1 for line in chunk)
+
+            # 設定された最大行数を超えた場合は古い行を削除
+            excess = self._log_line_count - self._log_max_lines
+            if excess > 0:
+                self.log_text.delete(1.0, f"{excess + 1}.0")
+                self._log_line_count -= excess
+
+            # 自動スクロール設定が有効な場合は最新行を表示
+            if self._log_auto_scroll:
+                self.log_text.see(tk.END)
+
+            # 作成処理の実行中はログ表示にかかった時間を計測に含める
+            if self._run_report is not None:
+                self._run_report.add_time("ui_log", time.perf_counter() - start)
+
+        self.root.after(self._log_flush_interval, self._flush_log)
+
+    def clear_log(self):
+        """
+        ログを完全にクリア
+
+        ログテキストエリア内のすべてのテキストと未反映のログを削除する。
+        """
+        self._log_queue.clear()
+        self.log_text.delete(1.0, tk.END)
+        self._log_line_count = 0
+
+    def create_folders_and_files(self):
+        """
+        選択されたフォルダとファイルを作成する（メイン処理）
+
+        以下の処理を順次実行：
+        1. 入力値の事前チェック
+        2. フォルダの存在確認と作成
+        3. ファイルの存在確認と作成
+        4. 結果の集計と表示
+
+        既存のフォルダ・ファイルは上書きせず、安全に処理を行う。
+        すべての処理状況は詳細ログとして記録される。
+        """
+        # 入力値の事前検証
+        folder_path = self.selected_folder.get()
+        if not folder_path:
+            messagebox.showwarning("警告", "フォルダを選択してください。")
+            return
+
+        if not os.path.exists(folder_path):
+            messagebox.showerror("エラー", "選択されたフォルダが存在しません。")
+            return
+
+        if has_pending_journal(folder_path) and not self._resolve_pending_journal(
+            folder_path
+        ):
+            return
+
+        # 選択されたアイテムを取得
+        selected_folders = self.folder_list.checked_keys()
+        selected_files = self._selected_files()
+
+        if not selected_folders and not selected_files:
+            messagebox.showwarning(
+                "警告", "作成するフォルダまたはファイルを選択してください。"
+            )
+            return
+
+        # メイン作成処理をバックグラウンドで実行
+        self._execute_creation_process(folder_path, selected_folders, selected_files)
+
+    def verify_existing_files(self):
+        """
+        選択されたフォルダ・ファイルの既存の作成先がテンプレートと同一かを検証する
+
+        何も作成・変更せず、結果（一致・相違・なし）をログとダイアログに表示する。
+        """
+        folder_path = self.selected_folder.get()
+        if not folder_path or not os.path.isdir(folder_path):
+            messagebox.showwarning("警告", "存在するフォルダを選択してください。")
+            return
+        selected_folders = self.folder_list.checked_keys()
+        selected_files = self._selected_files()
+        self._start_worker(
+            len(selected_files),
+            self._run_verify_worker,
+            folder_path,
+            selected_folders,
+            selected_files,
+        )
+
+    def _run_verify_worker(
+        self, folder_path, selected_folders, selected_files, cancel_event
+    ):
+        """
+        ワーカースレッドで検証を実行し、結果をイベントキューへ送る
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+            cancel_event (threading.Event): 中断要求イベント
+        """
+        try:
+            plan = self.engine.plan(folder_path, selected_folders, selected_files)
+            result = self.engine.verify(
+                plan,
+                progress=lambda event: self._worker_events.put(("progress", event)),
+                cancel_event=cancel_event,
+            )
+            self._worker_events.put(("done", result))
+        except Exception as e:
+            self._worker_events.put(("error", e))
+
+    def _resolve_pending_journal(self, folder_path):
+        """
+        中断された前回の作成処理の記録が残っている場合に扱いを確認する
+
+        「はい」で前回作成された項目を取り消し、「いいえ」で項目を残したまま
+        記録のみを破棄する。
+
+        Args:
+            folder_path (str): 対象フォルダパス
+
+        Returns:
+            bool: 作成処理を続行する場合は True
+        """
+        answer = messagebox.askyesnocancel(
+            "前回の作成処理",
+            "このフォルダには完了していない前回の作成処理の記録があります。\n\n"
+            "前回作成された項目を取り消しますか？\n"
+            "（「いいえ」を選ぶと項目を残したまま続行します）",
+        )
+        if answer is None:
+            return False
+        if not answer:
+            discard_pending(folder_path)
+            self.log("前回の作成処理の記録を破棄しました")
+            return True
+        rollback = rollback_pending(folder_path, self.log)
+        self.log(f"↩️ 前回作成された{rollback.removed_count}個の項目を取り消しました")
+        if rollback.errors:
+            messagebox.showerror(
+                "エラー",
+                f"{len(rollback.errors)}個の項目を取り消せませんでした。"
+                "詳細はログをご確認ください。",
+            )
+            return False
+        return True
+
+    def create_batch_from_manifest(self):
+        """
+        対象フォルダ一覧ファイルを選択し、記載された全フォルダに一括作成する
+
+        一覧ファイルは1行1パスのテキスト、または JSON 配列。
+        glob パターン（例: students/*）も指定できる。
+        """
+        manifest_path = filedialog.askopenfilename(
+            title="対象フォルダ一覧ファイルを選択",
+            filetypes=[
+                ("一覧ファイル", "*.txt *.json"),
+                ("すべてのファイル", "*.*"),
+            ],
+        )
+        if not manifest_path:
+            return
+
+        try:
+            targets = expand_targets(manifest_path=manifest_path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("エラー", f"一覧ファイルを読み込めません: {e}")
+            return
+        if not targets:
+            messagebox.showwarning("警告", "一覧ファイルに対象フォルダがありません。")
+            return
+
+        selected_folders = self.folder_list.checked_keys()
+        selected_files = self._selected_files()
+        if not selected_folders and not selected_files:
+            messagebox.showwarning(
+                "警告", "作成するフォルダまたはファイルを選択してください。"
+            )
+            return
+
+        if not messagebox.askyesno(
+            "確認", f"{len(targets)}個の対象フォルダに一括作成します。よろしいですか？"
+        ):
+            return
+
+        self.log(f"📦 一括作成を開始: 対象フォルダ {len(targets)}個 ({manifest_path})")
+        self._start_worker(
+            len(targets),
+            self._run_batch_worker,
+            targets,
+            selected_folders,
+            selected_files,
+        )
+
+    def _execute_creation_process(self, folder_path, selected_folders, selected_files):
+        """
+        フォルダ・ファイル作成処理をワーカースレッドで開始
+
+        処理中は作成ボタンを無効化し、進捗はイベントキュー経由で
+        _poll_worker_events が UI に反映する。
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+        """
+        self._start_worker(
+            len(selected_folders) + len(selected_files),
+            self._run_creation_worker,
+            folder_path,
+            selected_folders,
+            selected_files,
+        )
+
+    def _start_worker(self, total, worker, *args):
+        """
+        作成ボタンを無効化してワーカーを投入し、イベントの監視を開始
+
+        Args:
+            total (int): 進捗バーの最大値
+            worker (callable): ワーカースレッドで実行する関数
+                （最後の引数に中断要求イベントを受け取る）
+            *args: worker に渡す引数
+        """
+        self._cancel_event = threading.Event()
+        self._run_report = RunReport()
+        self.engine.report = self._run_report
+        self.create_button.config(state=tk.DISABLED)
+        self.batch_button.config(state=tk.DISABLED)
+        self.verify_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        if self.profile_combo is not None:
+            self.profile_combo.config(state=tk.DISABLED)
+        self.progress_bar.config(maximum=max(total, 1), value=0)
+        self.progress_label.config(text="処理中...")
+
+        self._executor.submit(worker, *args, self._cancel_event)
+        self.root.after(100, self._poll_worker_events)
+
+    def _run_creation_worker(
+        self, folder_path, selected_folders, selected_files, cancel_event
+    ):
+        """
+        ワーカースレッドで作成処理を実行し、結果をイベントキューへ送る
+
+        ウィジェットには一切触れず、すべての通知を _worker_events 経由で行う。
+
+        Args:
+            folder_path (str): 対象フォルダパス
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+            cancel_event (threading.Event): 中断要求イベント
+        """
+        try:
+            result = self.engine.execute(
+                folder_path,
+                selected_folders,
+                selected_files,
+                progress=lambda event: self._worker_events.put(("progress", event)),
+                cancel_event=cancel_event,
+            )
+            self._worker_events.put(("done", result))
+        except Exception as e:
+            self._worker_events.put(("error", e))
+
+    def _run_batch_worker(
+        self, targets, selected_folders, selected_files, cancel_event
+    ):
+        """
+        ワーカースレッドで一括作成を実行し、結果をイベントキューへ送る
+
+        進捗は対象フォルダ単位で通知される。設定の performance.processes が
+        2 以上の場合は対象フォルダを複数のワーカープロセスに分けて処理する。
+
+        Args:
+            targets (list): 対象フォルダパスのリスト
+            selected_folders (list): 作成対象フォルダリスト
+            selected_files (list): 作成対象ファイルリスト
+            cancel_event (threading.Event): 中断要求イベント
+        """
+        progress = lambda event: self._worker_events.put(("progress", event))
+        processes = self.config.get("performance", {}).get("processes", 1)
+        try:
+            if processes > 1 and len(targets) > 1:
+                # スレッドを持つ GUI プロセスの fork はデッドロックしうるため spawn にする
+                import multiprocessing
+
+                result = run_batch_processes(
+                    self.config,
+                    targets,
+                    selected_folders,
+                    selected_files,
+                    processes,
+                    log=self.log,
+                    progress=progress,
+                    cancel_event=cancel_event,
+                    report=self._run_report,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                result = run_batch(
+                    self.engine,
+                    targets,
+                    selected_folders,
+                    selected_files,
+                    log=self.log,
+                    progress=progress,
+                    cancel_event=cancel_event,
+                )
+            self._worker_events.put(("done", result))
+        except Exception as e:
+            self._worker_events.put(("error", e))
+
+    def _poll_worker_events(self):
+        """
+        ワーカーからのイベントを取り出して UI に反映
+
+        進捗イベントは最新のものだけを表示に使い、完了・エラーイベントを
+        受け取るまで一定間隔で自身を再登録する。
+        """
+        latest_progress = None
+        finished = False
+        try:
+            while True:
+                kind, payload = self._worker_events.get_nowait()
+                if kind == "progress":
+                    latest_progress = payload
+                elif kind == "done":
+                    finished = True
+                    self._finish_creation()
+                    if isinstance(payload, BatchResult):
+                        self._show_batch_results(payload)
+                    elif isinstance(payload, VerifyResult):
+                        self._show_verify_results(payload)
+                    else:
+                        self._show_completion_results(payload)
+                    self._show_run_report()
+                elif kind == "error":
+                    finished = True
+                    self._finish_creation()
+                    self._run_report = None
+                    error_msg = f"作成処理中にエラーが発生しました: {str(payload)}"
+                    self.log(f"💥 {error_msg}")
+                    messagebox.showerror("エラー", error_msg)
+        except queue.Empty:
+            pass
+
+        if latest_progress is not None and not finished:
+            self.progress_bar.config(value=latest_progress.done)
+            self.progress_label.config(
+                text=f"{latest_progress.done}/{latest_progress.total} "
+                f"({self._format_bytes(latest_progress.bytes_copied)}) "
+                f"{latest_progress.path}"
+            )
+
+        if not finished:
+            self.root.after(100, self._poll_worker_events)
+
+    def _finish_creation(self):
+        """作成処理終了時に UI 状態を元に戻す"""
+        self._cancel_event = None
+        self.engine.report = None
+        self.create_button.config(state=tk.NORMAL)
+        self.batch_button.config(state=tk.NORMAL)
+        self.verify_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        if self.profile_combo is not None:
+            self.profile_combo.config(state="readonly")
+        self.progress_bar.config(value=self.progress_bar.cget("maximum"))
+        self.progress_label.config(text="")
+        self.update_preview()
+
+    def _show_run_report(self):
+        """実行した処理の段階ごとの処理時間・操作回数をログに表示"""
+        if self._run_report is not None:
+            for line in self._run_report.summary_lines():
+                self.log(line)
+            self._run_report = None
+
+    def cancel_creation(self):
+        """
+        実行中の作成処理の中断を要求
+
+        ワーカーは現在処理中の項目を終えた時点で停止する。
+        """
+        if self._cancel_event is not None and not self._cancel_event.is_set():
+            self._cancel_event.set()
+            self.cancel_button.config(state=tk.DISABLED)
+            self.log("⏹️ 中断を要求しました。現在の項目の完了後に停止します...")
+
+    def _on_close(self):
+        """ウィンドウを閉じる際に実行中の処理を中断してから終了する"""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+
+    @staticmethod
+    def _format_bytes(num_bytes):
+        """
+        バイト数を読みやすい単位付き文字列に変換
+
+        Args:
+            num_bytes (int): バイト数
+
+        Returns:
+            str: 単位付き文字列（例: "1.5 MB"）
+        """
+        size = float(num_bytes)
+        for unit in ("B", "KB", "MB", "GB"):
+            if size < 1024 or unit == "GB":
+                return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+            size /= 1024
+
+    def _show_completion_results(self, result):
+        """
+        作成処理完了結果を表示
+
+        Args:
+            result (CreationResult): 作成処理結果
+        """
+        # 完了メッセージダイアログの表示
+        message_parts = []
+        if result.folder_created_count > 0:
+            message_parts.append(f"✅ フォルダ新規作成: {result.folder_created_count}個")
+        if result.file_created_count > 0:
+            message_parts.append(f"✅ ファイル新規作成: {result.file_created_count}個")
+        if result.file_updated_count > 0:
+            message_parts.append(f"🔄 ファイル更新: {result.file_updated_count}個")
+        if result.existing_folders or result.existing_files:
+            message_parts.append(
+                f"⚠️ 既存スキップ: "
+                f"{len(result.existing_folders) + len(result.existing_files)}個"
+            )
+        if result.file_errors:
+            message_parts.append(f"❌ エラー: {len(result.file_errors)}個")
+        if result.rolled_back:
+            message_parts.append(
+                f"↩️ 作成した項目を取り消しました: {result.rolled_back_count}個"
+            )
+
+        if result.rolled_back and not result.cancelled:
+            messagebox.showerror(
+                "エラー",
+                "作成中にエラーが発生したため、作成した項目を取り消しました。\n\n"
+                + "\n".join(message_parts)
+                + "\n\n詳細はログをご確認ください。",
+            )
+        elif result.cancelled:
+            messagebox.showinfo(
+                "中断",
+                "フォルダ・ファイル作成を中断しました。\n\n"
+                + "\n".join(message_parts)
+                + "\n\n詳細はログをご確認ください。",
+            )
+        elif message_parts:
+            messagebox.showinfo(
+                "完了",
+                f"フォルダ・ファイル作成が完了しました。\n\n"
+                + "\n".join(message_parts)
+                + f"\n\n詳細はログをご確認ください。",
+            )
+        else:
+            messagebox.showinfo(
+                "情報", "作成する新しいフォルダ・ファイルがありませんでした。"
+            )
+
+    def _show_batch_results(self, batch):
+        """
+        一括作成の集計結果をログとダイアログに表示
+
+        Args:
+            batch (BatchResult): 一括作成の集計結果
+        """
+        for line in batch.summary_lines():
+            self.log(line)
+        self._show_completion_results(batch.to_creation_result())
+
+    def _show_verify_results(self, result):
+        """
+        検証結果をログとダイアログに表示
+
+        Args:
+            result (VerifyResult): 検証結果
+        """
+        for line in result.summary_lines():
+            self.log(line)
+        message = (
+            f"✅ 一致: {len(result.identical)}個\n"
+            f"⚠️ 相違: {len(result.differs)}個\n"
+            f"📭 なし: {len(result.missing)}個"
+        )
+        if result.errors:
+            message += f"\n❌ エラー: {len(result.errors)}個"
+        messagebox.showinfo(
+            "検証結果", message + "\n\n詳細はログをご確認ください。"
+        )
+
+
+def main():
+    """
+    メイン関数 - アプリケーションのエントリーポイント
+
+    Tkinterウィンドウを作成・初期化し、アプリケーションを起動する。
+    ウィンドウを画面中央に配置してメインループを開始する。
+    """
+    # Tkinterルートウィンドウの作成
+    root = tk.Tk()
+
+    # 設定ファイルの読み込み（不正な場合はデフォルト設定で続行せず終了する）
+    try:
+        config = load_config()
+    except ConfigError as e:
+        root.withdraw()
+        messagebox.showerror("設定ファイルエラー", str(e))
+        root.destroy()
+        return
+
+    # アプリケーションインスタンスの作成
+    app = AdvancedFolderCreatorApp(root, config)
+
+    # ウィンドウを画面中央に配置
+    root.update_idletasks()
+    width = root.winfo_width()
+    height = root.winfo_height()
+    screen_width = root.winfo_screenwidth()
+    screen_height = root.winfo_screenheight()
+
+    # 中央配置の計算
+    x = (screen_width // 2) - (width // 2)
+    y = (screen_height // 2) - (height // 2)
+    root.geometry(f"{width}x{height}+{x}+{y}")
+
+    # メインループ開始
+    root.mainloop()
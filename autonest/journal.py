@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 作成ジャーナルモジュール
+
+作成処理中に作成したフォルダ・ファイルを対象フォルダ直下の
+ジャーナルファイルへ順に追記する。処理が失敗・中断した場合は
+記録を逆順にたどって作成した項目だけを削除する（ロールバック）。
+対象フォルダ全体を走査しないため、ロールバックの時間は作成した
+項目数にのみ比例する。
+
+既存ファイルを置き換える場合（差分更新）は元のファイルを
+BACKUP_SUFFIX を付けた名前に退避してから記録し、ロールバック時に元に戻す。
+退避したファイルは作成処理の完了時に削除する。
+
+記録は作成に成功した後に追記するため、プロセスが強制終了した場合でも
+作成していない項目を削除することはない。記録は FLUSH_RECORDS 件ごと、
+または前回の書き出しから FLUSH_INTERVAL 秒が経過するたびにファイルへ
+書き出すため、強制終了時にジャーナルに残らず削除されないのは、
+最後に作成した高々 FLUSH_RECORDS 件の項目に限られる。
+"""
+
+import os
+import threading
+import time
+
+JOURNAL_NAME = ".autonest-journal"
+BACKUP_SUFFIX = ".autonest-old"
+
+# record に渡す種別（DIR / FILE は plan モジュールの定数と同じ値）
+UPDATE = "update"
+
+_KIND_DIR = "D"
+_KIND_FILE = "F"
+_KIND_UPDATE = "U"
+_KINDS = {"dir": _KIND_DIR, "file": _KIND_FILE, UPDATE: _KIND_UPDATE}
+_BUFFER_SIZE = 64 * 1024
+
+# 強制終了時に失われる記録を抑えるための書き出し間隔
+FLUSH_RECORDS = 32
+FLUSH_INTERVAL = 0.05  # 秒
+
+
+class JournalError(Exception):
+    """ジャーナルを開始できない場合の例外"""
+
+
+class RollbackResult:
+    """
+    ロールバックの結果
+
+    Attributes:
+        removed_count (int): 削除した項目数
+        errors (list): 削除できなかった項目のエラーメッセージ
+    """
+
+    def __init__(self):
+        self.removed_count = 0
+        self.errors = []
+
+
+def journal_path(folder_path):
+    """
+    対象フォルダのジャーナルファイルパスを取得
+
+    Args:
+        folder_path (str): 対象フォルダパス
+
+    Returns:
+        str: ジャーナルファイルパス
+    """
+    return os.path.join(folder_path, JOURNAL_NAME)
+
+
+def has_pending_journal(folder_path):
+    """
+    完了していない作成処理のジャーナルが残っているかどうか
+
+    Args:
+        folder_path (str): 対象フォルダパス
+
+    Returns:
+        bool: ジャーナルが残っている場合は True
+    """
+    return os.path.exists(journal_path(folder_path))
+
+
+def _rollback_entries(folder_path, entries, log):
+    """
+    記録された項目を逆順に削除
+
+    ファイルは削除し、フォルダは空の場合のみ削除する（作成後に
+    追加された項目は残す）。置き換えたファイルは退避した元のファイルに
+    戻す。既に存在しない項目は無視する。
+
+    Args:
+        folder_path (str): 対象フォルダパス
+        entries (list): (種別, 相対パス) のリスト（作成順）
+        log (callable): ログコールバック
+
+    Returns:
+        RollbackResult: ロールバックの結果
+    """
+    result = RollbackResult()
+    for kind, rel_path in reversed(entries):
+        full_path = os.path.join(folder_path, rel_path)
+        try:
+            if kind == _KIND_DIR:
+                os.rmdir(full_path)
+            elif kind == _KIND_UPDATE:
+                os.replace(full_path + BACKUP_SUFFIX, full_path)
+            else:
+                os.remove(full_path)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            result.errors.append(f"{rel_path}: 削除できません - {str(e)}")
+            log(f"❌ ロールバック失敗: {rel_path} - {str(e)}")
+            continue
+        result.removed_count += 1
+        log(f"↩️ 削除: {rel_path}")
+    return result
+
+
+def _read_entries(path):
+    """ジャーナルファイルから (種別, 相対パス) のリストを読み込む"""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            kind, sep, rel_path = line.rstrip("\n").partition("\t")
+            # 強制終了で途中までしか書かれていない行は無視する
+            if sep and kind in _KINDS.values() and rel_path:
+                entries.append((kind, rel_path))
+    return entries
+
+
+def rollback_pending(folder_path, log=None):
+    """
+    残っているジャーナルを基に中断された作成処理を取り消す
+
+    Args:
+        folder_path (str): 対象フォルダパス
+        log (callable): ログコールバック
+
+    Returns:
+        RollbackResult: ロールバックの結果（ジャーナルがない場合は削除数 0）
+    """
+    log = log or (lambda message: None)
+    path = journal_path(folder_path)
+    try:
+        entries = _read_entries(path)
+    except FileNotFoundError:
+        return RollbackResult()
+    result = _rollback_entries(folder_path, entries, log)
+    if not result.errors:
+        os.remove(path)
+    return result
+
+
+def _remove_backups(folder_path, entries):
+    """置き換え時に退避した元のファイルを削除"""
+    for kind, rel_path in entries:
+        if kind == _KIND_UPDATE:
+            try:
+                os.remove(os.path.join(folder_path, rel_path) + BACKUP_SUFFIX)
+            except FileNotFoundError:
+                pass
+
+
+def discard_pending(folder_path):
+    """
+    残っているジャーナルを破棄する（作成済みの項目はそのまま残す）
+
+    Args:
+        folder_path (str): 対象フォルダパス
+    """
+    path = journal_path(folder_path)
+    try:
+        _remove_backups(folder_path, _read_entries(path))
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+class Journal:
+    """
+    1回の作成処理のジャーナル
+
+    記録はメモリ上にも保持し、同じプロセス内のロールバックでは
+    ジャーナルファイルを読み直さない。ファイルへの書き込みは
+    バッファリングし、FLUSH_RECORDS 件ごと・FLUSH_INTERVAL 秒ごとと
+    flush の呼び出し時に書き出す。
+    """
+
+    def __init__(self, folder_path):
+        """
+        ジャーナルを開始
+
+        Args:
+            folder_path (str): 対象フォルダパス
+
+        Raises:
+            JournalError: 前回のジャーナルが残っている・作成できない場合
+        """
+        self.folder_path = folder_path
+        self.path = journal_path(folder_path)
+        self._entries = []
+        self._lock = threading.Lock()
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+        try:
+            self._file = open(
+                self.path, "x", encoding="utf-8", buffering=_BUFFER_SIZE
+            )
+        except FileExistsError as e:
+            raise JournalError(
+                f"前回の作成処理の記録 {JOURNAL_NAME} が残っています。"
+                f"取り消す場合は --rollback を指定して実行してください"
+            ) from e
+        except OSError as e:
+            raise JournalError(
+                f"ジャーナル {self.path} を作成できません: {str(e)}"
+            ) from e
+
+    def record(self, kind, rel_path):
+        """
+        作成した項目を記録
+
+        Args:
+            kind (str): DIR・FILE（plan モジュールの定数）または UPDATE
+            rel_path (str): 正規化済み相対パス
+        """
+        code = _KINDS[kind]
+        with self._lock:
+            self._entries.append((code, rel_path))
+            self._file.write(f"{code}\t{rel_path}\n")
+            self._unflushed += 1
+            if (
+                self._unflushed >= FLUSH_RECORDS
+                or time.monotonic() - self._flushed_at >= FLUSH_INTERVAL
+            ):
+                self._flush_locked()
+
+    def flush(self):
+        """バッファ内の記録をジャーナルファイルへ書き出す"""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        """バッファ内の記録を書き出す（_lock を取得した状態で呼び出す）"""
+        self._file.flush()
+        self._unflushed = 0
+        self._flushed_at = time.monotonic()
+
+    def commit(self):
+        """作成処理の完了を確定し、退避したファイルとジャーナルファイルを削除する"""
+        self._file.close()
+        _remove_backups(self.folder_path, self._entries)
+        os.remove(self.path)
+
+    def rollback(self, log=None):
+        """
+        記録した項目を逆順に削除し、ジャーナルファイルを削除する
+
+        Args:
+            log (callable): ログコールバック
+
+        Returns:
+            RollbackResult: ロールバックの結果
+        """
+        self._file.close()
+        result = _rollback_entries(
+            self.folder_path, self._entries, log or (lambda message: None)
+        )
+        if not result.errors:
+            os.remove(self.path)
+        else:
+            # 削除できなかった項目を後で取り消せるよう残りを記録し直す
+            with open(self.path, "w", encoding="utf-8") as f:
+                for code, rel_path in self._entries:
+                    full_path = os.path.join(self.folder_path, rel_path)
+                    if code == _KIND_UPDATE:
+                        full_path += BACKUP_SUFFIX
+                    if os.path.lexists(full_path):
+                        f.write(f"{code}\t{rel_path}\n")
+        return result
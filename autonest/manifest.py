@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 作成記録（マニフェスト）モジュール
+
+対象フォルダ直下の .autonest-manifest.json に、作成したファイルごとの
+テンプレート内容のハッシュ・書き込んだ内容のハッシュ・サイズ・更新時刻を
+記録する。再実行時はこの記録と比較し、テンプレートが変更されていて、
+かつ作成後に編集されていないファイルのみを更新する。
+
+作成記録のない既存ファイルのうちテンプレートと内容が異なるもの
+（利用者が用意したファイルなど）は、比較したテンプレートのハッシュと
+サイズ・更新時刻を記録外のファイルとして別に保持し、次回以降は
+どちらも変わっていなければ内容を読まずに比較を省略する。
+
+テンプレートが変わっていないファイルはディスク上のファイルを一切
+参照しないため、多数の対象フォルダへの再適用でも対象フォルダごとの
+処理はマニフェストの読み込みと変更されたテンプレート分の確認で済む。
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = ".autonest-manifest.json"
+
+# 記録形式を変更した場合は更新する（古い形式の記録は読み込まない）
+_FORMAT = 1
+_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_bytes(data):
+    """
+    内容の SHA-256 ハッシュを取得
+
+    Args:
+        data (bytes): 内容
+
+    Returns:
+        str: 16進数のハッシュ値
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path):
+    """
+    ファイル内容の SHA-256 ハッシュを取得（1MB ずつ読み込む）
+
+    Args:
+        path (str): ファイルパス
+
+    Returns:
+        str: 16進数のハッシュ値
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ScaffoldManifest:
+    """
+    対象フォルダ1つ分の作成記録
+
+    Attributes:
+        folder_path (str): 対象フォルダパス
+        path (str): マニフェストファイルパス
+        files (dict): 作成先相対パス -> {"template", "output", "size", "mtime_ns"}
+        unmanaged (dict): テンプレートと内容が異なる記録外のファイルの
+            作成先相対パス -> {"template", "size", "mtime_ns"}
+    """
+
+    def __init__(self, folder_path, files=None):
+        self.folder_path = folder_path
+        self.path = os.path.join(folder_path, MANIFEST_NAME)
+        self.files = files if files is not None else {}
+        self.unmanaged = {}
+        self._changed = False
+
+    @classmethod
+    def load(cls, folder_path):
+        """
+        対象フォルダのマニフェストを読み込む
+
+        存在しない・読み込めない・形式が異なる場合は空の記録を返す
+        （その場合は既存ファイルを更新対象にしない）。
+
+        Args:
+            folder_path (str): 対象フォルダパス
+
+        Returns:
+            ScaffoldManifest: 作成記録
+        """
+        manifest = cls(folder_path)
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return manifest
+        if isinstance(data, dict) and data.get("format") == _FORMAT:
+            files = data.get("files")
+            if isinstance(files, dict):
+                manifest.files = files
+            unmanaged = data.get("unmanaged")
+            if isinstance(unmanaged, dict):
+                manifest.unmanaged = unmanaged
+        return manifest
+
+    def get(self, target_path):
+        """
+        作成先の記録を取得
+
+        Args:
+            target_path (str): 正規化済み作成先相対パス
+
+        Returns:
+            dict or None: 記録。記録がない場合は None
+        """
+        return self.files.get(target_path)
+
+    def is_unmodified(self, target_path):
+        """
+        作成先のファイルが記録時から変更されていないかどうか
+
+        サイズと更新時刻が記録と一致する場合はハッシュを計算しない。
+        一致しない場合のみ内容のハッシュを記録と比較する。
+
+        Args:
+            target_path (str): 正規化済み作成先相対パス
+
+        Returns:
+            bool: 変更されていない場合は True（記録がない場合は False）
+        """
+        entry = self.files.get(target_path)
+        if entry is None:
+            return False
+        full_path = os.path.join(self.folder_path, target_path)
+        try:
+            file_stat = os.stat(full_path)
+            if file_stat.st_size != entry.get("size"):
+                return False
+            if file_stat.st_mtime_ns == entry.get("mtime_ns"):
+                return True
+            return hash_file(full_path) == entry.get("output")
+        except OSError:
+            return False
+
+    def record(self, target_path, template_digest, output_digest):
+        """
+        作成・更新したファイルを記録（現在のサイズ・更新時刻を取得する）
+
+        Args:
+            target_path (str): 正規化済み作成先相対パス
+            template_digest (str): テンプレート内容のハッシュ
+            output_digest (str): 書き込んだ内容のハッシュ
+        """
+        file_stat = os.stat(os.path.join(self.folder_path, target_path))
+        self.files[target_path] = {
+            "template": template_digest,
+            "output": output_digest,
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+        }
+        self.unmanaged.pop(target_path, None)
+        self._changed = True
+
+    def is_known_unmanaged(self, target_path, template_digest):
+        """
+        記録外のファイルが前回の比較時から変わっていないかどうか
+
+        テンプレートのハッシュと作成先のサイズ・更新時刻が前回の比較時と
+        一致する場合は、内容を読まずにテンプレートと異なると判断できる。
+
+        Args:
+            target_path (str): 正規化済み作成先相対パス
+            template_digest (str): 現在のテンプレート内容のハッシュ
+
+        Returns:
+            bool: 前回から変わっていない場合は True
+        """
+        entry = self.unmanaged.get(target_path)
+        if entry is None or entry.get("template") != template_digest:
+            return False
+        try:
+            file_stat = os.stat(os.path.join(self.folder_path, target_path))
+        except OSError:
+            return False
+        return (
+            file_stat.st_size == entry.get("size")
+            and file_stat.st_mtime_ns == entry.get("mtime_ns")
+        )
+
+    def record_unmanaged(self, target_path, template_digest):
+        """
+        テンプレートと内容が異なる記録外のファイルを記録（更新対象にはしない）
+
+        Args:
+            target_path (str): 正規化済み作成先相対パス
+            template_digest (str): 比較したテンプレート内容のハッシュ
+        """
+        file_stat = os.stat(os.path.join(self.folder_path, target_path))
+        self.unmanaged[target_path] = {
+            "template": template_digest,
+            "size": file_stat.st_size,
+            "mtime_ns": file_stat.st_mtime_ns,
+        }
+        self._changed = True
+
+    def save(self):
+        """
+        記録に変更がある場合のみマニフェストファイルに保存する
+
+        書き込み途中の状態が残らないよう一時ファイルからの置き換えで保存する。
+        """
+        if not self._changed:
+            return
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "format": _FORMAT,
+                    "files": self.files,
+                    "unmanaged": self.unmanaged,
+                },
+                f,
+                ensure_ascii=False,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(temp_path, self.path)
+        self._changed = False
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest テンプレートパックモジュール
+
+テンプレート一式をまとめた1つのアーカイブ（zip / tar / tar.gz など）を
+テンプレートの取得元として扱う。メンバーの一覧はアーカイブを開いた時に
+1回だけ読み込み、各メンバーは一時フォルダに展開せず作成先へ直接
+書き出す。作成処理はメンバーをアーカイブ内の格納順に処理するため、
+アーカイブ全体が1つのファイルハンドルからの順次読み込みになる。
+"""
+
+import hashlib
+import os
+import shutil
+import stat
+import threading
+import time
+
+from .fastcopy import remove_partial
+
+_BUFFER_SIZE = 1024 * 1024
+_DEFAULT_MODE = 0o644
+
+
+class TemplatePackError(Exception):
+    """テンプレートパックを開けない場合の例外"""
+
+
+class PackMemberStat:
+    """
+    アーカイブメンバーの stat 相当の情報
+
+    テンプレートキャッシュ・進捗表示・パーミッション設定で
+    os.stat_result の代わりに使用する。
+
+    Attributes:
+        st_size (int): 展開後のサイズ
+        st_mode (int): ファイル種別とパーミッション
+        st_mtime_ns (int): 更新時刻（ナノ秒）
+        st_atime_ns (int): アクセス時刻（ナノ秒、更新時刻と同じ）
+    """
+
+    __slots__ = ("st_size", "st_mode", "st_mtime_ns", "st_atime_ns")
+
+    def __init__(self, size, mode, mtime_ns):
+        self.st_size = size
+        self.st_mode = stat.S_IFREG | mode
+        self.st_mtime_ns = mtime_ns
+        self.st_atime_ns = mtime_ns
+
+
+class PackMember:
+    """
+    テンプレートパック内のファイル
+
+    Attributes:
+        name (str): 正規化済みメンバー名（"/" 区切り）
+        offset (int): アーカイブ内の格納位置（処理順の決定に使用）
+        stat (PackMemberStat): サイズ・パーミッション・更新時刻
+        cache_key (str): テンプレートキャッシュのキー
+    """
+
+    __slots__ = ("name", "offset", "stat", "cache_key", "_entry")
+
+    def __init__(self, name, offset, member_stat, cache_key, entry):
+        self.name = name
+        self.offset = offset
+        self.stat = member_stat
+        self.cache_key = cache_key
+        self._entry = entry  # ZipInfo または TarInfo
+
+
+def _normalize_member_name(name):
+    """メンバー名・テンプレートパスを比較用の "/" 区切りの形に変換"""
+    parts = [
+        part for part in name.replace("\\", "/").split("/") if part not in ("", ".")
+    ]
+    return "/".join(parts)
+
+
+class TemplatePack:
+    """
+    アーカイブ形式のテンプレートパック
+
+    アーカイブは開いたまま保持し、メンバーの読み込みは1つのファイル
+    ハンドルをロックで共有して行う。
+
+    Attributes:
+        path (str): アーカイブファイルパス
+        members (dict): 正規化済みメンバー名 -> PackMember
+    """
+
+    def __init__(self, path):
+        """
+        アーカイブを開いてメンバー一覧を読み込む
+
+        Args:
+            path (str): アーカイブファイルパス（.zip または tarfile が扱える形式）
+
+        Raises:
+            TemplatePackError: アーカイブを開けない・形式が不明な場合
+        """
+        # zipfile / tarfile の読み込みは重いため、パックを使う場合のみ行う
+        import tarfile
+        import zipfile
+
+        self.path = path
+        self.members = {}
+        self._lock = threading.Lock()
+        try:
+            archive_stat = os.stat(path)
+            self._signature = (archive_stat.st_mtime_ns, archive_stat.st_size)
+            self._is_zip = zipfile.is_zipfile(path)
+            if self._is_zip:
+                self._archive = zipfile.ZipFile(path)
+                self._load_zip_index()
+            elif tarfile.is_tarfile(path):
+                self._archive = tarfile.open(path, "r:*")
+                self._load_tar_index()
+            else:
+                raise TemplatePackError(
+                    f"テンプレートパック {path} の形式に対応していません"
+                )
+        except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+            raise TemplatePackError(
+                f"テンプレートパック {path} を開けません: {str(e)}"
+            ) from e
+
+    def _cache_key(self, name):
+        """アーカイブの更新でキャッシュが無効になるようキーに更新時刻を含める"""
+        return f"{self.path}::{self._signature[0]}::{name}"
+
+    def _load_zip_index(self):
+        """zip の中央ディレクトリからメンバー一覧を作成"""
+        for info in self._archive.infolist():
+            if info.is_dir():
+                continue
+            name = _normalize_member_name(info.filename)
+            mode = (info.external_attr >> 16) & 0o7777 or _DEFAULT_MODE
+            mtime_ns = int(time.mktime(info.date_time + (0, 0, -1))) * 10**9
+            self.members[name] = PackMember(
+                name,
+                info.header_offset,
+                PackMemberStat(info.file_size, mode, mtime_ns),
+                self._cache_key(name),
+                info,
+            )
+
+    def _load_tar_index(self):
+        """tar のヘッダーを1回走査してメンバー一覧を作成"""
+        for info in self._archive.getmembers():
+            if not info.isfile():
+                continue
+            name = _normalize_member_name(info.name)
+            mode = info.mode & 0o7777 or _DEFAULT_MODE
+            mtime_ns = int(info.mtime) * 10**9
+            self.members[name] = PackMember(
+                name,
+                info.offset_data,
+                PackMemberStat(info.size, mode, mtime_ns),
+                self._cache_key(name),
+                info,
+            )
+
+    @property
+    def signature(self):
+        """開いた時点のアーカイブの (mtime_ns, サイズ)"""
+        return self._signature
+
+    def find(self, template_path):
+        """
+        テンプレートパスに対応するメンバーを取得
+
+        Args:
+            template_path (str): 設定の template_path
+
+        Returns:
+            PackMember or None: メンバー。パック内にない場合は None
+        """
+        return self.members.get(_normalize_member_name(template_path))
+
+    def _open(self, member):
+        """メンバーの読み込み用ファイルオブジェクトを開く（ロック内で呼ぶ）"""
+        if self._is_zip:
+            return self._archive.open(member._entry)
+        return self._archive.extractfile(member._entry)
+
+    def read(self, member):
+        """
+        メンバーの内容を読み込む
+
+        Args:
+            member (PackMember): メンバー
+
+        Returns:
+            bytes: 展開後の内容
+        """
+        with self._lock:
+            with self._open(member) as source:
+                return source.read()
+
+    def hash(self, member):
+        """
+        メンバーの内容の SHA-256 ハッシュを取得
+
+        大きいメンバーでもメモリ使用量が一定になるよう 1MB ずつ読み込む。
+
+        Args:
+            member (PackMember): メンバー
+
+        Returns:
+            str: 16進数のハッシュ値
+        """
+        digest = hashlib.sha256()
+        with self._lock:
+            with self._open(member) as source:
+                for chunk in iter(lambda: source.read(_BUFFER_SIZE), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def extract(self, member, target_path, copy_metadata=True):
+        """
+        メンバーを作成先ファイルへ直接書き出す
+
+        既存ファイルを誤って上書きしないよう排他モードで作成し、
+        パーミッション（copy_metadata が True の場合は更新時刻も）を
+        アーカイブの記録に合わせる。
+
+        Args:
+            member (PackMember): メンバー
+            target_path (str): 作成先の絶対パス
+            copy_metadata (bool): 更新時刻をアーカイブの記録に合わせるかどうか
+        """
+        with open(target_path, "xb") as target:
+            try:
+                with self._lock:
+                    with self._open(member) as source:
+                        shutil.copyfileobj(source, target, _BUFFER_SIZE)
+            except BaseException:
+                remove_partial(target, target_path)
+                raise
+        os.chmod(target_path, stat.S_IMODE(member.stat.st_mode))
+        if copy_metadata:
+            os.utime(
+                target_path, ns=(member.stat.st_atime_ns, member.stat.st_mtime_ns)
+            )
+
+    def close(self):
+        """アーカイブを閉じる"""
+        self._archive.close()
@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 作成計画モジュール
+
+選択された項目をパスツリー（tree モジュール）にまとめ、対象フォルダを
+os.scandir で1回ずつ走査したインデックスから各ノードの状態を判定して、
+作成が必要なディレクトリ・ファイルの最小集合（target_path の暗黙の親
+ディレクトリを含む）を計算する。プレビュー表示と作成処理はどちらも
+この計画を使うため、両者の内容が食い違うことはない。
+"""
+
+import os
+import time
+
+from .fastcopy import FILE_MODES, MODE_COPY
+from .tree import (
+    DIR,
+    FILE,
+    STATUS_CONFLICT,
+    STATUS_ERROR,
+    STATUS_EXISTING,
+    STATUS_NEW,
+    PathTree,
+)
+
+
+def normalize_relpath(path):
+    """
+    設定内の相対パスを "/" 区切りの正規形に変換
+
+    Args:
+        path (str): 相対パス（"/" または "\\" 区切り）
+
+    Returns:
+        str: 正規化した相対パス（例: "Assets/Editor"）
+    """
+    parts = []
+    for part in path.replace("\\", "/").split("/"):
+        if part in ("", "."):
+            continue
+        parts.append(part)
+    return "/".join(parts)
+
+
+class FileSystemIndex:
+    """
+    対象フォルダ内の既存項目インデックス
+
+    ディレクトリは必要になった時点で os.scandir により1回だけ走査され、
+    結果はキャッシュされる。存在しないディレクトリの配下はシステムコール
+    なしで「存在しない」と判定する。
+
+    Attributes:
+        root (str): 対象フォルダパス
+        scan_count (int): 実行した scandir の回数
+        scan_seconds (float): scandir による走査に使った時間（秒）
+    """
+
+    def __init__(self, root):
+        """
+        インデックスの初期化
+
+        Args:
+            root (str): 対象フォルダパス
+        """
+        self.root = root
+        self.scan_count = 0
+        self.scan_seconds = 0.0
+        self._entries = {}  # 相対ディレクトリパス -> {正規化名: DIR/FILE} または None
+
+    @staticmethod
+    def _key(name):
+        """大文字小文字を区別しないファイルシステム向けに名前を正規化"""
+        return os.path.normcase(name)
+
+    def _listdir(self, rel_dir):
+        """
+        ディレクトリの内容を取得（未走査の場合のみ scandir を実行）
+
+        Args:
+            rel_dir (str): 相対ディレクトリパス（"" は対象フォルダ自体）
+
+        Returns:
+            dict or None: 名前と種別の辞書。ディレクトリが存在しない場合は None
+        """
+        if rel_dir in self._entries:
+            return self._entries[rel_dir]
+
+        entries = None
+        if not rel_dir or self.kind(rel_dir) == DIR:
+            full_path = os.path.join(self.root, rel_dir) if rel_dir else self.root
+            start = time.perf_counter()
+            try:
+                entries = {}
+                with os.scandir(full_path) as it:
+                    for entry in it:
+                        try:
+                            kind = DIR if entry.is_dir() else FILE
+                        except OSError:
+                            kind = FILE
+                        entries[self._key(entry.name)] = kind
+            except OSError:
+                entries = None
+            self.scan_count += 1
+            self.scan_seconds += time.perf_counter() - start
+
+        self._entries[rel_dir] = entries
+        return entries
+
+    def kind(self, rel_path):
+        """
+        相対パスの種別を取得
+
+        Args:
+            rel_path (str): 正規化済み相対パス
+
+        Returns:
+            str or None: DIR / FILE、存在しない場合は None
+        """
+        parent, _, name = rel_path.rpartition("/")
+        entries = self._listdir(parent)
+        if entries is None:
+            return None
+        return entries.get(self._key(name))
+
+    def mark_created(self, rel_path, kind):
+        """
+        作成した項目をインデックスに反映
+
+        走査済みの親ディレクトリにのみ追加するため、再走査は不要になる。
+
+        Args:
+            rel_path (str): 正規化済み相対パス
+            kind (str): DIR または FILE
+        """
+        parent, _, name = rel_path.rpartition("/")
+        entries = self._entries.get(parent)
+        if entries is not None:
+            entries[self._key(name)] = kind
+        if kind == DIR:
+            self._entries[rel_path] = {}
+
+
+class PlannedFile:
+    """
+    作成予定のファイル
+
+    Attributes:
+        name (str): ファイル名（UI表示名）
+        config (dict): ファイル設定
+        target_path (str): 正規化済みの作成先相対パス
+        template_path (str): テンプレートファイルパス
+        template_stat (os.stat_result): 計画時に取得したテンプレートの stat
+            （パック内のテンプレートは PackMemberStat）
+        pack_member (PackMember): テンプレートパック内のメンバー
+            （ファイルシステム上のテンプレートの場合は None）
+        update (bool): 既存ファイルをテンプレートの内容で置き換える場合は True
+    """
+
+    def __init__(
+        self, name, config, target_path, template_path, template_stat, pack_member=None
+    ):
+        self.name = name
+        self.config = config
+        self.target_path = target_path
+        self.template_path = template_path
+        self.template_stat = template_stat
+        self.pack_member = pack_member
+        self.update = False
+
+    @property
+    def template_size(self):
+        """テンプレートファイルのサイズ"""
+        return self.template_stat.st_size
+
+
+class ScaffoldPlan:
+    """
+    フォルダ・ファイル作成計画
+
+    Attributes:
+        folder_path (str): 対象フォルダパス
+        index (FileSystemIndex): 計画作成に使用したインデックス
+        template_pack (TemplatePack): テンプレートの取得に使うパック（なければ None）
+        tree (PathTree): 状態判定済みのパスツリー
+        folder_entries (list): (フォルダ, 状態) のリスト（選択順）
+        file_entries (list): (ファイル名, 作成先相対パス, 状態) のリスト（選択順）
+        dirs_to_create (list): 作成するディレクトリ（親から順）
+        explicit_dirs (set): dirs_to_create のうち選択されたフォルダ
+        files_to_create (list): 作成する PlannedFile のリスト
+        files_to_update (list): 置き換える既存ファイルの PlannedFile のリスト
+        existing_planned (list): 作成先が既に存在する PlannedFile のリスト
+        existing_folders (list): 既存フォルダリスト
+        existing_files (list): 既存ファイルリスト
+        errors (list): 計画時に検出したエラーリスト
+        manifest (ScaffoldManifest): 差分の判定に使用した作成記録（なければ None）
+    """
+
+    def __init__(self, folder_path, index, template_pack=None):
+        self.folder_path = folder_path
+        self.index = index
+        self.template_pack = template_pack
+        self.tree = PathTree()
+        self.folder_entries = []
+        self.file_entries = []
+        self.dirs_to_create = []
+        self.explicit_dirs = set()
+        self.files_to_create = []
+        self.files_to_update = []
+        self.existing_planned = []
+        self.existing_folders = []
+        self.existing_files = []
+        self.errors = []
+        self.manifest = None
+
+    @property
+    def total_items(self):
+        """計画対象の項目数（選択されたフォルダ数 + ファイル数）"""
+        return len(self.folder_entries) + len(self.file_entries)
+
+    @property
+    def pending_items(self):
+        """実際に作成・更新する選択項目の数"""
+        return (
+            len(self.explicit_dirs)
+            + len(self.files_to_create)
+            + len(self.files_to_update)
+        )
+
+    def drop_new_items(self):
+        """
+        新規作成する項目を計画から除き、既存ファイルの更新のみを残す
+
+        監視モードのように、利用者が削除した項目を作り直さずにテンプレートの
+        変更だけを反映する場合に使う。
+        """
+        self.dirs_to_create = []
+        self.explicit_dirs = set()
+        self.files_to_create = []
+
+    def render_tree(self):
+        """
+        計画内容を入れ子のツリー形式の文字列で表現
+
+        Returns:
+            str: ツリー構造を表現した文字列
+        """
+        root_label = os.path.basename(self.folder_path) or self.folder_path
+        return "\n".join(self.tree.render(root_label))
+
+
+def build_plan(
+    folder_path, selected_folders, selected_files, index=None, template_pack=None
+):
+    """
+    作成計画を構築
+
+    選択項目をパスツリーに挿入し、インデックスを参照して各ノードの状態を
+    判定した上で、作成が必要なディレクトリとファイルを求める。
+    テンプレートはパック内を先に探し、見つからない場合のみパスごとに
+    1回だけ stat される。
+
+    Args:
+        folder_path (str): 対象フォルダパス
+        selected_folders (list): 作成対象フォルダリスト
+        selected_files (list): (ファイル名, ファイル設定) のタプルリスト
+        index (FileSystemIndex): 再利用するインデックス（省略時は新規作成）
+        template_pack (TemplatePack): テンプレートパック（省略可）
+
+    Returns:
+        ScaffoldPlan: 作成計画
+    """
+    if index is None:
+        index = FileSystemIndex(folder_path)
+    plan = ScaffoldPlan(folder_path, index, template_pack)
+    tree = plan.tree
+
+    # フォルダをツリーに追加
+    folder_nodes = []
+    for folder in selected_folders:
+        node, conflict = tree.insert(normalize_relpath(folder), DIR)
+        if node is None:
+            plan.errors.append(f"{folder}: 作成先が {conflict} と競合しています")
+        folder_nodes.append((folder, node))
+
+    # ファイルをツリーに追加
+    file_nodes = []
+    template_sources = {}  # テンプレートパス -> (stat, パックのメンバー)
+    for file_name, file_config in selected_files:
+        target_path = file_config.get("target_path", file_name)
+        template_path = file_config.get("template_path", "")
+
+        # テンプレートの存在確認（stat はキャッシュ検証・進捗表示に使用）
+        if template_path not in template_sources:
+            member = None
+            if template_pack is not None:
+                # 設定ファイル基準で解決する前の相対パスでパック内を検索する
+                member = template_pack.find(
+                    file_config.get("template_member", template_path)
+                )
+            if member is not None:
+                template_sources[template_path] = (member.stat, member)
+            else:
+                try:
+                    template_sources[template_path] = (os.stat(template_path), None)
+                except OSError:
+                    template_sources[template_path] = (None, None)
+        template_stat, member = template_sources[template_path]
+
+        mode = file_config.get("mode", MODE_COPY)
+        node, conflict = tree.insert(normalize_relpath(target_path), FILE)
+        if node is None:
+            plan.errors.append(
+                f"{file_name}: 作成先 {target_path} が {conflict} と競合しています"
+            )
+        elif mode not in FILE_MODES:
+            node.error = True
+            plan.errors.append(f"{file_name}: 不明な mode {mode} が指定されています")
+        elif mode != MODE_COPY and file_config.get("render"):
+            node.error = True
+            plan.errors.append(
+                f"{file_name}: render 指定のファイルには mode {mode} を使用できません"
+            )
+        elif template_stat is None:
+            node.error = True
+            plan.errors.append(
+                f"{file_name}: テンプレートファイル {template_path} が見つかりません"
+            )
+        file_nodes.append(
+            (file_name, file_config, target_path, template_stat, member, node)
+        )
+
+    # 1回の走査で全ノードの状態を判定
+    tree.annotate(index)
+
+    for folder, node in folder_nodes:
+        if node is None:
+            plan.folder_entries.append((folder, STATUS_ERROR))
+            continue
+        plan.folder_entries.append((folder, node.status))
+        if node.status == STATUS_EXISTING:
+            plan.existing_folders.append(folder)
+        elif node.status == STATUS_CONFLICT:
+            plan.errors.append(
+                f"{folder}: 同名のファイル {node.conflict_path} が既に存在します"
+            )
+
+    for file_name, file_config, target_path, template_stat, member, node in file_nodes:
+        template_path = file_config.get("template_path", "")
+        if node is None:
+            plan.file_entries.append((file_name, target_path, STATUS_ERROR))
+            continue
+        plan.file_entries.append((file_name, target_path, node.status))
+        if node.status == STATUS_EXISTING:
+            plan.existing_files.append(file_name)
+            plan.existing_planned.append(
+                PlannedFile(
+                    file_name,
+                    file_config,
+                    node.path,
+                    template_path,
+                    template_stat,
+                    member,
+                )
+            )
+        elif node.status == STATUS_CONFLICT:
+            plan.errors.append(
+                f"{file_name}: 作成先 {target_path} が既存の "
+                f"{node.conflict_path} と競合しています"
+            )
+        elif node.status == STATUS_NEW:
+            plan.files_to_create.append(
+                PlannedFile(
+                    file_name,
+                    file_config,
+                    node.path,
+                    template_path,
+                    template_stat,
+                    member,
+                )
+            )
+
+    # 親ディレクトリから順（前順）に作成するディレクトリを列挙
+    for node in tree.walk():
+        if node.kind == DIR and node.needed:
+            plan.dirs_to_create.append(node.path)
+            if node.explicit:
+                plan.explicit_dirs.add(node.path)
+    return plan
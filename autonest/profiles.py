@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest プロファイルモジュール
+
+用途ごとのフォルダ・ファイル構成（Unity・Web・Python サービスなど）を
+プロファイルとして1つのフォルダ（既定は設定ファイルと同じ場所の profiles/）に
+まとめて管理する。
+
+    profiles/
+    ├── index.json    # 一覧: {"profiles": [{"name", "file", "description"}]}
+    ├── base.json
+    └── unity.json    # {"extends": "base", "default_folders": [...], ...}
+
+一覧の表示には小さな index.json のみを読み込み、プロファイルの内容は
+選択されたものだけを解析・検証する。index.json がない場合はフォルダ内の
+*.json のファイル名を一覧として使う（内容は読まない）。
+
+プロファイルは config.json と同じ形式で、extends で別のプロファイルを
+継承できる。継承元の default_folders / default_files の後に継承先の項目が
+追加され（同じ name のファイルは継承先が優先）、window_settings などの
+セクションはキーごとに上書きされる。選択したプロファイルの項目は
+config.json の項目を置き換え、それ以外の設定は config.json の値を引き継ぐ。
+相対パスはプロファイルのフォルダを基準に解決する。
+"""
+
+import json
+import os
+
+from .config import (
+    CONFIG_SCHEMA,
+    ConfigError,
+    normalize_config,
+    parse_config_data,
+    validate_config,
+)
+
+INDEX_FILE = "index.json"
+
+# 継承時に連結する項目（それ以外のオブジェクトはキーごとに上書きする）
+_ITEM_KEYS = ("default_folders", "default_files")
+
+PROFILE_SCHEMA = dict(
+    CONFIG_SCHEMA,
+    properties=dict(
+        CONFIG_SCHEMA["properties"], extends="string", description="string"
+    ),
+)
+
+_INDEX_SCHEMA = {
+    "type": "object",
+    "required": ("profiles",),
+    "properties": {
+        "profiles": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ("name",),
+                "properties": {
+                    "name": "string",
+                    "file": "string",
+                    "description": "string",
+                },
+            },
+        },
+    },
+}
+
+
+class ProfileInfo:
+    """
+    プロファイル一覧の1項目
+
+    Attributes:
+        name (str): プロファイル名
+        path (str): プロファイルファイルのパス
+        description (str): 説明（一覧に表示する）
+    """
+
+    def __init__(self, name, path, description=""):
+        self.name = name
+        self.path = path
+        self.description = description
+
+
+def _read_json(path):
+    """
+    JSON ファイルを読み込み、解析結果と stat による署名を返す
+
+    Raises:
+        ConfigError: 読み込めない・JSON の構文エラーの場合
+    """
+    try:
+        with open(path, "rb") as f:
+            signature = _signature(os.fstat(f.fileno()))
+            data = f.read()
+    except OSError as e:
+        raise ConfigError(path, [str(e)]) from e
+    return parse_config_data(data, path), signature
+
+
+def _signature(file_stat):
+    """ファイルの変更検出用の署名（更新時刻とサイズ）"""
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+def _merge(base, override):
+    """
+    継承元の設定に継承先の設定を重ねる
+
+    Args:
+        base (dict): 継承元の設定
+        override (dict): 継承先の設定
+
+    Returns:
+        dict: 統合した設定（元の辞書は変更しない）
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if key in ("extends", "description"):
+            continue
+        if key in _ITEM_KEYS:
+            merged[key] = list(merged.get(key, [])) + list(value)
+        elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = dict(merged[key], **value)
+        else:
+            merged[key] = value
+    return merged
+
+
+class ProfileLibrary:
+    """
+    プロファイルフォルダ
+
+    解析・検証したプロファイルファイルと継承の解決結果はファイルの
+    更新時刻・サイズとともに保持し、変更されていなければ再利用する。
+
+    Attributes:
+        directory (str): プロファイルフォルダのパス
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._index = None  # (署名, ProfileInfo のリスト)
+        self._files = {}  # パス -> (署名, 検証済みの内容)
+        self._resolved = {}  # 名前 -> (継承元を含む署名のタプル, 統合した設定)
+
+    @property
+    def index_path(self):
+        """一覧ファイル（index.json）のパス"""
+        return os.path.join(self.directory, INDEX_FILE)
+
+    def list_profiles(self):
+        """
+        プロファイルの一覧を取得（プロファイルの内容は読まない）
+
+        Returns:
+            list: ProfileInfo のリスト（フォルダがない場合は空）
+
+        Raises:
+            ConfigError: index.json の内容が不正な場合
+        """
+        try:
+            index_stat = os.stat(self.index_path)
+        except OSError:
+            return self._scan_profiles()
+        if self._index is not None and self._index[0] == _signature(index_stat):
+            return list(self._index[1])
+
+        index, signature = _read_json(self.index_path)
+        validate_config(index, self.index_path, _INDEX_SCHEMA)
+        profiles = []
+        for entry in index["profiles"]:
+            file_name = entry.get("file") or f"{entry['name']}.json"
+            profiles.append(
+                ProfileInfo(
+                    entry["name"],
+                    os.path.join(self.directory, file_name),
+                    entry.get("description", ""),
+                )
+            )
+        self._index = (signature, profiles)
+        return list(profiles)
+
+    def _scan_profiles(self):
+        """index.json がない場合にファイル名からプロファイルの一覧を作成"""
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError:
+            return []
+        return [
+            ProfileInfo(name[: -len(".json")], os.path.join(self.directory, name))
+            for name in names
+            if name.endswith(".json") and name != INDEX_FILE
+        ]
+
+    def profile_path(self, name):
+        """
+        プロファイル名からファイルパスを求める
+
+        Args:
+            name (str): プロファイル名
+
+        Returns:
+            str: 一覧に登録されたファイル、登録がない場合は <name>.json のパス
+        """
+        for profile in self.list_profiles():
+            if profile.name == name:
+                return profile.path
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _load_file(self, path):
+        """
+        プロファイルファイルを解析・検証（変更されていなければ前回の結果を返す）
+
+        Returns:
+            tuple: (署名, 検証済みの内容)
+
+        Raises:
+            ConfigError: 読み込めない・内容が不正な場合
+        """
+        cached = self._files.get(path)
+        if cached is not None:
+            try:
+                if cached[0] == _signature(os.stat(path)):
+                    return cached
+            except OSError:
+                pass
+        profile, signature = _read_json(path)
+        validate_config(profile, path, PROFILE_SCHEMA)
+        self._files[path] = (signature, profile)
+        return signature, profile
+
+    def _is_current(self, signatures):
+        """継承の解決結果が参照したファイルが変更されていないかどうか"""
+        for path, signature in signatures:
+            try:
+                if _signature(os.stat(path)) != signature:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def resolve(self, name, _chain=()):
+        """
+        プロファイルの継承を解決した設定を取得（正規化は行わない）
+
+        Args:
+            name (str): プロファイル名
+
+        Returns:
+            dict: 継承元を統合した設定
+
+        Raises:
+            ConfigError: プロファイルが見つからない・内容が不正・継承が循環している場合
+        """
+        cached = self._resolved.get(name)
+        if cached is not None and self._is_current(cached[0]):
+            return cached[1]
+
+        path = self.profile_path(name)
+        if name in _chain:
+            cycle = " → ".join(_chain + (name,))
+            raise ConfigError(path, [f"extends が循環しています: {cycle}"])
+        if not os.path.isfile(path):
+            raise ConfigError(path, [f"プロファイル {name} が見つかりません"])
+
+        signature, profile = self._load_file(path)
+        signatures = ((path, signature),)
+        merged = {}
+        parent = profile.get("extends")
+        if parent:
+            merged = self.resolve(parent, _chain + (name,))
+            signatures = self._resolved[parent][0] + signatures
+        merged = _merge(merged, profile)
+        self._resolved[name] = (signatures, merged)
+        return merged
+
+    def load(self, name, base_config=None):
+        """
+        プロファイルを適用した設定を取得
+
+        Args:
+            name (str): プロファイル名
+            base_config (dict): 項目以外の設定を引き継ぐ設定（通常は config.json）
+
+        Returns:
+            dict: 正規化した設定情報辞書
+
+        Raises:
+            ConfigError: プロファイルが見つからない・内容が不正な場合
+        """
+        profile = self.resolve(name)
+        settings = {
+            key: value
+            for key, value in (base_config or {}).items()
+            if key not in _ITEM_KEYS
+        }
+        return normalize_config(
+            _merge(settings, profile), self.directory, self.profile_path(name)
+        )
+
+    def build_index(self):
+        """
+        フォルダ内の *.json から index.json を作成（説明は各プロファイルから読む）
+
+        Returns:
+            list: 一覧に登録した ProfileInfo のリスト
+
+        Raises:
+            ConfigError: プロファイルを読み込めない場合
+            OSError: index.json を保存できない場合
+        """
+        profiles = []
+        entries = []
+        for profile in self._scan_profiles():
+            _, content = self._load_file(profile.path)
+            profile.description = content.get("description", "")
+            profiles.append(profile)
+            entries.append(
+                {
+                    "name": profile.name,
+                    "file": os.path.basename(profile.path),
+                    "description": profile.description,
+                }
+            )
+
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"profiles": entries}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        os.replace(temp_path, self.index_path)
+        return profiles
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 実行レポートモジュール
+
+作成処理の各段階（設定読み込み・走査・計画・フォルダ作成・ファイル作成など）
+の経過時間、書き込んだバイト数、ファイルシステム操作の回数、処理に時間の
+かかった項目を記録する。結果は JSON と Prometheus の textfile 形式で
+出力でき、遅い作成処理が走査（stat）・コピー・画面更新のどれに
+時間を使っているかを確認できる。
+"""
+
+import heapq
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# 段階の表示順（記録されなかった段階は出力しない）
+PHASES = (
+    "config_load",
+    "scan",
+    "plan",
+    "manifest",
+    "mkdir",
+    "copy",
+    "verify",
+    "rollback",
+    "ui_log",
+)
+
+_DEFAULT_SLOWEST = 10
+
+
+class RunReport:
+    """
+    1回の実行（一括作成の場合は全対象フォルダ）の計測結果
+
+    ワーカースレッドから同時に記録できるようロックで保護する。
+
+    Attributes:
+        phases (dict): 段階名 -> 経過時間（秒、同じ段階は合計する）
+        counters (dict): 操作名 -> 回数（bytes_written はバイト数）
+        slowest_count (int): 保持する低速な項目の数
+    """
+
+    def __init__(self, slowest_count=_DEFAULT_SLOWEST):
+        self.phases = {}
+        self.counters = {}
+        self.slowest_count = slowest_count
+        self._slowest = []  # (経過時間, 相対パス, バイト数) の最小ヒープ
+        self._started = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name):
+        """
+        with ブロックの経過時間を段階 name に加算する
+
+        Args:
+            name (str): 段階名（PHASES のいずれか）
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        """
+        段階の経過時間を加算
+
+        Args:
+            name (str): 段階名
+            seconds (float): 経過時間（秒）
+        """
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count(self, name, amount=1):
+        """
+        操作回数を加算
+
+        Args:
+            name (str): 操作名（例: "mkdir", "copy.reflink"）
+            amount (int): 加算する回数
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def item(self, path, seconds, nbytes=0):
+        """
+        1項目の処理時間を記録（上位 slowest_count 件のみ保持する）
+
+        Args:
+            path (str): 項目の相対パス
+            seconds (float): 処理時間（秒）
+            nbytes (int): 書き込んだバイト数
+        """
+        entry = (seconds, path, nbytes)
+        with self._lock:
+            if len(self._slowest) < self.slowest_count:
+                heapq.heappush(self._slowest, entry)
+            elif entry > self._slowest[0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def merge(self, data):
+        """
+        別プロセスの計測結果（to_dict の出力）を取り込む
+
+        Args:
+            data (dict): 計測結果辞書
+        """
+        for name, seconds in data.get("phases", {}).items():
+            self.add_time(name, seconds)
+        for name, amount in data.get("counters", {}).items():
+            self.count(name, amount)
+        for entry in data.get("slowest", []):
+            self.item(entry["path"], entry["seconds"], entry["bytes"])
+
+    @property
+    def slowest(self):
+        """処理時間の長い順の (経過時間, 相対パス, バイト数) のリスト"""
+        with self._lock:
+            return sorted(self._slowest, reverse=True)
+
+    def to_dict(self):
+        """
+        計測結果を辞書形式に変換
+
+        Returns:
+            dict: 計測結果辞書
+        """
+        with self._lock:
+            phases = dict(self.phases)
+            counters = dict(self.counters)
+        ordered = [name for name in PHASES if name in phases]
+        ordered += sorted(name for name in phases if name not in PHASES)
+        return {
+            "wall_seconds": round(time.perf_counter() - self._started, 6),
+            "phases": {name: round(phases[name], 6) for name in ordered},
+            "counters": dict(sorted(counters.items())),
+            "slowest": [
+                {"path": path, "seconds": round(seconds, 6), "bytes": nbytes}
+                for seconds, path, nbytes in self.slowest
+            ],
+        }
+
+    def summary_lines(self):
+        """
+        計測結果の表示行を生成
+
+        Returns:
+            list: 表示行リスト
+        """
+        data = self.to_dict()
+        lines = ["⏱️ 処理時間:"]
+        for name, seconds in data["phases"].items():
+            lines.append(f"   {name}: {seconds * 1000:.1f}ms")
+        if data["counters"]:
+            counters = data["counters"].items()
+            lines.append(
+                "📊 操作回数: " + ", ".join(f"{name}={value}" for name, value in counters)
+            )
+        for entry in data["slowest"][:5]:
+            lines.append(
+                f"🐢 {entry['path']}: {entry['seconds'] * 1000:.1f}ms "
+                f"({entry['bytes']} bytes)"
+            )
+        return lines
+
+    def write_json(self, path):
+        """
+        計測結果を JSON ファイルに保存
+
+        Args:
+            path (str): 保存先ファイルパス
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def write_prometheus(self, path):
+        """
+        計測結果を Prometheus の node_exporter textfile 形式で保存
+
+        node_exporter が書き込み途中のファイルを読まないよう、一時ファイル
+        からの置き換えで保存する。
+
+        Args:
+            path (str): 保存先ファイルパス（通常は *.prom）
+        """
+        data = self.to_dict()
+        lines = [
+            "# HELP autonest_run_seconds Wall time of the last AutoNest run.",
+            "# TYPE autonest_run_seconds gauge",
+            f"autonest_run_seconds {data['wall_seconds']}",
+            "# HELP autonest_phase_seconds Time spent in each phase of the last run.",
+            "# TYPE autonest_phase_seconds gauge",
+        ]
+        lines += [
+            f'autonest_phase_seconds{{phase="{name}"}} {seconds}'
+            for name, seconds in data["phases"].items()
+        ]
+        lines += [
+            "# HELP autonest_operations_total Filesystem operations in the last run.",
+            "# TYPE autonest_operations_total gauge",
+        ]
+        lines += [
+            f'autonest_operations_total{{operation="{name}"}} {value}'
+            for name, value in data["counters"].items()
+        ]
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, path)
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest テンプレート変数置換モジュール
+
+テンプレート内の {{ 変数名 }} を設定・CLI から与えた値に置き換える。
+テンプレートは1回だけ解析されて str.format_map ベースの描画関数に
+変換され、同じバッチ内のすべての作成先で再利用される。
+"""
+
+import datetime
+import os
+import re
+import threading
+
+_VARIABLE_PATTERN = re.compile(r"\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}")
+
+
+class TemplateError(Exception):
+    """テンプレートの描画に失敗した場合の例外"""
+
+
+class CompiledTemplate:
+    """
+    解析済みテンプレート
+
+    Attributes:
+        variables (frozenset): テンプレート内で参照されている変数名
+    """
+
+    def __init__(self, text):
+        """
+        テンプレート文字列を解析して描画関数を生成
+
+        Args:
+            text (str): テンプレート文字列
+        """
+        parts = _VARIABLE_PATTERN.split(text)
+        # 偶数番目がリテラル、奇数番目が変数名。リテラル中の波括弧は
+        # format 用にエスケープし、変数は {名前} に置き換える
+        pieces = []
+        for i, part in enumerate(parts):
+            if i % 2:
+                pieces.append("{" + part + "}")
+            else:
+                pieces.append(part.replace("{", "{{").replace("}", "}}"))
+        self.variables = frozenset(parts[1::2])
+        self._render = "".join(pieces).format_map
+
+    def render(self, variables):
+        """
+        変数を置換した文字列を生成
+
+        Args:
+            variables (dict): 変数名と値の辞書
+
+        Returns:
+            str: 描画結果
+
+        Raises:
+            TemplateError: 未定義の変数が参照されている場合
+        """
+        try:
+            return self._render(variables)
+        except KeyError as e:
+            raise TemplateError(f"未定義の変数 {e.args[0]} が参照されています")
+
+
+class TemplateLibrary:
+    """
+    解析済みテンプレートのキャッシュ
+
+    テンプレートの更新時刻（mtime）またはサイズが変わった場合は再解析する。
+    """
+
+    def __init__(self):
+        self._compiled = {}  # パス -> (mtime_ns, サイズ, CompiledTemplate)
+        self._lock = threading.Lock()
+
+    def get(
+        self, path, stat_result, encoding="utf-8", template_cache=None, loader=None
+    ):
+        """
+        解析済みテンプレートを取得
+
+        Args:
+            path (str): テンプレートファイルパス（キャッシュのキー）
+            stat_result (os.stat_result): テンプレートの stat
+            encoding (str): テンプレートの文字コード
+            template_cache (TemplateCache): 内容の読み込みに使うキャッシュ（省略可）
+            loader (callable): 内容を返す読み込み関数（省略時は path を読む）
+
+        Returns:
+            CompiledTemplate: 解析済みテンプレート
+        """
+        key = (path, encoding)
+        with self._lock:
+            entry = self._compiled.get(key)
+        if (
+            entry is not None
+            and entry[0] == stat_result.st_mtime_ns
+            and entry[1] == stat_result.st_size
+        ):
+            return entry[2]
+
+        data = None
+        if template_cache is not None:
+            data = template_cache.get(path, stat_result, loader)
+        if data is None and loader is not None:
+            data = loader()
+        elif data is None:
+            with open(path, "rb") as f:
+                data = f.read()
+        compiled = CompiledTemplate(data.decode(encoding))
+
+        with self._lock:
+            self._compiled[key] = (
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                compiled,
+            )
+        return compiled
+
+
+def builtin_variables(folder_path):
+    """
+    作成先ごとに自動で定義される組み込み変数を生成
+
+    Args:
+        folder_path (str): 対象フォルダパス
+
+    Returns:
+        dict: project_name / date / year を含む辞書
+    """
+    today = datetime.date.today()
+    abs_path = os.path.abspath(folder_path)
+    return {
+        "project_name": os.path.basename(abs_path.rstrip("\\/")) or abs_path,
+        "date": today.isoformat(),
+        "year": str(today.year),
+    }
+
+
+def parse_variable_assignments(assignments):
+    """
+    "名前=値" 形式の文字列リストを辞書に変換
+
+    Args:
+        assignments (list): "名前=値" 形式の文字列リスト
+
+    Returns:
+        dict: 変数名と値の辞書
+
+    Raises:
+        ValueError: 形式が正しくない場合
+    """
+    variables = {}
+    for assignment in assignments or []:
+        name, sep, value = assignment.partition("=")
+        name = name.strip()
+        if not sep or not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+            raise ValueError(f"変数の指定が正しくありません: {assignment}")
+        variables[name] = value
+    return variables
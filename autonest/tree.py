@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest パスツリー（トライ木）モジュール
+
+作成対象のフォルダ・ファイルの相対パスを共通の親ディレクトリで
+まとめたトライ木として保持する。各ノードはファイルシステムの走査結果から
+新規 / 既存 / 競合 の状態を付与され、作成計画とプレビュー表示の両方に
+使用される。
+"""
+
+import os
+
+DIR = "dir"
+FILE = "file"
+
+STATUS_NEW = "new"
+STATUS_EXISTING = "existing"
+STATUS_CONFLICT = "conflict"
+STATUS_ERROR = "error"
+
+STATUS_MARKS = {
+    STATUS_NEW: " （新規）",
+    STATUS_EXISTING: " （既存）",
+    STATUS_CONFLICT: " （競合）",
+    STATUS_ERROR: " （エラー）",
+}
+
+
+class PathNode:
+    """
+    パスツリーのノード
+
+    Attributes:
+        name (str): パスの最後の要素
+        path (str): 正規化済み相対パス（ルートは ""）
+        kind (str): DIR または FILE
+        children (dict): 子ノード（正規化名 -> PathNode、挿入順）
+        explicit (bool): 選択された項目そのものかどうか（暗黙の親は False）
+        error (bool): テンプレート不在などで作成できない項目かどうか
+        status (str): 新規 / 既存 / 競合 / エラー
+        conflict_path (str): 競合の原因となった既存パス
+        needed (bool): 作成処理で実際に作成する必要があるかどうか
+    """
+
+    __slots__ = (
+        "name",
+        "path",
+        "kind",
+        "children",
+        "explicit",
+        "error",
+        "status",
+        "conflict_path",
+        "needed",
+    )
+
+    def __init__(self, name, path, kind):
+        self.name = name
+        self.path = path
+        self.kind = kind
+        self.children = {}
+        self.explicit = False
+        self.error = False
+        self.status = STATUS_NEW
+        self.conflict_path = None
+        self.needed = False
+
+
+class PathTree:
+    """
+    作成対象パスのトライ木
+
+    Attributes:
+        root (PathNode): 対象フォルダを表すルートノード
+    """
+
+    def __init__(self):
+        self.root = PathNode("", "", DIR)
+        self.root.status = STATUS_EXISTING
+
+    def insert(self, rel_path, kind, explicit=True):
+        """
+        パスをツリーに追加
+
+        途中の要素はディレクトリノードとして共有される。
+
+        Args:
+            rel_path (str): 正規化済み相対パス
+            kind (str): DIR または FILE
+            explicit (bool): 選択された項目かどうか
+
+        Returns:
+            tuple: (追加・再利用したノード, 競合したパス)。
+                競合した場合はノードが None になる。
+        """
+        if not rel_path:
+            return (self.root, None) if kind == DIR else (None, "")
+
+        node = self.root
+        parts = rel_path.split("/")
+        for depth, part in enumerate(parts, 1):
+            is_target = depth == len(parts)
+            # 大文字小文字を区別しないファイルシステムでは同一ノードにまとめる
+            key = os.path.normcase(part)
+            child = node.children.get(key)
+            if child is None:
+                child_kind = kind if is_target else DIR
+                child = PathNode(part, "/".join(parts[:depth]), child_kind)
+                node.children[key] = child
+            elif child.kind == FILE and (not is_target or kind == FILE):
+                # ファイルの下に項目を置く、または同じファイルを重複指定
+                return None, child.path
+            elif is_target and child.kind != kind:
+                return None, child.path
+            node = child
+
+        if explicit:
+            node.explicit = True
+        return node, None
+
+    def walk(self):
+        """
+        ルートを除く全ノードを親から順（前順）に列挙
+
+        Yields:
+            PathNode: ノード
+        """
+        for node, _ in self._walk_with_parent():
+            yield node
+
+    def _walk_with_parent(self):
+        """(ノード, 親ノード) の組を前順に列挙"""
+        stack = [
+            (child, self.root)
+            for child in reversed(list(self.root.children.values()))
+        ]
+        while stack:
+            node, parent = stack.pop()
+            yield node, parent
+            stack.extend(
+                (child, node) for child in reversed(list(node.children.values()))
+            )
+
+    def annotate(self, index):
+        """
+        ファイルシステムインデックスを基に各ノードの状態を判定
+
+        既存ディレクトリの子のみ index を参照するため、各ディレクトリの
+        走査は高々1回となる。新規ディレクトリの配下はすべて新規、
+        競合ノードの配下はすべて競合となる。
+
+        Args:
+            index (FileSystemIndex): 対象フォルダのインデックス
+        """
+        ordered = []
+        for node, parent in self._walk_with_parent():
+            ordered.append(node)
+            if node.error:
+                node.status = STATUS_ERROR
+            elif parent.status == STATUS_CONFLICT:
+                node.status = STATUS_CONFLICT
+                node.conflict_path = parent.conflict_path
+            elif parent.status == STATUS_NEW:
+                node.status = STATUS_NEW
+            else:
+                # 親が既存（またはエラー表示のみのノード）の場合はディスクを参照
+                disk_kind = index.kind(node.path)
+                if disk_kind is None:
+                    node.status = STATUS_NEW
+                elif disk_kind == node.kind:
+                    node.status = STATUS_EXISTING
+                else:
+                    node.status = STATUS_CONFLICT
+                    node.conflict_path = node.path
+
+        # 作成が必要なノードを子から順に判定
+        for node in reversed(ordered):
+            if node.status != STATUS_NEW:
+                node.needed = False
+            elif node.kind == FILE or node.explicit:
+                node.needed = True
+            else:
+                node.needed = any(child.needed for child in node.children.values())
+
+    def render(self, root_label):
+        """
+        ツリーを罫線付きの文字列行に変換
+
+        各ディレクトリ内ではフォルダを先に、ファイルを後に並べる。
+        annotate 後に呼び出すこと。
+
+        Args:
+            root_label (str): ルートノードの表示名
+
+        Returns:
+            list: 表示行リスト
+        """
+        lines = [f"📁 {root_label}"]
+        # 子ノードは逆順に保持し、末尾から取り出す
+        stack = [(self._sorted_children(self.root)[::-1], "")]
+        while stack:
+            children, prefix = stack[-1]
+            if not children:
+                stack.pop()
+                continue
+            node = children.pop()
+            is_last = not children
+            connector = "└── " if is_last else "├── "
+            if node.status == STATUS_NEW and not node.needed:
+                mark = ""  # エラー項目の親など、実際には作成されないノード
+            else:
+                mark = STATUS_MARKS.get(node.status, "")
+            if node.kind == DIR:
+                lines.append(f"{prefix}{connector}📁 {node.name}/{mark}")
+                if node.children:
+                    child_prefix = prefix + ("    " if is_last else "│   ")
+                    stack.append((self._sorted_children(node)[::-1], child_prefix))
+            else:
+                lines.append(f"{prefix}{connector}📄 {node.name}{mark}")
+        return lines
+
+    @staticmethod
+    def _sorted_children(node):
+        """子ノードをフォルダ・ファイルの順に並べたリストを返す"""
+        children = list(node.children.values())
+        return [child for child in children if child.kind == DIR] + [
+            child for child in children if child.kind == FILE
+        ]
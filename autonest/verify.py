@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 検証モジュール
+
+既存の作成先がテンプレートと同一かどうかを判定する。ハッシュの計算は
+必要な場合のみ行い、次の順に安価な判定から試す。
+
+1. 作成先が存在しない → missing
+2. テンプレートへのリンク（同じ inode・リンク先が同じ）→ identical
+3. サイズが異なる → differs
+4. 作成記録（.autonest-manifest.json）とサイズ・更新時刻が一致し、
+   記録した内容のハッシュが期待値と同じ → identical
+5. テンプレートと更新時刻が一致する（copy_metadata でコピーしたファイル）
+   → identical
+6. 内容のハッシュ（1MB ずつ読み込み）を期待値と比較
+
+テンプレートのハッシュはエンジンが1回だけ計算して共有するため、多数の
+作成先・対象フォルダを検証してもテンプレートの読み込みは増えない。
+"""
+
+import os
+
+from .manifest import hash_file
+
+IDENTICAL = "identical"
+DIFFERS = "differs"
+MISSING = "missing"
+
+_STATUS_LABELS = {IDENTICAL: "一致", DIFFERS: "相違", MISSING: "なし"}
+
+
+class VerifyResult:
+    """
+    検証結果
+
+    Attributes:
+        folder_path (str): 対象フォルダパス
+        entries (list): (作成先相対パス, 状態) のリスト（選択順）
+        errors (list): 計画時のエラー・読み込みエラーのリスト
+        cancelled (bool): 処理が途中で中断されたかどうか
+    """
+
+    def __init__(self, folder_path):
+        self.folder_path = folder_path
+        self.entries = []
+        self.errors = []
+        self.cancelled = False
+
+    def _paths(self, status):
+        """指定した状態の作成先相対パスのリスト"""
+        return [path for path, entry_status in self.entries if entry_status == status]
+
+    @property
+    def identical(self):
+        """テンプレートと同一の作成先"""
+        return self._paths(IDENTICAL)
+
+    @property
+    def differs(self):
+        """テンプレートと内容が異なる作成先"""
+        return self._paths(DIFFERS)
+
+    @property
+    def missing(self):
+        """存在しない作成先"""
+        return self._paths(MISSING)
+
+    @property
+    def ok(self):
+        """すべての作成先がテンプレートと同一で、エラーがないかどうか"""
+        return not self.errors and all(
+            status == IDENTICAL for _, status in self.entries
+        )
+
+    def summary_lines(self, show_identical=False):
+        """
+        検証結果の表示行を生成
+
+        Args:
+            show_identical (bool): 同一の作成先も1行ずつ表示するかどうか
+
+        Returns:
+            list: 表示行リスト
+        """
+        lines = []
+        for path, status in self.entries:
+            if show_identical or status != IDENTICAL:
+                lines.append(f"{_STATUS_LABELS[status]}: {path}")
+        for error in self.errors:
+            lines.append(f"❌ {error}")
+        lines.append(
+            f"🔍 【検証】{self.folder_path}: 一致 {len(self.identical)}個, "
+            f"相違 {len(self.differs)}個, なし {len(self.missing)}個"
+            f"{'（中断）' if self.cancelled else ''}"
+        )
+        return lines
+
+    def to_dict(self):
+        """
+        結果を辞書形式に変換
+
+        Returns:
+            dict: 結果辞書
+        """
+        return {
+            "target": self.folder_path,
+            "identical": self.identical,
+            "differs": self.differs,
+            "missing": self.missing,
+            "errors": list(self.errors),
+            "cancelled": self.cancelled,
+        }
+
+
+def compare_file(
+    full_path,
+    expected_size,
+    expected_digest,
+    template_path=None,
+    template_stat=None,
+    manifest_entry=None,
+):
+    """
+    作成先のファイルが期待する内容と同一かどうかを判定
+
+    Args:
+        full_path (str): 作成先の絶対パス
+        expected_size (int): 期待するサイズ
+        expected_digest (callable): 期待する内容のハッシュを返す関数
+            （ハッシュの比較が必要になった場合のみ呼び出す）
+        template_path (str): リンク・更新時刻の判定に使うテンプレートパス
+            （変数置換するファイル・パック内のテンプレートの場合は None）
+        template_stat (os.stat_result): テンプレートの stat（template_path と併用）
+        manifest_entry (dict): 作成記録の項目（記録がない場合は None）
+
+    Returns:
+        str: IDENTICAL / DIFFERS / MISSING
+
+    Raises:
+        OSError: 作成先を読み込めない場合
+    """
+    try:
+        target_stat = os.stat(full_path)
+    except FileNotFoundError:
+        return MISSING
+
+    if template_path is not None:
+        # hardlink（同じ inode）・symlink（リンク先がテンプレート）
+        if (target_stat.st_dev, target_stat.st_ino) == (
+            template_stat.st_dev,
+            template_stat.st_ino,
+        ):
+            return IDENTICAL
+    if target_stat.st_size != expected_size:
+        return DIFFERS
+
+    if (
+        manifest_entry is not None
+        and manifest_entry.get("size") == target_stat.st_size
+        and manifest_entry.get("mtime_ns") == target_stat.st_mtime_ns
+        and manifest_entry.get("output") == expected_digest()
+    ):
+        return IDENTICAL
+    if (
+        template_path is not None
+        and target_stat.st_mtime_ns == template_stat.st_mtime_ns
+    ):
+        return IDENTICAL
+    return IDENTICAL if hash_file(full_path) == expected_digest() else DIFFERS
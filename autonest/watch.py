@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+"""
+AutoNest 監視モジュール
+
+default_files の template_path（とテンプレートパック）を監視し、
+テンプレートが変更されたら登録された対象フォルダへ差分更新で反映する。
+反映するのは作成記録（.autonest-manifest.json）上で作成後に編集されて
+いないファイルのみで、削除されたファイルを作り直すこともない。
+
+Linux では inotify（ctypes で libc を直接呼び出す）でテンプレートの
+フォルダを監視し、それ以外の環境や inotify を使えない場合は
+テンプレートの更新時刻・サイズを一定間隔で確認する。どちらの場合も
+連続したイベントは一定時間変更がなくなるまでまとめてから反映するため、
+エディタの保存やテンプレートの一括コピーで何度も反映が走ることはない。
+対象フォルダは変更を反映する時にのみ参照し、定期的な走査は行わない。
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+
+from .fastcopy import MODE_COPY
+
+# inotify のイベント（linux/inotify.h）
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# 書き込みの完了・置き換え（エディタの保存方式）・削除を検出する。
+# 書き込み途中の IN_MODIFY は反映の対象にしない
+_WATCH_MASK = (
+    _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+DEFAULT_DEBOUNCE = 0.5  # 最後の変更からこの秒数だけ変更がなければ反映する
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+def _null_log(message):
+    """ログ出力を行わないデフォルトのログコールバック"""
+
+
+def _file_signature(path):
+    """ファイルの変更検出用の署名（存在しない場合は None）"""
+    try:
+        file_stat = os.stat(path)
+    except OSError:
+        return None
+    return (file_stat.st_mtime_ns, file_stat.st_size)
+
+
+class PollingWatcher:
+    """
+    ファイルの更新時刻・サイズを一定間隔で確認する監視
+
+    Attributes:
+        name (str): 監視方式の表示名
+        interval (float): 確認間隔（秒）
+    """
+
+    name = "polling"
+
+    def __init__(self, paths, interval=DEFAULT_POLL_INTERVAL):
+        self.interval = interval
+        self._signatures = {path: _file_signature(path) for path in paths}
+
+    def wait(self, timeout):
+        """
+        監視対象が変更されるまで待つ
+
+        Args:
+            timeout (float): 最大待ち時間（秒）
+
+        Returns:
+            bool: 変更を検出した場合は True、タイムアウトした場合は False
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            changed = False
+            for path, signature in self._signatures.items():
+                current = _file_signature(path)
+                if current != signature:
+                    self._signatures[path] = current
+                    changed = True
+            if changed:
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self.interval, remaining))
+
+    def close(self):
+        """監視を終了（ポーリングでは何もしない）"""
+
+
+class InotifyWatcher:
+    """
+    inotify によるテンプレートのフォルダの監視（Linux のみ）
+
+    エディタは一時ファイルへの書き込みと置き換えで保存することが多いため、
+    ファイルではなくフォルダを監視し、監視対象のファイル名のイベントのみを
+    変更として扱う。
+
+    Attributes:
+        name (str): 監視方式の表示名
+    """
+
+    name = "inotify"
+
+    def __init__(self, paths):
+        """
+        inotify の監視を開始
+
+        Args:
+            paths (list): 監視するファイルパスのリスト
+
+        Raises:
+            OSError: inotify を利用できない・フォルダを監視できない場合
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify は Linux でのみ利用できます")
+        import ctypes
+        import ctypes.util
+
+        library = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(library, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify を利用できません")
+        self._fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        directories = {}
+        for path in paths:
+            directory, name = os.path.split(os.path.abspath(path))
+            directories.setdefault(directory, set()).add(name)
+        self._names = {}  # 監視記述子 -> 監視対象のファイル名
+        for directory, names in directories.items():
+            wd = libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _WATCH_MASK
+            )
+            if wd < 0:
+                error = ctypes.get_errno()
+                self.close()
+                raise OSError(error, os.strerror(error), directory)
+            self._names[wd] = names
+
+    def wait(self, timeout):
+        """
+        監視対象が変更されるまで待つ
+
+        Args:
+            timeout (float): 最大待ち時間（秒）
+
+        Returns:
+            bool: 変更を検出した場合は True、タイムアウトした場合は False
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if readable and self._read_events():
+                return True
+
+    def _read_events(self):
+        """
+        届いているイベントを読み込む
+
+        Returns:
+            bool: 監視対象のファイルのイベントが含まれていた場合は True
+        """
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return False
+        relevant = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset : offset + length].split(b"\0", 1)[0]
+            offset += length
+            if mask & _IN_Q_OVERFLOW:
+                # イベントが溢れた場合は変更の有無を署名で確認させる
+                relevant = True
+            elif os.fsdecode(name) in self._names.get(wd, ()):
+                relevant = True
+        return relevant
+
+    def close(self):
+        """監視を終了"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(paths, polling=False, interval=DEFAULT_POLL_INTERVAL):
+    """
+    監視を開始（inotify を使えない場合はポーリングにする）
+
+    Args:
+        paths (list): 監視するファイルパスのリスト
+        polling (bool): inotify を使わずポーリングにするかどうか
+        interval (float): ポーリングの確認間隔（秒）
+
+    Returns:
+        InotifyWatcher or PollingWatcher: 監視
+    """
+    if not polling:
+        try:
+            return InotifyWatcher(paths)
+        except OSError:
+            pass
+    return PollingWatcher(paths, interval)
+
+
+class TemplateSync:
+    """
+    テンプレートの変更を対象フォルダへ反映する
+
+    Attributes:
+        engine (FolderCreator): 作成エンジン（incremental を有効にして使う）
+        targets (list): 反映先の対象フォルダパスのリスト
+        log (callable): ログコールバック
+    """
+
+    def __init__(self, engine, targets, selected_files, log=None):
+        """
+        反映の準備
+
+        Args:
+            engine (FolderCreator): 作成エンジン
+            targets (list): 反映先の対象フォルダパスのリスト
+            selected_files (list): 監視・反映するファイルリスト
+                （(ファイル名, ファイル設定) のタプルリスト）
+            log (callable): ログコールバック
+        """
+        self.engine = engine
+        self.targets = list(targets)
+        self.log = log or _null_log
+        self.engine.incremental = True
+        self._selected_files = list(selected_files)
+        self._unmanaged = set()  # 通知済みの (対象フォルダ, 作成先) の組
+        self._signatures = {
+            path: _file_signature(path) for path in self.watched_paths
+        }
+
+    @property
+    def watched_paths(self):
+        """監視するテンプレート（とテンプレートパック）のパスのリスト"""
+        paths = list(
+            dict.fromkeys(
+                file_config["template_path"] for _, file_config in self._selected_files
+            )
+        )
+        if self.engine.template_pack_path:
+            paths.append(self.engine.template_pack_path)
+        return paths
+
+    def changed_templates(self):
+        """
+        前回の確認以降に変更されたテンプレートを取得
+
+        Returns:
+            set: 変更されたテンプレート・テンプレートパックのパス
+        """
+        changed = set()
+        for path, signature in self._signatures.items():
+            current = _file_signature(path)
+            if current != signature:
+                self._signatures[path] = current
+                changed.add(path)
+        return changed
+
+    def sync(self, changed=None):
+        """
+        変更されたテンプレートを使うファイルを各対象フォルダで更新
+
+        Args:
+            changed (set): 変更されたテンプレートのパス（None の場合は全ファイル）
+
+        Returns:
+            int: 更新したファイル数の合計
+        """
+        files = self._selected_files
+        if changed is not None and self.engine.template_pack_path not in changed:
+            files = [
+                (name, file_config)
+                for name, file_config in files
+                if file_config["template_path"] in changed
+            ]
+        if not files:
+            return 0
+
+        updated = 0
+        for target in self.targets:
+            if not os.path.isdir(target):
+                self.log(f"⚠️ 対象フォルダが存在しません: {target}")
+                continue
+            plan = self.engine.plan(target, [], files)
+            plan.drop_new_items()
+            for error in plan.errors:
+                self.log(f"❌ {target}: {error}")
+            self._warn_unmanaged(target, plan)
+            if not plan.files_to_update:
+                # 内容が同一で記録に取り込んだファイルは更新がなくても保存する
+                try:
+                    plan.manifest.save()
+                except OSError as e:
+                    self.log(f"❌ {target}: 作成記録を保存できません - {str(e)}")
+                continue
+            result = self.engine.apply(plan)
+            updated += result.file_updated_count
+            self.log(f"🔄 {target}: ファイル{result.file_updated_count}個を更新しました")
+            for error in result.file_errors[len(plan.errors) :]:
+                self.log(f"❌ {target}: {error}")
+        return updated
+
+    def _warn_unmanaged(self, target, plan):
+        """
+        作成記録のない既存ファイル（反映されない）を初回のみ通知
+
+        Args:
+            target (str): 対象フォルダパス
+            plan (ScaffoldPlan): 差分更新の計画
+        """
+        for planned_file in plan.existing_planned:
+            key = (target, planned_file.target_path)
+            if key in self._unmanaged or plan.manifest.get(planned_file.target_path):
+                continue
+            if planned_file.config.get("mode", MODE_COPY) != MODE_COPY:
+                continue
+            self._unmanaged.add(key)
+            self.log(
+                f"⚠️ {target}: {planned_file.target_path} は作成記録がなく"
+                "テンプレートとも内容が異なるため反映しません"
+            )
+
+    def run(self, watcher, debounce=DEFAULT_DEBOUNCE, cancel_event=None):
+        """
+        監視を続け、変更を検出するたびに反映する
+
+        変更を検出した後は debounce 秒間変更がなくなるまで待ってから、
+        その間の変更をまとめて1回で反映する。
+
+        Args:
+            watcher (InotifyWatcher or PollingWatcher): 監視
+            debounce (float): 変更をまとめる待ち時間（秒）
+            cancel_event (threading.Event): セットされると監視を終了する
+        """
+
+        def cancelled():
+            return cancel_event is not None and cancel_event.is_set()
+
+        while not cancelled():
+            if not watcher.wait(DEFAULT_POLL_INTERVAL):
+                continue
+            while not cancelled() and watcher.wait(debounce):
+                pass
+            changed = self.changed_templates()
+            if not changed or cancelled():
+                continue
+            names = ", ".join(sorted(os.path.basename(path) for path in changed))
+            self.log(f"📝 テンプレートの変更を検出しました: {names}")
+            self.sync(changed)
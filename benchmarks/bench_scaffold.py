@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AutoNest 処理時間ベンチマーク
+
+合成プロジェクト（synthetic.py）を項目数ごとに生成し、主要な処理の
+時間を計測する。結果は JSON で保存でき、--compare で以前の結果と
+比較して劣化を検出できる（許容倍率を超えた場合は終了コード 1）。
+
+計測する処理:
+    load_config         設定ファイルの読み込み（キャッシュなし）
+    load_config_cached  設定ファイルの読み込み（キャッシュあり）
+    plan                空の対象フォルダへの作成計画
+    preview             プレビューのツリー生成（generate_tree_structure と同じ）
+    apply               空の対象フォルダへの作成（ファイル書き込みを含む）
+    replan              作成済みの対象フォルダへの再計画（差分更新の確認を含む）
+    verify              作成済みの対象フォルダの検証
+    log                 GUI のログ出力（表示できない環境では省略）
+
+使用例:
+    python benchmarks/bench_scaffold.py --sizes 10,1000 --json before.json
+    python benchmarks/bench_scaffold.py --sizes 10,1000 --compare before.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from autonest import __version__  # noqa: E402
+from autonest.config import (  # noqa: E402
+    get_default_config,
+    load_config,
+    normalize_config,
+)
+from autonest.engine import FolderCreator, select_files, select_folders  # noqa: E402
+from synthetic import generate_project  # noqa: E402
+
+DEFAULT_SIZES = "10,1000,100000"
+
+# 比較時に劣化とみなさない差（ミリ秒）。極端に短い処理の揺らぎを無視する
+_NOISE_FLOOR_MS = 5.0
+
+
+def measure(func, repeat, setup=None):
+    """
+    処理時間を計測
+
+    Args:
+        func (callable): 計測する処理
+        repeat (int): 計測回数
+        setup (callable): 各計測の前に実行する準備処理（計測に含めない）
+
+    Returns:
+        list: 各回の処理時間（秒）
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def _entry(size, phase, times, items):
+    """計測結果1件分の辞書を生成"""
+    median = statistics.median(times)
+    return {
+        "size": size,
+        "phase": phase,
+        "median_ms": round(median * 1000, 3),
+        "min_ms": round(min(times) * 1000, 3),
+        "items_per_sec": round(items / median) if median > 0 else None,
+    }
+
+
+def bench_size(size, repeat, workdir):
+    """
+    指定した項目数の合成プロジェクトで各処理を計測
+
+    Args:
+        size (int): フォルダ数・ファイル数
+        repeat (int): 計測回数
+        workdir (str): 作業フォルダ
+
+    Returns:
+        list: 計測結果の辞書リスト
+    """
+    project = os.path.join(workdir, f"project-{size}")
+    config_path = generate_project(project, size)
+    items = size * 2
+    results = []
+
+    results.append(
+        _entry(
+            size,
+            "load_config",
+            measure(lambda: load_config(config_path, use_cache=False), repeat),
+            items,
+        )
+    )
+    load_config(config_path)  # キャッシュを作成
+    results.append(
+        _entry(
+            size,
+            "load_config_cached",
+            measure(lambda: load_config(config_path), repeat),
+            items,
+        )
+    )
+
+    config = load_config(config_path)
+    config["apply_settings"] = {"incremental": True}
+    folders = select_folders(config)
+    files = select_files(config)
+    engine = FolderCreator.from_config(config)
+    target = os.path.join(workdir, f"target-{size}")
+
+    def reset_target():
+        shutil.rmtree(target, ignore_errors=True)
+        os.mkdir(target)
+
+    reset_target()
+    results.append(
+        _entry(
+            size,
+            "plan",
+            measure(lambda: engine.plan(target, folders, files), repeat),
+            items,
+        )
+    )
+    plan = engine.plan(target, folders, files)
+    results.append(_entry(size, "preview", measure(plan.render_tree, repeat), items))
+
+    def apply():
+        engine.apply(engine.plan(target, folders, files))
+
+    results.append(
+        _entry(size, "apply", measure(apply, repeat, setup=reset_target), items)
+    )
+    results.append(
+        _entry(
+            size,
+            "replan",
+            measure(lambda: engine.plan(target, folders, files), repeat),
+            items,
+        )
+    )
+    plan = engine.plan(target, folders, files)
+    results.append(
+        _entry(size, "verify", measure(lambda: engine.verify(plan), repeat), items)
+    )
+    engine.close()
+    return results
+
+
+def bench_log(lines, repeat):
+    """
+    GUI のログ出力（バッファへの追加とテキストエリアへの反映）を計測
+
+    Args:
+        lines (int): 出力する行数
+        repeat (int): 計測回数
+
+    Returns:
+        dict or str: 計測結果の辞書。計測できない場合は理由の文字列
+    """
+    try:
+        import tkinter as tk
+
+        root = tk.Tk()
+    except Exception as e:
+        return f"GUI を作成できません ({e})"
+    root.withdraw()
+    from autonest.gui import AdvancedFolderCreatorApp
+
+    app = AdvancedFolderCreatorApp(
+        root, normalize_config(get_default_config(), os.getcwd())
+    )
+
+    def emit():
+        for number in range(lines):
+            app.log(f"✅ ファイル作成完了: Assets/Editor/file{number}.cs")
+        while app._log_queue:
+            app._flush_log()
+        root.update_idletasks()
+
+    try:
+        return _entry(lines, "log", measure(emit, repeat), lines)
+    finally:
+        root.destroy()
+
+
+def compare(results, baseline_path, tolerance):
+    """
+    以前の結果と比較して表示
+
+    Args:
+        results (list): 今回の計測結果
+        baseline_path (str): 以前の結果の JSON ファイル
+        tolerance (float): 劣化とみなす倍率
+
+    Returns:
+        bool: 劣化が見つかった場合は True
+    """
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {
+            (entry["size"], entry["phase"]): entry["median_ms"]
+            for entry in json.load(f)["results"]
+        }
+    regressed = False
+    print()
+    print(f"{'項目数':>8} {'処理':<20} {'以前(ms)':>10} {'今回(ms)':>10} {'倍率':>6}")
+    for entry in results:
+        before = baseline.get((entry["size"], entry["phase"]))
+        if before is None:
+            continue
+        after = entry["median_ms"]
+        ratio = after / before if before > 0 else float("inf")
+        worse = ratio > tolerance and after - before > _NOISE_FLOOR_MS
+        regressed = regressed or worse
+        print(
+            f"{entry['size']:>8} {entry['phase']:<20} {before:>10.1f} {after:>10.1f} "
+            f"{ratio:>6.2f}{'  劣化' if worse else ''}"
+        )
+    return regressed
+
+
+def main(argv=None):
+    """
+    ベンチマークを実行して結果を表示
+
+    Returns:
+        int: 終了コード（0: 正常, 1: --compare で劣化を検出）
+    """
+    parser = argparse.ArgumentParser(description="AutoNest 処理時間ベンチマーク")
+    parser.add_argument(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"フォルダ数・ファイル数（カンマ区切り、既定 {DEFAULT_SIZES}）",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="計測回数（既定 3）")
+    parser.add_argument(
+        "--log-lines", type=int, default=100000, help="ログ出力の行数（既定 100000）"
+    )
+    parser.add_argument("--json", metavar="FILE", help="結果を JSON で保存する")
+    parser.add_argument(
+        "--compare", metavar="FILE", help="以前の結果（--json の出力）と比較する"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.25,
+        help="--compare で劣化とみなす倍率（既定 1.25）",
+    )
+    parser.add_argument(
+        "--workdir", help="作業フォルダ（既定は一時フォルダ。終了時に削除する）"
+    )
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix="autonest-bench-")
+    # 設定キャッシュが利用者のキャッシュフォルダに残らないようにする
+    os.environ["AUTONEST_CACHE_DIR"] = os.path.join(workdir, "cache")
+    results = []
+    print(f"{'項目数':>8} {'処理':<20} {'中央値(ms)':>12} {'最小(ms)':>10} {'項目/秒':>10}")
+    try:
+        for size in sizes:
+            for entry in bench_size(size, args.repeat, workdir):
+                results.append(entry)
+                print(
+                    f"{entry['size']:>8} {entry['phase']:<20} "
+                    f"{entry['median_ms']:>12.1f} {entry['min_ms']:>10.1f} "
+                    f"{entry['items_per_sec'] or '-':>10}"
+                )
+        log_entry = bench_log(args.log_lines, args.repeat)
+        if isinstance(log_entry, dict):
+            results.append(log_entry)
+            print(
+                f"{log_entry['size']:>8} {'log':<20} "
+                f"{log_entry['median_ms']:>12.1f} {log_entry['min_ms']:>10.1f} "
+                f"{log_entry['items_per_sec'] or '-':>10}"
+            )
+        else:
+            print(f"{args.log_lines:>8} {'log':<20} スキップ: {log_entry}")
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "benchmark": "scaffold",
+                    "version": __version__,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "repeat": args.repeat,
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+    if args.compare:
+        return 1 if compare(results, args.compare, args.tolerance) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AutoNest 起動時間ベンチマーク
+
+新しい Python プロセスで各エントリーポイントを import し、コールド
+スタートの時間を計測する。中央値が閾値を超えた場合、または CLI・
+エンジンの経路で tkinter が読み込まれた場合は終了コード 1 を返すため、
+CI で起動時間の劣化を検出できる。
+
+使用例:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 20 --scale 2.0
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (名前, 実行するコード, 閾値ミリ秒, tkinter の読み込みを禁止するか)
+# 閾値は Python 自体の起動時間を含む
+SCENARIOS = [
+    ("python", "pass", None, True),
+    ("engine", "import autonest.engine", 120, True),
+    ("cli", "import autonest.cli", 150, True),
+    ("launcher", "import advanced_folder_creator", 80, True),
+    ("gui", "import autonest.gui", 400, False),
+]
+
+_PROBE = """
+import sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(elapsed, "tkinter" in sys.modules)
+"""
+
+
+def measure(code, repeat):
+    """
+    新しいプロセスで code を実行した時間を計測
+
+    Args:
+        code (str): 計測する Python コード
+        repeat (int): 計測回数
+
+    Returns:
+        tuple: (プロセス全体の時間のリスト（秒）, import 時間のリスト（秒）,
+            tkinter が読み込まれたかどうか)
+    """
+    totals = []
+    imports = []
+    loaded_tk = False
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(code=code)],
+            cwd=REPO_ROOT,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.split()
+        totals.append(time.perf_counter() - start)
+        imports.append(float(output[0]))
+        loaded_tk = loaded_tk or output[1] == "True"
+    return totals, imports, loaded_tk
+
+
+def main(argv=None):
+    """
+    ベンチマークを実行して結果を表示
+
+    Returns:
+        int: 終了コード（0: 閾値内, 1: 閾値超過または tkinter の読み込み）
+    """
+    parser = argparse.ArgumentParser(description="AutoNest 起動時間ベンチマーク")
+    parser.add_argument("--repeat", type=int, default=10, help="計測回数（既定 10）")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="閾値の倍率（低速な CI マシン向け、既定 1.0）",
+    )
+    parser.add_argument("--json", metavar="FILE", help="結果を JSON で保存する")
+    args = parser.parse_args(argv)
+
+    # 初回の .pyc 生成を計測に含めないよう一度ずつ import しておく
+    for _, code, _, _ in SCENARIOS:
+        try:
+            measure(code, 1)
+        except subprocess.CalledProcessError:
+            pass
+
+    results = []
+    failed = False
+    print(f"{'シナリオ':<10} {'全体(ms)':>10} {'import(ms)':>11} {'閾値(ms)':>9}  判定")
+    for name, code, limit_ms, forbid_tk in SCENARIOS:
+        try:
+            totals, imports, loaded_tk = measure(code, args.repeat)
+        except subprocess.CalledProcessError as e:
+            # tkinter のない環境では GUI の計測を省略する
+            print(f"{name:<10} スキップ ({e.stderr.strip().splitlines()[-1]})")
+            continue
+        total_ms = statistics.median(totals) * 1000
+        import_ms = statistics.median(imports) * 1000
+        limit = limit_ms * args.scale if limit_ms is not None else None
+
+        problems = []
+        if limit is not None and total_ms > limit:
+            problems.append("閾値超過")
+        if forbid_tk and loaded_tk:
+            problems.append("tkinter を読み込み")
+        failed = failed or bool(problems)
+
+        verdict = "、".join(problems) or "OK"
+        limit_text = f"{limit:.0f}" if limit is not None else "-"
+        print(
+            f"{name:<10} {total_ms:>10.1f} {import_ms:>11.1f} {limit_text:>9}  {verdict}"
+        )
+        results.append(
+            {
+                "name": name,
+                "total_ms": round(total_ms, 2),
+                "import_ms": round(import_ms, 2),
+                "limit_ms": limit,
+                "loaded_tkinter": loaded_tk,
+                "ok": not problems,
+            }
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"benchmark": "startup", "results": results}, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
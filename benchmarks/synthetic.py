@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+ベンチマーク用の合成プロジェクト生成
+
+指定した項目数のフォルダ・ファイルを持つ config.json とテンプレート一式を
+生成する。乱数のシードを固定しているため、同じ引数からは常に同じ
+構成が生成され、バージョン間で結果を比較できる。
+
+- フォルダは実際のプロジェクトに近い 1〜6 階層の入れ子構造
+- テンプレートのサイズは小さいファイルが大半で、一部に大きいファイルを含む
+  （90%: 64B〜2KB, 9%: 2KB〜32KB, 1%: 64KB〜256KB）
+- ファイルの約 5% は変数置換（render）を行う
+"""
+
+import json
+import os
+import random
+
+_TOP_LEVEL = ["Assets", "src", "docs", "tests", "tools", "Packages", "build"]
+_NAMES = [
+    "Editor",
+    "Runtime",
+    "Scripts",
+    "Prefabs",
+    "Materials",
+    "Textures",
+    "Audio",
+    "Scenes",
+    "core",
+    "utils",
+    "models",
+    "views",
+    "api",
+    "internal",
+    "shared",
+    "config",
+    "images",
+    "fonts",
+    "locales",
+    "fixtures",
+]
+_EXTENSIONS = [".cs", ".py", ".md", ".json", ".txt", ".yaml", ".asset", ".meta"]
+_MAX_TEMPLATES = 200
+
+
+def _template_size(rng):
+    """テンプレートのサイズを分布に従って決める"""
+    roll = rng.random()
+    if roll < 0.90:
+        return rng.randint(64, 2 * 1024)
+    if roll < 0.99:
+        return rng.randint(2 * 1024, 32 * 1024)
+    return rng.randint(64 * 1024, 256 * 1024)
+
+
+def _generate_folders(rng, count):
+    """入れ子のフォルダパスを count 個生成（親フォルダから順に追加する）"""
+    folders = []
+    seen = set()
+    while len(folders) < count:
+        if folders and rng.random() < 0.8:
+            # 既存フォルダの子を作ることで深い階層を作る
+            parent = rng.choice(folders)
+            if parent.count("/") >= 5:
+                continue
+            path = f"{parent}/{rng.choice(_NAMES)}{rng.randint(0, 99)}"
+        else:
+            path = f"{rng.choice(_TOP_LEVEL)}{rng.randint(0, 9)}"
+        if path not in seen:
+            seen.add(path)
+            folders.append(path)
+    return folders
+
+
+def generate_project(root, size, seed=0):
+    """
+    合成プロジェクト（設定ファイルとテンプレート）を生成
+
+    Args:
+        root (str): 出力先フォルダ（存在しない場合は作成する）
+        size (int): フォルダ数・ファイル数（それぞれ size 個）
+        seed (int): 乱数のシード
+
+    Returns:
+        str: 生成した config.json のパス
+    """
+    rng = random.Random(f"{seed}:{size}")
+    template_dir = os.path.join(root, "templates")
+    os.makedirs(template_dir, exist_ok=True)
+
+    templates = []
+    for number in range(min(size, _MAX_TEMPLATES)):
+        render = rng.random() < 0.05
+        name = f"template{number}{'.tmpl' if render else '.bin'}"
+        with open(os.path.join(template_dir, name), "wb") as f:
+            if render:
+                f.write(b"// {{project_name}} - generated\n" * 4)
+            else:
+                length = _template_size(rng)
+                f.write(rng.getrandbits(length * 8).to_bytes(length, "little"))
+        templates.append((f"templates/{name}", render))
+
+    folders = _generate_folders(rng, size)
+    files = []
+    for number in range(size):
+        template_path, render = rng.choice(templates)
+        folder = rng.choice(folders)
+        file_config = {
+            "name": f"file{number}",
+            "template_path": template_path,
+            "target_path": f"{folder}/file{number}{rng.choice(_EXTENSIONS)}",
+        }
+        if render:
+            file_config["render"] = True
+        files.append(file_config)
+
+    config_path = os.path.join(root, "config.json")
+    with open(config_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "default_folders": folders,
+                "default_files": files,
+                "variables": {"company": "AutoNest Benchmark"},
+            },
+            f,
+            ensure_ascii=False,
+        )
+    return config_path
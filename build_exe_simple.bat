@@ -9,7 +9,7 @@ echo PyInstallerでEXEファイルを作成中...
 echo.
 
 echo 拡張版 advanced_folder_creator.py をEXE化しています...
-%PYTHON_PATH% -m PyInstaller --onefile --windowed --name="AutoNest_Advanced" --add-data="config.json;." --add-data="templates;templates" advanced_folder_creator.py
+%PYTHON_PATH% -m PyInstaller --onefile --windowed --name="AutoNest_Advanced" --add-data="config.json;." --add-data="templates;templates" --hidden-import=autonest.gui advanced_folder_creator.py
 
 echo.
 echo EXEファイルの作成が完了しました！
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+テスト共通の設定とフィクスチャ
+
+リポジトリのルートを import パスに追加し、autonest パッケージを
+インストールせずにテストできるようにする。
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def scaffold(tmp_path):
+    """
+    テンプレートフォルダと空の対象フォルダを用意する
+
+    Returns:
+        tuple: (テンプレートフォルダ, 対象フォルダ, テンプレートを書くヘルパー)
+    """
+    templates = tmp_path / "templates"
+    target = tmp_path / "target"
+    templates.mkdir()
+    target.mkdir()
+
+    def write_template(name, content):
+        path = templates / name
+        path.write_text(content, encoding="utf-8")
+        return str(path)
+
+    return templates, target, write_template
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""設定ファイルの検証・正規化・キャッシュのテスト"""
+
+import json
+import os
+
+import pytest
+
+from autonest.config import ConfigError, load_config, validate_config
+
+
+def _write_config(path, config):
+    path.write_text(json.dumps(config, ensure_ascii=False), encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """コンパイル済み設定のキャッシュをテストごとのフォルダに置く"""
+    directory = tmp_path / "cache"
+    monkeypatch.setenv("AUTONEST_CACHE_DIR", str(directory))
+    return directory
+
+
+@pytest.mark.parametrize(
+    "config, message",
+    [
+        ({"default_folders": "Assets"}, "default_folders"),
+        ({"default_folders": [1]}, "default_folders[0]"),
+        ({"default_files": [{"name": "a"}]}, "template_path"),
+        (
+            {"default_files": [{"name": "a", "template_path": "a", "mode": "copy2"}]},
+            "mode",
+        ),
+        ({"window_settings": {"width": "700"}}, "window_settings.width"),
+        ({"performance": {"max_workers": True}}, "performance.max_workers"),
+        ({"unknown_section": {}}, "unknown_section"),
+    ],
+)
+def test_schema_rejects_invalid_config(config, message):
+    with pytest.raises(ConfigError) as excinfo:
+        validate_config(config)
+    assert any(message in error for error in excinfo.value.errors)
+
+
+def test_schema_accepts_valid_config():
+    validate_config(
+        {
+            "default_folders": ["Assets/Editor"],
+            "default_files": [{"name": "a", "template_path": "a", "mode": "copy"}],
+            "performance": {"max_workers": 4, "template_cache_mb": 0.5},
+            "apply_settings": {"transactional": False},
+        }
+    )
+
+
+def test_load_config_reports_syntax_error(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text('{"default_folders": [}', encoding="utf-8")
+
+    with pytest.raises(ConfigError) as excinfo:
+        load_config(str(path))
+    assert "構文エラー" in excinfo.value.errors[0]
+
+
+def test_load_config_rejects_folder_file_conflict(tmp_path):
+    path = _write_config(
+        tmp_path / "config.json",
+        {
+            "default_folders": ["docs"],
+            "default_files": [
+                {"name": "docs", "template_path": "t", "target_path": "docs"}
+            ],
+        },
+    )
+
+    with pytest.raises(ConfigError):
+        load_config(path)
+
+
+def test_load_config_normalizes_paths_and_merges_files(tmp_path):
+    path = _write_config(
+        tmp_path / "config.json",
+        {
+            "default_folders": ["a/b", "a\\b", "c"],
+            "default_files": [
+                {"name": "x", "template_path": "templates/x", "description": "1"},
+                {"name": "x", "template_path": "templates/x", "description": "2"},
+            ],
+        },
+    )
+
+    config = load_config(path, use_cache=False)
+
+    assert config["default_folders"] == ["a/b", "c"]
+    assert len(config["default_files"]) == 1
+    file_config = config["default_files"][0]
+    assert file_config["description"] == "2"
+    assert file_config["target_path"] == "x"
+    assert file_config["template_path"] == os.path.join(
+        str(tmp_path), "templates", "x"
+    )
+
+
+def test_cache_is_json_and_ignores_corrupt_files(tmp_path, cache_dir):
+    path = _write_config(
+        tmp_path / "config.json", {"default_folders": ["a"], "default_files": []}
+    )
+    expected = load_config(path, use_cache=False)
+
+    assert load_config(path) == expected
+    cache_files = os.listdir(cache_dir)
+    assert len(cache_files) == 1 and cache_files[0].endswith(".json")
+    with open(cache_dir / cache_files[0], encoding="utf-8") as f:
+        assert json.load(f)["config"] == expected
+
+    (cache_dir / cache_files[0]).write_bytes(b"\x80not json")
+    assert load_config(path) == expected
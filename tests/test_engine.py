@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""作成エンジンのエラー・中断時の動作のテスト"""
+
+import os
+import threading
+
+from autonest.engine import FolderCreator
+from autonest.journal import has_pending_journal
+
+
+def test_file_error_does_not_roll_back_other_items(scaffold):
+    templates, target, write_template = scaffold
+    (templates / "directory").mkdir()
+    files = [
+        ("a.txt", {"template_path": write_template("a.txt", "a")}),
+        ("bad.txt", {"template_path": str(templates / "directory")}),
+    ]
+    creator = FolderCreator()
+    result = creator.execute(str(target), ["folder"], files)
+
+    assert not result.rolled_back
+    assert result.file_created_count == 1
+    assert result.folder_created_count == 1
+    assert len(result.file_errors) == 1
+    assert (target / "a.txt").exists()
+    assert (target / "folder").is_dir()
+
+
+def test_cancel_rolls_back_created_items(scaffold):
+    _, target, write_template = scaffold
+    files = [
+        (f"f{i}.txt", {"template_path": write_template(f"f{i}.txt", str(i))})
+        for i in range(10)
+    ]
+    cancel_event = threading.Event()
+
+    def progress(event):
+        if event.done == 5:
+            cancel_event.set()
+
+    creator = FolderCreator()
+    result = creator.execute(str(target), ["a/b"], files, progress, cancel_event)
+
+    assert result.cancelled
+    assert result.rolled_back
+    assert os.listdir(target) == []
+    assert not has_pending_journal(str(target))
+
+
+def test_non_transactional_cancel_keeps_created_items(scaffold):
+    _, target, write_template = scaffold
+    files = [
+        (f"f{i}.txt", {"template_path": write_template(f"f{i}.txt", str(i))})
+        for i in range(10)
+    ]
+    cancel_event = threading.Event()
+
+    def progress(event):
+        if event.done == 5:
+            cancel_event.set()
+
+    creator = FolderCreator(transactional=False)
+    result = creator.execute(str(target), [], files, progress, cancel_event)
+
+    assert result.cancelled
+    assert not result.rolled_back
+    assert result.file_created_count == 5
+    assert len(os.listdir(target)) == 5
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""作成記録（マニフェスト）による差分更新のテスト"""
+
+import json
+import os
+
+from autonest import engine as engine_module
+from autonest.engine import FolderCreator
+from autonest.manifest import MANIFEST_NAME
+
+
+def _run(target, files, **options):
+    creator = FolderCreator(incremental=True, **options)
+    try:
+        return creator.execute(str(target), [], files)
+    finally:
+        creator.close()
+
+
+def test_changed_template_updates_unmodified_file(scaffold):
+    _, target, write_template = scaffold
+    files = [("a.txt", {"template_path": write_template("a.txt", "v1")})]
+    first = _run(target, files)
+    assert first.file_created_count == 1
+    assert (target / MANIFEST_NAME).exists()
+
+    write_template("a.txt", "v2")
+    second = _run(target, files)
+
+    assert second.file_updated_count == 1
+    assert (target / "a.txt").read_text(encoding="utf-8") == "v2"
+
+
+def test_unchanged_template_is_not_rewritten(scaffold):
+    _, target, write_template = scaffold
+    files = [("a.txt", {"template_path": write_template("a.txt", "v1")})]
+    _run(target, files)
+    mtime = os.stat(target / "a.txt").st_mtime_ns
+
+    result = _run(target, files)
+
+    assert result.file_updated_count == 0
+    assert result.existing_files == ["a.txt"]
+    assert os.stat(target / "a.txt").st_mtime_ns == mtime
+
+
+def test_user_edited_file_is_kept(scaffold):
+    _, target, write_template = scaffold
+    files = [("a.txt", {"template_path": write_template("a.txt", "v1")})]
+    _run(target, files)
+    (target / "a.txt").write_text("edited by user", encoding="utf-8")
+
+    write_template("a.txt", "v2")
+    result = _run(target, files)
+
+    assert result.file_updated_count == 0
+    assert (target / "a.txt").read_text(encoding="utf-8") == "edited by user"
+
+
+def test_identical_unrecorded_file_is_adopted(scaffold):
+    _, target, write_template = scaffold
+    files = [("a.txt", {"template_path": write_template("a.txt", "v1")})]
+    (target / "a.txt").write_text("v1", encoding="utf-8")
+
+    _run(target, files)
+    write_template("a.txt", "v2")
+    result = _run(target, files)
+
+    assert result.file_updated_count == 1
+    assert (target / "a.txt").read_text(encoding="utf-8") == "v2"
+
+
+def test_unmanaged_file_is_hashed_only_once(scaffold, monkeypatch):
+    _, target, write_template = scaffold
+    files = [("a.txt", {"template_path": write_template("a.txt", "template")})]
+    (target / "a.txt").write_text("user file", encoding="utf-8")
+    hashed = []
+    original_hash_file = engine_module.hash_file
+
+    def counting_hash_file(path):
+        if os.path.dirname(path) == str(target):
+            hashed.append(path)
+        return original_hash_file(path)
+
+    monkeypatch.setattr(engine_module, "hash_file", counting_hash_file)
+    for _ in range(3):
+        result = _run(target, files)
+        assert result.file_updated_count == 0
+
+    assert len(hashed) == 1
+    with open(target / MANIFEST_NAME, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert "a.txt" in manifest["unmanaged"]
+    assert (target / "a.txt").read_text(encoding="utf-8") == "user file"
+
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""作成ジャーナルとロールバックのテスト"""
+
+import os
+
+import pytest
+
+from autonest.journal import (
+    BACKUP_SUFFIX,
+    JOURNAL_NAME,
+    UPDATE,
+    Journal,
+    JournalError,
+    has_pending_journal,
+    rollback_pending,
+)
+from autonest.plan import DIR, FILE
+
+
+def _create(target, rel_path, content="x"):
+    path = target / rel_path
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+def test_rollback_removes_created_items_in_reverse_order(tmp_path):
+    (tmp_path / "keep.txt").write_text("keep", encoding="utf-8")
+    journal = Journal(str(tmp_path))
+    (tmp_path / "a").mkdir()
+    journal.record(DIR, "a")
+    (tmp_path / "a" / "b").mkdir()
+    journal.record(DIR, "a/b")
+    _create(tmp_path, "a/b/c.txt")
+    journal.record(FILE, "a/b/c.txt")
+
+    result = journal.rollback()
+
+    assert result.removed_count == 3
+    assert result.errors == []
+    assert sorted(os.listdir(tmp_path)) == ["keep.txt"]
+
+
+def test_rollback_keeps_folders_with_items_added_later(tmp_path):
+    journal = Journal(str(tmp_path))
+    (tmp_path / "a").mkdir()
+    journal.record(DIR, "a")
+    _create(tmp_path, "a/user.txt")
+
+    result = journal.rollback()
+
+    assert (tmp_path / "a" / "user.txt").exists()
+    assert result.removed_count == 0
+    assert len(result.errors) == 1
+    # 取り消せなかった項目は後で取り消せるようジャーナルに残す
+    assert has_pending_journal(str(tmp_path))
+
+
+def test_rollback_restores_updated_file_from_backup(tmp_path):
+    original = _create(tmp_path, "file.txt", "original")
+    journal = Journal(str(tmp_path))
+    os.replace(original, str(original) + BACKUP_SUFFIX)
+    journal.record(UPDATE, "file.txt")
+    _create(tmp_path, "file.txt", "new")
+
+    journal.rollback()
+
+    assert original.read_text(encoding="utf-8") == "original"
+    assert not os.path.exists(str(original) + BACKUP_SUFFIX)
+    assert not has_pending_journal(str(tmp_path))
+
+
+def test_commit_removes_backups_and_journal(tmp_path):
+    original = _create(tmp_path, "file.txt", "original")
+    journal = Journal(str(tmp_path))
+    os.replace(original, str(original) + BACKUP_SUFFIX)
+    journal.record(UPDATE, "file.txt")
+    _create(tmp_path, "file.txt", "new")
+
+    journal.commit()
+
+    assert original.read_text(encoding="utf-8") == "new"
+    assert sorted(os.listdir(tmp_path)) == ["file.txt"]
+
+
+def test_pending_journal_blocks_new_journal_and_can_be_rolled_back(tmp_path):
+    journal = Journal(str(tmp_path))
+    (tmp_path / "a").mkdir()
+    journal.record(DIR, "a")
+    _create(tmp_path, "a/b.txt")
+    journal.record(FILE, "a/b.txt")
+    # 強制終了を想定し、閉じずに書き出しのみ行う
+    journal.flush()
+
+    with pytest.raises(JournalError):
+        Journal(str(tmp_path))
+
+    result = rollback_pending(str(tmp_path))
+
+    assert result.removed_count == 2
+    assert os.listdir(tmp_path) == []
+    assert not has_pending_journal(str(tmp_path))
+
+
+def test_records_are_written_out_during_long_runs(tmp_path):
+    journal = Journal(str(tmp_path))
+    for i in range(100):
+        journal.record(FILE, f"f{i}.txt")
+
+    with open(tmp_path / JOURNAL_NAME, encoding="utf-8") as f:
+        written = f.read().splitlines()
+
+    # 明示的な flush がなくても一定件数ごとに書き出される
+    assert len(written) >= 100 - 32
+    journal.rollback()
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""プロファイルの継承解決のテスト"""
+
+import json
+import os
+
+import pytest
+
+from autonest.config import ConfigError
+from autonest.profiles import ProfileLibrary
+
+
+@pytest.fixture
+def library(tmp_path):
+    """プロファイルフォルダを作成し、プロファイルを書くヘルパーを返す"""
+    directory = tmp_path / "profiles"
+    directory.mkdir()
+
+    def write_profile(name, profile):
+        path = directory / f"{name}.json"
+        path.write_text(json.dumps(profile, ensure_ascii=False), encoding="utf-8")
+        return str(path)
+
+    return ProfileLibrary(str(directory)), write_profile
+
+
+def test_extends_concatenates_items_and_merges_sections(library):
+    profiles, write_profile = library
+    write_profile(
+        "base",
+        {
+            "default_folders": ["docs"],
+            "default_files": [{"name": "README.md", "template_path": "base.md"}],
+            "window_settings": {"width": 700, "title": "base"},
+        },
+    )
+    write_profile(
+        "unity",
+        {
+            "extends": "base",
+            "description": "Unity",
+            "default_folders": ["Assets"],
+            "default_files": [{"name": "README.md", "template_path": "unity.md"}],
+            "window_settings": {"title": "unity"},
+        },
+    )
+
+    resolved = profiles.resolve("unity")
+
+    assert resolved["default_folders"] == ["docs", "Assets"]
+    assert resolved["window_settings"] == {"width": 700, "title": "unity"}
+    assert "extends" not in resolved and "description" not in resolved
+
+    config = profiles.load("unity", {"default_folders": ["ignored"], "variables": {}})
+    assert config["default_folders"] == ["docs", "Assets"]
+    assert config["variables"] == {}
+    # 同じ name のファイルは継承先が優先され、プロファイルのフォルダ基準で解決される
+    assert [f["template_path"] for f in config["default_files"]] == [
+        os.path.join(profiles.directory, "unity.md")
+    ]
+
+
+def test_multi_level_extends(library):
+    profiles, write_profile = library
+    write_profile("a", {"default_folders": ["a"]})
+    write_profile("b", {"extends": "a", "default_folders": ["b"]})
+    write_profile("c", {"extends": "b", "default_folders": ["c"]})
+
+    assert profiles.resolve("c")["default_folders"] == ["a", "b", "c"]
+
+
+def test_resolve_reflects_changes_to_parent(library):
+    profiles, write_profile = library
+    write_profile("base", {"default_folders": ["old"]})
+    write_profile("child", {"extends": "base"})
+    assert profiles.resolve("child")["default_folders"] == ["old"]
+
+    path = write_profile("base", {"default_folders": ["new", "folder"]})
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert profiles.resolve("child")["default_folders"] == ["new", "folder"]
+
+
+def test_extends_cycle_is_rejected(library):
+    profiles, write_profile = library
+    write_profile("a", {"extends": "b"})
+    write_profile("b", {"extends": "a"})
+
+    with pytest.raises(ConfigError) as excinfo:
+        profiles.resolve("a")
+    assert "循環" in excinfo.value.errors[0]
+
+
+def test_missing_parent_is_rejected(library):
+    profiles, write_profile = library
+    write_profile("child", {"extends": "nothing"})
+
+    with pytest.raises(ConfigError) as excinfo:
+        profiles.resolve("child")
+    assert "nothing" in excinfo.value.errors[0]
+
+
+def test_invalid_profile_is_rejected(library):
+    profiles, write_profile = library
+    write_profile("bad", {"default_folders": "not a list"})
+
+    with pytest.raises(ConfigError):
+        profiles.resolve("bad")
+
+
+def test_build_index_lists_profiles_with_descriptions(library):
+    profiles, write_profile = library
+    write_profile("web", {"description": "Web"})
+    write_profile("api", {"extends": "web"})
+
+    profiles.build_index()
+
+    listed = [(p.name, p.description) for p in profiles.list_profiles()]
+    assert listed == [("api", ""), ("web", "Web")]
+    assert os.path.exists(profiles.index_path)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""既存の作成先とテンプレートの検証のテスト"""
+
+import os
+
+from autonest.engine import FolderCreator
+from autonest.verify import DIFFERS, IDENTICAL, MISSING
+
+
+def _verify(target, folders, files):
+    creator = FolderCreator()
+    plan = creator.plan(str(target), folders, files)
+    return creator.verify(plan)
+
+
+def test_verify_reports_identical_differs_and_missing(scaffold):
+    _, target, write_template = scaffold
+    files = [
+        ("same.txt", {"template_path": write_template("same.txt", "same")}),
+        ("changed.txt", {"template_path": write_template("changed.txt", "new")}),
+        ("missing.txt", {"template_path": write_template("missing.txt", "x")}),
+    ]
+    (target / "same.txt").write_text("same", encoding="utf-8")
+    (target / "changed.txt").write_text("old", encoding="utf-8")
+    (target / "present").mkdir()
+
+    result = _verify(target, ["present", "absent"], files)
+
+    statuses = dict(result.entries)
+    assert statuses == {
+        "present": IDENTICAL,
+        "absent": MISSING,
+        "same.txt": IDENTICAL,
+        "changed.txt": DIFFERS,
+        "missing.txt": MISSING,
+    }
+    assert not result.ok
+    assert result.errors == []
+
+
+def test_verify_detects_same_size_edit(scaffold):
+    _, target, write_template = scaffold
+    template = write_template("a.txt", "aaaa")
+    (target / "a.txt").write_text("aaaa", encoding="utf-8")
+    stat = os.stat(template)
+    os.utime(target / "a.txt", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    files = [("a.txt", {"template_path": template})]
+    assert _verify(target, [], files).ok
+
+    (target / "a.txt").write_text("bbbb", encoding="utf-8")
+
+    assert dict(_verify(target, [], files).entries) == {"a.txt": DIFFERS}
+
+
+def test_verify_after_creation_is_ok(scaffold):
+    _, target, write_template = scaffold
+    files = [
+        ("a.txt", {"template_path": write_template("a.txt", "a")}),
+        ("b/c.txt", {"template_path": write_template("c.txt", "c")}),
+    ]
+    FolderCreator().execute(str(target), ["d"], files)
+
+    result = _verify(target, ["d"], files)
+
+    assert result.ok
+    assert sorted(result.identical) == ["a.txt", "b/c.txt", "d"]
+
+
+def test_verify_does_not_modify_target(scaffold):
+    _, target, write_template = scaffold
+    files = [("a.txt", {"template_path": write_template("a.txt", "a")})]
+
+    result = _verify(target, ["folder"], files)
+
+    assert result.missing == ["folder", "a.txt"]
+    assert os.listdir(target) == []